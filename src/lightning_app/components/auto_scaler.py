@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import os
+import random
 import secrets
 import time
 import uuid
+from abc import ABC, abstractmethod
 from base64 import b64encode
-from itertools import cycle
-from typing import Any, Dict, List, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -54,12 +55,88 @@ def _raise_granular_exception(exception: Exception) -> None:
     raise HTTPException(500, exception.args[0]) from exception
 
 
+class _ServerStats(BaseModel):
+    num_in_flight: int = 0
+    num_batches: int = 0
+    num_errors: int = 0
+    # exponentially weighted moving average of the latency of the batches, in seconds
+    latency: Optional[float] = None
+
+
 class _SysInfo(BaseModel):
     num_workers: int
     servers: List[str]
     num_requests: int
     processing_time: int
     global_request_count: int
+    servers_stats: Dict[str, _ServerStats] = {}
+
+
+class _Router(ABC):
+    """Picks the server a batch is sent to, given the stats of the servers."""
+
+    @abstractmethod
+    def select(self, servers: List[str], stats: Dict[str, _ServerStats]) -> str:
+        pass
+
+    @staticmethod
+    def _min(servers: List[str], key: Callable[[str], float]) -> str:
+        """Returns the server with the lowest key, picking one at random on ties to spread the load."""
+        keys = [key(server) for server in servers]
+        min_key = min(keys)
+        return random.choice([server for server, k in zip(servers, keys) if k == min_key])
+
+
+class _RoundRobinRouter(_Router):
+    def __init__(self) -> None:
+        self._index = -1
+
+    def select(self, servers: List[str], stats: Dict[str, _ServerStats]) -> str:
+        self._index = (self._index + 1) % len(servers)
+        return servers[self._index]
+
+
+class _LeastOutstandingRouter(_Router):
+    """Picks the server with the least batches in flight."""
+
+    def select(self, servers: List[str], stats: Dict[str, _ServerStats]) -> str:
+        return self._min(servers, key=lambda server: stats[server].num_in_flight)
+
+
+class _EWMALatencyRouter(_Router):
+    """Picks the server with the lowest expected latency, estimated from its average latency and its batches in
+    flight.
+
+    The servers without any batch answered yet are sent a single batch at a time, until they answer it.
+    """
+
+    def select(self, servers: List[str], stats: Dict[str, _ServerStats]) -> str:
+        return self._min(servers, key=lambda server: self._expected_latency(stats[server]))
+
+    @staticmethod
+    def _expected_latency(stats: _ServerStats) -> float:
+        if stats.latency is None:
+            return 0.0 if stats.num_in_flight == 0 else float("inf")
+        return stats.latency * (stats.num_in_flight + 1)
+
+
+class _PowerOfTwoChoicesRouter(_Router):
+    """Picks the server with the least batches in flight among two servers drawn at random."""
+
+    def select(self, servers: List[str], stats: Dict[str, _ServerStats]) -> str:
+        candidates = random.sample(servers, min(2, len(servers)))
+        return self._min(candidates, key=lambda server: stats[server].num_in_flight)
+
+
+_ROUTERS = {
+    "round_robin": _RoundRobinRouter,
+    "least_outstanding": _LeastOutstandingRouter,
+    "ewma_latency": _EWMALatencyRouter,
+    "power_of_two": _PowerOfTwoChoicesRouter,
+}
+
+# weight of the latest batch in the moving average of the latency of a server
+_LATENCY_EWMA_ALPHA = 0.3
 
 
 class _BatchRequestModel(BaseModel):
@@ -94,7 +171,7 @@ def _create_fastapi(title: str) -> FastAPI:
 
 class _LoadBalancer(LightningWork):
     r"""The LoadBalancer is a LightningWork component that collects the requests and sends them to the prediciton API
-    asynchronously using RoundRobin scheduling. It also performs auto batching of the incoming requests.
+    asynchronously using RoundRobin scheduling by default. It also performs auto batching of the incoming requests.
 
     The LoadBalancer exposes system endpoints with a basic HTTP authentication, in order to activate the authentication
     you need to provide a system password from environment variable::
@@ -112,6 +189,10 @@ class _LoadBalancer(LightningWork):
             requests to be batched. In any case, requests are processed as soon as `max_batch_size` is reached.
         timeout_keep_alive: The number of seconds until it closes Keep-Alive connections if no new data is received.
         timeout_inference_request: The number of seconds to wait for inference.
+        routing: How a server is picked for each batch. One of ``"round_robin"``, ``"least_outstanding"`` (the
+            server with the least batches in flight), ``"ewma_latency"`` (the server with the lowest moving average
+            of its latency, weighted by its batches in flight) or ``"power_of_two"`` (the least busy of two servers
+            drawn at random).
         \**kwargs: Arguments passed to :func:`LightningWork.init` like ``CloudCompute``, ``BuildConfig``, etc.
     """
 
@@ -125,9 +206,12 @@ class _LoadBalancer(LightningWork):
         timeout_batching: int = 1,
         timeout_keep_alive: int = 60,
         timeout_inference_request: int = 60,
+        routing: str = "round_robin",
         **kwargs: Any,
     ) -> None:
         super().__init__(cloud_compute=CloudCompute("default"), **kwargs)
+        if routing not in _ROUTERS:
+            raise ValueError(f"The routing should be one of {list(_ROUTERS)}. Found {routing}.")
         self._input_type = input_type
         self._output_type = output_type
         self._timeout_keep_alive = timeout_keep_alive
@@ -135,9 +219,13 @@ class _LoadBalancer(LightningWork):
         self.servers = []
         self.max_batch_size = max_batch_size
         self.timeout_batching = timeout_batching
-        self._iter = None
+        self.routing = routing
+        self._router: _Router = _ROUTERS[routing]()
+        self._servers_stats: Dict[str, _ServerStats] = {}
         self._batch = []
-        self._responses = {}  # {request_id: response}
+        self._futures: Dict[str, asyncio.Future] = {}  # {request_id: future of the response}
+        self._has_requests: Optional[asyncio.Event] = None
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}  # {server: session}
         self._last_batch_sent = 0
 
         if not endpoint.startswith("/"):
@@ -145,39 +233,116 @@ class _LoadBalancer(LightningWork):
 
         self.endpoint = endpoint
 
+    def _get_session(self, server: str) -> aiohttp.ClientSession:
+        """Returns the session of a server, whose connections are kept alive and reused across the batches."""
+        session = self._sessions.get(server)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers={"accept": "application/json", "Content-Type": "application/json"},
+            )
+            self._sessions[server] = session
+        return session
+
+    async def close_sessions(self) -> None:
+        """Closes the sessions of all the servers."""
+        for server in list(self._sessions):
+            await self._sessions.pop(server).close()
+
+    async def _close_session(self, server: str) -> None:
+        session = self._sessions.pop(server, None)
+        if session is not None:
+            await session.close()
+
+    async def _set_servers(self, servers: List[str]) -> None:
+        """Replaces the servers the batches are sent to.
+
+        The removed servers aren't sent new batches, but their sessions are only closed once the batches in flight to
+        them are answered.
+        """
+        async with lock:
+            self.servers = servers
+
+        removed_stats = {server: stats for server, stats in self._servers_stats.items() if server not in servers}
+        self._servers_stats = {server: self._servers_stats.get(server, _ServerStats()) for server in servers}
+        for server in list(self._sessions):
+            if server not in servers and (server not in removed_stats or removed_stats[server].num_in_flight == 0):
+                await self._close_session(server)
+
+    def _select_server(self) -> str:
+        for server in self.servers:
+            if server not in self._servers_stats:
+                self._servers_stats[server] = _ServerStats()
+        return self._router.select(self.servers, self._servers_stats)
+
+    def _update_latency(self, stats: _ServerStats, latency: float) -> None:
+        if stats.latency is None:
+            stats.latency = latency
+        else:
+            stats.latency = _LATENCY_EWMA_ALPHA * latency + (1 - _LATENCY_EWMA_ALPHA) * stats.latency
+
     async def send_batch(self, batch: List[Tuple[str, _BatchRequestModel]]):
-        server = next(self._iter)  # round-robin
+        server = self._select_server()
+        stats = self._servers_stats[server]
+        stats.num_in_flight += 1
+        start_time = time.time()
         request_data: List[_LoadBalancer._input_type] = [b[1] for b in batch]
         batch_request_data = _BatchRequestModel(inputs=request_data)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/json",
-                }
-                async with session.post(
-                    f"{server}{self.endpoint}",
-                    json=batch_request_data.dict(),
-                    timeout=self._timeout_inference_request,
-                    headers=headers,
-                ) as response:
-                    if response.status == 408:
-                        raise HTTPException(408, "Request timed out")
-                    response.raise_for_status()
-                    response = await response.json()
-                    outputs = response["outputs"]
-                    if len(batch) != len(outputs):
-                        raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
-                    result = {request[0]: r for request, r in zip(batch, outputs)}
-                    self._responses.update(result)
+            async with self._get_session(server).post(
+                f"{server}{self.endpoint}",
+                json=batch_request_data.dict(),
+                timeout=self._timeout_inference_request,
+            ) as response:
+                if response.status == 408:
+                    raise HTTPException(408, "Request timed out")
+                response.raise_for_status()
+                response = await response.json()
+                outputs = response["outputs"]
+                if len(batch) != len(outputs):
+                    raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
+                for request, output in zip(batch, outputs):
+                    future = self._futures.pop(request[0], None)
+                    # the request was cancelled if its client went away
+                    if future is not None and not future.done():
+                        future.set_result(output)
+            self._update_latency(stats, time.time() - start_time)
         except Exception as ex:
-            result = {request[0]: ex for request in batch}
-            self._responses.update(result)
+            stats.num_errors += 1
+            for request in batch:
+                future = self._futures.pop(request[0], None)
+                if future is not None and not future.done():
+                    future.set_exception(ex)
+        finally:
+            stats.num_in_flight -= 1
+            stats.num_batches += 1
+            if server not in self.servers and stats.num_in_flight == 0:
+                # the server was removed while the batch was in flight
+                await self._close_session(server)
+
+    async def _wait_for_batch(self) -> None:
+        """Waits until a batch is full, or until ``timeout_batching`` seconds passed since the previous batch was
+        sent while there are requests waiting."""
+        while not self._batch:
+            self._has_requests.clear()
+            await self._has_requests.wait()
+
+        while len(self._batch) < self.max_batch_size:
+            timeout = self._last_batch_sent + self.timeout_batching - time.time()
+            if timeout < 0:
+                return
+            self._has_requests.clear()
+            try:
+                await asyncio.wait_for(self._has_requests.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
 
     async def consumer(self):
+        if self._has_requests is None:
+            self._has_requests = asyncio.Event()
+
         while True:
-            await asyncio.sleep(0.05)
+            await self._wait_for_batch()
 
             batch = self._batch[: self.max_batch_size]
             while batch and (
@@ -195,22 +360,22 @@ class _LoadBalancer(LightningWork):
 
         request_id = uuid.uuid4().hex
         request: Tuple = (request_id, data)
+        future = asyncio.get_running_loop().create_future()
+        self._futures[request_id] = future
         self._batch.append(request)
+        if self._has_requests is not None:
+            # wakes up the consumer
+            self._has_requests.set()
 
-        while True:
-            await asyncio.sleep(0.05)
-
-            if request_id in self._responses:
-                result = self._responses[request_id]
-                del self._responses[request_id]
-                _raise_granular_exception(result)
-                return result
+        try:
+            return await future
+        except Exception as ex:
+            _raise_granular_exception(ex)
 
     def run(self):
 
         logger.info(f"servers: {self.servers}")
 
-        self._iter = cycle(self.servers)
         self._last_batch_sent = time.time()
 
         fastapi_app = _create_fastapi("Load Balancer")
@@ -235,8 +400,9 @@ class _LoadBalancer(LightningWork):
             fastapi_app.SEND_TASK = asyncio.create_task(self.consumer())
 
         @fastapi_app.on_event("shutdown")
-        def shutdown_event():
+        async def shutdown_event():
             fastapi_app.SEND_TASK.cancel()
+            await self.close_sessions()
 
         def authenticate_private_endpoint(credentials: HTTPBasicCredentials = Depends(security)):
             AUTO_SCALER_AUTH_PASSWORD = os.environ.get("AUTO_SCALER_AUTH_PASSWORD", "")
@@ -265,14 +431,12 @@ class _LoadBalancer(LightningWork):
                 num_requests=fastapi_app.num_current_requests,
                 processing_time=fastapi_app.last_processing_time,
                 global_request_count=fastapi_app.global_request_count,
+                servers_stats=self._servers_stats,
             )
 
         @fastapi_app.put("/system/update-servers")
         async def update_servers(servers: List[str], authenticated: bool = Depends(authenticate_private_endpoint)):
-            async with lock:
-                self.servers = servers
-
-            self._iter = cycle(self.servers)
+            await self._set_servers(servers)
 
         @fastapi_app.post(self.endpoint, response_model=self._output_type)
         async def balance_api(inputs: self._input_type):
@@ -309,6 +473,20 @@ class _LoadBalancer(LightningWork):
         self.send_request_to_update_servers(server_urls)
 
     def send_request_to_update_servers(self, servers: List[str]):
+        response = requests.put(
+            f"{self.url}/system/update-servers", json=servers, headers=self._get_auth_headers(), timeout=10
+        )
+        response.raise_for_status()
+
+    def get_servers_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Fetches the number of batches in flight, the number of batches and errors and the moving average of the
+        latency of each server."""
+        response = requests.get(f"{self.url}/system/info", headers=self._get_auth_headers(), timeout=10)
+        response.raise_for_status()
+        return response.json()["servers_stats"]
+
+    @staticmethod
+    def _get_auth_headers() -> Dict[str, str]:
         AUTHORIZATION_TYPE = "Basic"
         USERNAME = "lightning"
         AUTO_SCALER_AUTH_PASSWORD = os.environ.get("AUTO_SCALER_AUTH_PASSWORD", "")
@@ -322,13 +500,11 @@ class _LoadBalancer(LightningWork):
                 detail="Invalid authentication credentials",
                 headers={"WWW-Authenticate": "Basic"},
             ) from e
-        headers = {
+        return {
             "accept": "application/json",
             "username": USERNAME,
             "Authorization": AUTHORIZATION_TYPE + " " + data,
         }
-        response = requests.put(f"{self.url}/system/update-servers", json=servers, headers=headers, timeout=10)
-        response.raise_for_status()
 
 
 class AutoScaler(LightningFlow):
@@ -345,6 +521,8 @@ class AutoScaler(LightningFlow):
         timeout_batching: (auto-batching) The number of seconds to wait before sending the requests to process.
         input_type: Input type.
         output_type: Output type.
+        routing: How the batches are distributed across the replicas. One of ``"round_robin"``,
+            ``"least_outstanding"``, ``"ewma_latency"`` or ``"power_of_two"``.
 
     .. testcode::
 
@@ -404,6 +582,7 @@ class AutoScaler(LightningFlow):
         input_type: BaseModel = Dict,
         output_type: BaseModel = Dict,
         *work_args: Any,
+        routing: str = "round_robin",
         **work_kwargs: Any,
     ) -> None:
         super().__init__()
@@ -434,6 +613,7 @@ class AutoScaler(LightningFlow):
             endpoint=endpoint,
             max_batch_size=max_batch_size,
             timeout_batching=timeout_batching,
+            routing=routing,
             cache_calls=True,
             parallel=True,
         )
@@ -496,6 +676,9 @@ class AutoScaler(LightningFlow):
             replicas: The number of running works.
             metrics: ``metrics['pending_requests']`` is the total number of requests that are currently pending.
                 ``metrics['pending_works']`` is the number of pending works.
+                ``metrics['servers_stats']`` maps the URL of each running work to its number of batches in flight
+                (``num_in_flight``), its numbers of batches and errors (``num_batches``, ``num_errors``) and the
+                moving average of its latency in seconds (``latency``, ``None`` until it answers a batch).
 
         Returns:
             The target number of running works. The value will be adjusted after this method runs
@@ -522,6 +705,11 @@ class AutoScaler(LightningFlow):
         """Fetches the number of pending requests via load balancer."""
         return int(requests.get(f"{self.load_balancer.url}/num-requests").json())
 
+    @property
+    def servers_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Fetches the stats of the servers via load balancer."""
+        return self.load_balancer.get_servers_stats()
+
     @property
     def num_pending_works(self) -> int:
         """The number of pending works."""
@@ -537,6 +725,7 @@ class AutoScaler(LightningFlow):
         metrics = {
             "pending_requests": self.num_pending_requests,
             "pending_works": self.num_pending_works,
+            "servers_stats": self.servers_stats,
         }
 
         # ensure min_replicas <= num_replicas <= max_replicas
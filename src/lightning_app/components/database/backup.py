@@ -0,0 +1,172 @@
+"""The incremental backups of the SQLite database of the :class:`~lightning_app.components.database.Database` to a
+:class:`~lightning_app.storage.Drive`.
+
+A backup is a manifest, ``<database>.manifest.json``, listing the digests of the chunks of the database file, and the
+chunks themselves, ``<database>.chunks/<digest>``. Only the chunks which aren't in the Drive yet are uploaded, so the
+pages left unchanged since the previous backup aren't uploaded again. The chunks no longer listed by the manifest are
+deleted once the new manifest is uploaded. The database is restored by concatenating the chunks listed by the
+manifest.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from dataclasses import dataclass
+from time import perf_counter
+from typing import List, Optional
+
+from lightning_app.storage import Drive
+from lightning_app.utilities.app_helpers import Logger
+
+logger = Logger(__name__)
+
+_MANIFEST_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class _BackupStats:
+    """The chunks uploaded by the latest backup, out of the chunks of the database."""
+
+    num_chunks: int = 0
+    num_chunks_uploaded: int = 0
+    bytes_uploaded: int = 0
+    duration: float = 0.0
+
+
+def _chunk_digests(path: str, chunk_size: int) -> List[str]:
+    digests = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digests.append(hashlib.sha256(chunk).hexdigest())
+    return digests
+
+
+class _DatabaseBackup:
+    """Stores the database into the Drive of a component as chunks, and restores it.
+
+    Arguments:
+        db_filename: The path of the SQLite database.
+        component_name: The name of the component owning the Drive.
+        chunk_size: The size in bytes of the chunks of the database file, a multiple of its page size.
+    """
+
+    def __init__(self, db_filename: str, component_name: str, chunk_size: int = _CHUNK_SIZE) -> None:
+        self.db_filename = db_filename
+        self.component_name = component_name
+        self.chunk_size = chunk_size
+        self.stats = _BackupStats()
+        self._name = os.path.basename(db_filename)
+        # the digests of the chunks of the latest backup, read from the Drive on the first backup
+        self._chunks: Optional[List[str]] = None
+
+    @property
+    def manifest_path(self) -> str:
+        return f"{self._name}.manifest.json"
+
+    def chunk_path(self, digest: str) -> str:
+        return f"{self._name}.chunks/{digest}"
+
+    def store(self) -> None:
+        """Uploads the chunks of the database which changed since the previous backup, then the manifest."""
+        t0 = perf_counter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drive = self._drive(tmpdir)
+            if self._chunks is None:
+                self._chunks = self._read_manifest(drive, tmpdir) or []
+
+            # The backup reads a consistent snapshot of the database. With the write-ahead log, the writers aren't
+            # blocked while it is read.
+            snapshot = os.path.join(tmpdir, self._name)
+            source = sqlite3.connect(self.db_filename)
+            dest = sqlite3.connect(snapshot)
+            # the snapshot is discarded if the backup fails, so it doesn't need to be journaled nor synced to the disk
+            dest.execute("PRAGMA journal_mode=OFF")
+            dest.execute("PRAGMA synchronous=OFF")
+            try:
+                source.backup(dest)
+            finally:
+                source.close()
+                dest.close()
+
+            chunks = _chunk_digests(snapshot, self.chunk_size)
+            uploaded = set(self._chunks)
+            stats = _BackupStats(num_chunks=len(chunks))
+            os.makedirs(os.path.join(tmpdir, f"{self._name}.chunks"))
+            new_chunks = []
+            with open(snapshot, "rb") as f:
+                for index, digest in enumerate(chunks):
+                    if digest in uploaded:
+                        continue
+                    f.seek(index * self.chunk_size)
+                    data = f.read(self.chunk_size)
+                    with open(os.path.join(tmpdir, self.chunk_path(digest)), "wb") as chunk:
+                        chunk.write(data)
+                    new_chunks.append(self.chunk_path(digest))
+                    uploaded.add(digest)
+                    stats.bytes_uploaded += len(data)
+            drive.put_many(new_chunks)
+            stats.num_chunks_uploaded = len(new_chunks)
+
+            # the manifest is uploaded last, so that it only lists chunks which are in the Drive
+            with open(os.path.join(tmpdir, self.manifest_path), "w") as f:
+                json.dump({"version": _MANIFEST_VERSION, "chunk_size": self.chunk_size, "chunks": chunks}, f)
+            drive.put(self.manifest_path)
+
+            for digest in set(self._chunks) - set(chunks):
+                drive.delete(self.chunk_path(digest))
+            self._chunks = chunks
+
+        stats.duration = perf_counter() - t0
+        self.stats = stats
+        logger.debug(
+            f"Uploaded {stats.num_chunks_uploaded} of the {stats.num_chunks} chunks of the database"
+            f" ({stats.bytes_uploaded} bytes) in {stats.duration:.3f}s."
+        )
+
+    def restore(self) -> bool:
+        """Rebuilds the database from the chunks listed by the manifest.
+
+        Returns whether the database was restored, ``False`` when the Drive doesn't hold any backup.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drive = self._drive(tmpdir)
+            chunks = self._read_manifest(drive, tmpdir)
+            if chunks is None:
+                return False
+            os.makedirs(os.path.join(tmpdir, f"{self._name}.chunks"))
+            drive.get_many(
+                [self.chunk_path(digest) for digest in set(chunks)], component_name=self.component_name, overwrite=True
+            )
+
+            tmp_db_filename = f"{self.db_filename}.tmp"
+            with open(tmp_db_filename, "wb") as f:
+                for digest in chunks:
+                    with open(os.path.join(tmpdir, self.chunk_path(digest)), "rb") as chunk:
+                        f.write(chunk.read())
+            # the write-ahead log of a previous database would be applied to the restored one
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(self.db_filename + suffix):
+                    os.remove(self.db_filename + suffix)
+            os.replace(tmp_db_filename, self.db_filename)
+        self._chunks = chunks
+        return True
+
+    def _read_manifest(self, drive: Drive, tmpdir: str) -> Optional[List[str]]:
+        if self.manifest_path not in drive.list(component_name=self.component_name):
+            return None
+        drive.get(self.manifest_path, component_name=self.component_name, overwrite=True)
+        with open(os.path.join(tmpdir, self.manifest_path)) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return None
+        # the database is split as it was by the previous backups, so that their chunks are reused
+        self.chunk_size = manifest["chunk_size"]
+        return manifest["chunks"]
+
+    def _drive(self, root_folder: str) -> Drive:
+        # the databases of other components can have chunks with the same content
+        return Drive(
+            "lit://database", allow_duplicates=True, component_name=self.component_name, root_folder=root_folder
+        )
@@ -5,10 +5,14 @@ from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from lightning_app.components.database.utilities import _GeneralModel
+from lightning_app.components.database.utilities import _BulkModel, _GeneralModel, _SelectModel
 
 _CONNECTION_RETRY_TOTAL = 5
 _CONNECTION_RETRY_BACKOFF_FACTOR = 1
+# The connections kept alive to the database server, to be reused by the threads sharing a client.
+_CONNECTION_POOL_SIZE = 16
+# The amount of rows sent by request by the bulk methods.
+_BATCH_SIZE = 1000
 
 
 def _configure_session() -> Session:
@@ -22,7 +26,9 @@ def _configure_session() -> Session:
         backoff_factor=_CONNECTION_RETRY_BACKOFF_FACTOR,
         status_forcelist=[429, 500, 502, 503, 504],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        pool_connections=_CONNECTION_POOL_SIZE, pool_maxsize=_CONNECTION_POOL_SIZE, max_retries=retry_strategy
+    )
     http = requests.Session()
     http.mount("https://", adapter)
     http.mount("http://", adapter)
@@ -47,6 +53,27 @@ class DatabaseClient:
         assert resp.status_code == 200
         return [cls(**data) for data in resp.json()]
 
+    def select(
+        self,
+        model: Optional[Type[T]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[T]:
+        """Returns the rows ordered by primary key, filtered and paginated on the server.
+
+        Arguments:
+            model: The model of the rows, the model of the client by default.
+            where: The values of the selected rows by column name. A list matches any of its values.
+            limit: The maximum amount of rows returned.
+            offset: The amount of rows skipped.
+        """
+        cls = model if model else self.model
+        request = _SelectModel(cls_name=cls.__name__, token=self.token, where=where or {}, limit=limit, offset=offset)
+        resp = self.session.post(self.db_url + "/select/", data=request.json())
+        assert resp.status_code == 200, resp.text
+        return [cls(**data) for data in resp.json()]
+
     def insert(self, model: T) -> None:
         resp = self.session.post(
             self.db_url + "/insert/",
@@ -68,6 +95,28 @@ class DatabaseClient:
         )
         assert resp.status_code == 200
 
+    def insert_many(self, models: List[T], batch_size: int = _BATCH_SIZE) -> None:
+        """Inserts the rows in batches of ``batch_size`` rows, each within a single transaction."""
+        for batch in self._batches(models, batch_size):
+            resp = self.session.post(self.db_url + "/insert_many/", data=_BulkModel.from_objs(batch, self.token).json())
+            assert resp.status_code == 200, resp.text
+
+    def update_many(self, models: List[T], batch_size: int = _BATCH_SIZE) -> None:
+        """Updates the rows in batches of ``batch_size`` rows, each within a single transaction."""
+        for batch in self._batches(models, batch_size):
+            resp = self.session.post(self.db_url + "/update_many/", data=_BulkModel.from_objs(batch, self.token).json())
+            assert resp.status_code == 200, resp.text
+
+    def delete_many(self, models: List[T], batch_size: int = _BATCH_SIZE) -> None:
+        """Deletes the rows in batches of ``batch_size`` rows, each within a single transaction."""
+        for batch in self._batches(models, batch_size):
+            resp = self.session.post(self.db_url + "/delete_many/", data=_BulkModel.from_objs(batch, self.token).json())
+            assert resp.status_code == 200, resp.text
+
+    @staticmethod
+    def _batches(models: List[T], batch_size: int) -> List[List[T]]:
+        return [models[i : i + batch_size] for i in range(0, len(models), batch_size)]
+
     @property
     def session(self):
         if self._session is None:
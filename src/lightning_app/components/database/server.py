@@ -1,8 +1,6 @@
 import asyncio
 import os
-import sqlite3
 import sys
-import tempfile
 import threading
 import traceback
 from typing import List, Optional, Type, Union
@@ -11,7 +9,18 @@ import uvicorn
 from fastapi import FastAPI
 from uvicorn import run
 
-from lightning_app.components.database.utilities import _create_database, _Delete, _Insert, _SelectAll, _Update
+from lightning_app.components.database.backup import _DatabaseBackup
+from lightning_app.components.database.utilities import (
+    _create_database,
+    _Delete,
+    _DeleteMany,
+    _Insert,
+    _InsertMany,
+    _Select,
+    _SelectAll,
+    _Update,
+    _UpdateMany,
+)
 from lightning_app.core.work import LightningWork
 from lightning_app.storage import Drive
 from lightning_app.utilities.imports import _is_sqlmodel_available
@@ -42,6 +51,20 @@ class _DatabaseUvicornServer(uvicorn.Server):
 _lock = threading.Lock()
 
 
+def _create_app(models: List[Type["SQLModel"]], token: Optional[str]) -> FastAPI:
+    app = FastAPI()
+    models = {m.__name__: m for m in models}
+    app.post("/select_all/")(_SelectAll(models, token))
+    app.post("/select/")(_Select(models, token))
+    app.post("/insert/")(_Insert(models, token))
+    app.post("/insert_many/")(_InsertMany(models, token))
+    app.post("/update/")(_Update(models, token))
+    app.post("/update_many/")(_UpdateMany(models, token))
+    app.post("/delete/")(_Delete(models, token))
+    app.post("/delete_many/")(_DeleteMany(models, token))
+    return app
+
+
 class Database(LightningWork):
     def __init__(
         self,
@@ -150,24 +173,18 @@ class Database(LightningWork):
         self._models = models if isinstance(models, list) else [models]
         self._store_thread = None
         self._exit_event = None
+        self._backup = None
 
     def store_database(self):
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_db_filename = os.path.join(tmpdir, os.path.basename(self.db_filename))
-
-                source = sqlite3.connect(self.db_filename)
-                dest = sqlite3.connect(tmp_db_filename)
-
-                source.backup(dest)
-
-                source.close()
-                dest.close()
-
-                drive = Drive("lit://database", component_name=self.name, root_folder=tmpdir)
-                drive.put(os.path.basename(tmp_db_filename))
-
-            print("Stored the database to the Drive.")
+            if self._backup is None:
+                self._backup = _DatabaseBackup(self.db_filename, self.name)
+            self._backup.store()
+            stats = self._backup.stats
+            print(
+                f"Stored the database to the Drive ({stats.num_chunks_uploaded} of {stats.num_chunks} chunks"
+                f" uploaded in {stats.duration:.2f}s)."
+            )
         except Exception:
             print(traceback.print_exc())
 
@@ -182,20 +199,19 @@ class Database(LightningWork):
         Arguments:
             token: Token used to protect the database access. Ensure you don't expose it through the App State.
         """
-        drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
-        filenames = drive.list(component_name=self.name)
-        if self.db_filename in filenames:
-            drive.get(self.db_filename)
+        self._backup = _DatabaseBackup(self.db_filename, self.name)
+        if self._backup.restore():
             print("Retrieved the database from Drive.")
-
-        app = FastAPI()
+        else:
+            # the databases stored as a single file by the previous versions
+            drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
+            filenames = drive.list(component_name=self.name)
+            if self.db_filename in filenames:
+                drive.get(self.db_filename)
+                print("Retrieved the database from Drive.")
 
         _create_database(self.db_filename, self._models, self.debug)
-        models = {m.__name__: m for m in self._models}
-        app.post("/select_all/")(_SelectAll(models, token))
-        app.post("/insert/")(_Insert(models, token))
-        app.post("/update/")(_Update(models, token))
-        app.post("/delete/")(_Delete(models, token))
+        app = _create_app(self._models, token)
 
         sys.modules["uvicorn.main"].Server = _DatabaseUvicornServer
 
@@ -1,23 +1,42 @@
 import functools
 import json
 import pathlib
-from typing import Any, Dict, Generic, List, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
 from fastapi import Response, status
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel, parse_obj_as
+from pydantic import BaseModel, parse_obj_as, validate_model
+from pydantic.json import pydantic_encoder
 from pydantic.main import ModelMetaclass
 
 from lightning_app.utilities.app_helpers import Logger
 from lightning_app.utilities.imports import _is_sqlmodel_available
 
 if _is_sqlmodel_available():
+    from sqlalchemy import delete, event, insert
     from sqlalchemy.inspection import inspect as sqlalchemy_inspect
+    from sqlalchemy.pool import QueuePool
     from sqlmodel import JSON, select, Session, SQLModel, TypeDecorator
 
 logger = Logger(__name__)
 engine = None
 
+# The connections are shared by the threads serving the requests, the bulk requests keep each of them busy longer.
+_POOL_SIZE = 8
+_POOL_MAX_OVERFLOW = 8
+# The SQLite settings applied to every connection. The write-ahead log lets the selects run while rows are written and
+# only syncs the database to the disk at the checkpoints of the log.
+_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    # in KiB when negative
+    "cache_size": -64000,
+    "temp_store": "MEMORY",
+}
+# SQLite limits the amount of parameters of a statement, to 999 before its version 3.32.
+_MAX_PARAMETERS = 500
+
 T = TypeVar("T")
 
 
@@ -150,6 +169,52 @@ class _GeneralModel(BaseModel):
         )
 
 
+class _BulkModel(BaseModel):
+    cls_name: str
+    # the JSON array of the objects
+    data: str
+    token: str
+
+    def convert_to_rows(self, models: Dict[str, BaseModel]) -> List[Dict[str, Any]]:
+        """Returns the validated values of the objects, without the cost of creating the instances of the table."""
+        cls = models[self.cls_name]
+        rows = []
+        for obj in json.loads(self.data):
+            values, _, error = validate_model(cls, obj)
+            if error:
+                raise error
+            rows.append(values)
+        return rows
+
+    @classmethod
+    def from_objs(cls, objs: List[BaseModel], token: str):
+        return cls(
+            **{
+                "cls_name": objs[0].__class__.__name__,
+                "data": json.dumps(objs, default=pydantic_encoder),
+                "token": token,
+            }
+        )
+
+
+class _SelectModel(BaseModel):
+    cls_name: str
+    token: str
+    # the values of the selected rows by column, a list matches any of its values
+    where: Dict[str, Any] = {}
+    limit: Optional[int] = None
+    offset: int = 0
+
+
+def _primary_keys(model_type: Type["SQLModel"], rows: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    primary_key = _get_primary_key(model_type)
+    return {row[primary_key]: row for row in rows}
+
+
+def _chunks(values: List[Any]) -> List[List[Any]]:
+    return [values[i : i + _MAX_PARAMETERS] for i in range(0, len(values), _MAX_PARAMETERS)]
+
+
 class _SelectAll:
     def __init__(self, models, token):
         print(models, token)
@@ -234,12 +299,128 @@ class _Delete:
             session.commit()
 
 
+class _Select:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        request = _SelectModel(**data)
+        cls: Type["SQLModel"] = self.models[request.cls_name]
+        # the rows are read as tuples rather than instances of the table, and ordered by primary key so that the pages
+        # don't overlap
+        table = cls.__table__
+        statement = select(table).order_by(table.columns[_get_primary_key(cls)])
+        for name, value in request.where.items():
+            column = table.columns.get(name)
+            if column is None:
+                response.status_code = status.HTTP_400_BAD_REQUEST
+                return {"status": "failure", "reason": f"The model {cls.__name__} doesn't have a column {name}."}
+            statement = statement.where(column.in_(value) if isinstance(value, list) else column == value)
+        statement = statement.offset(request.offset)
+        if request.limit is not None:
+            statement = statement.limit(request.limit)
+
+        with Session(engine) as session:
+            rows = [dict(row) for row in session.execute(statement).mappings()]
+        return Response(content=json.dumps(rows, default=pydantic_encoder), media_type="application/json")
+
+
+class _InsertMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        rows = _BulkModel(**data).convert_to_rows(self.models)
+        # a single statement executed for all the rows, SQLite generates the primary keys left to `None`
+        with Session(engine) as session:
+            session.execute(insert(cls.__table__), rows)
+            session.commit()
+
+
+class _UpdateMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        update_data = _primary_keys(cls, _BulkModel(**data).convert_to_rows(self.models))
+        primary_key = _get_primary_key(cls)
+        identifier = getattr(cls, primary_key)
+        with Session(engine) as session:
+            results = []
+            for keys in _chunks(list(update_data)):
+                results.extend(session.exec(select(cls).where(identifier.in_(keys))).all())
+            if len(results) != len(update_data):
+                missing = set(update_data) - {getattr(result, primary_key) for result in results}
+                response.status_code = status.HTTP_404_NOT_FOUND
+                return {"status": "failure", "reason": f"The rows {sorted(missing)} weren't found."}
+            for result in results:
+                for k, v in update_data[getattr(result, primary_key)].items():
+                    if k == primary_key:
+                        continue
+                    if getattr(result, k) != v:
+                        setattr(result, k, v)
+            session.add_all(results)
+            session.commit()
+
+
+class _DeleteMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        keys = list(_primary_keys(cls, _BulkModel(**data).convert_to_rows(self.models)))
+        identifier = getattr(cls, _get_primary_key(cls))
+        with Session(engine) as session:
+            for chunk in _chunks(keys):
+                session.execute(delete(cls).where(identifier.in_(chunk)))
+            session.commit()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in _SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
 def _create_database(db_filename: str, models: List[Type["SQLModel"]], echo: bool = False):
     global engine
 
     from sqlmodel import create_engine
 
-    engine = create_engine(f"sqlite:///{pathlib.Path(db_filename).resolve()}", echo=echo)
+    engine = create_engine(
+        f"sqlite:///{pathlib.Path(db_filename).resolve()}",
+        echo=echo,
+        # the requests are served by a pool of threads
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=_POOL_SIZE,
+        max_overflow=_POOL_MAX_OVERFLOW,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
 
     logger.debug(f"Creating the following tables {models}")
     try:
@@ -1,8 +1,10 @@
 import abc
+import asyncio
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import uvicorn
 from fastapi import FastAPI
@@ -68,6 +70,73 @@ class _PyTorchSpawnRunExecutor(WorkRunExecutor):
             state_observer.join(0)
 
 
+class _DynamicBatcher:
+    """Groups the requests into batches of up to ``max_batch_size`` requests, waiting up to ``max_wait_ms``
+    milliseconds after the first request of a batch, and runs them through ``predict_batch`` in a worker thread.
+
+    The requests received while a batch is being processed are queued, and form the next batch.
+    """
+
+    def __init__(self, predict_batch: Callable[[List[Any]], List[Any]], max_batch_size: int, max_wait_ms: float):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="predict")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        self._executor.shutdown(wait=False)
+
+    async def predict(self, request: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        # the requests whose client went away are dropped
+        return [(request, future) for request, future in batch if not future.done()]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+            try:
+                outputs = await loop.run_in_executor(self._executor, self.predict_batch, [r for r, _ in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(f"`predict_batch` returned {len(outputs)} outputs for {len(batch)} requests")
+            except Exception as ex:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(ex)
+                continue
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+
 class _DefaultInputData(BaseModel):
     payload: str
 
@@ -103,6 +172,8 @@ class PythonServer(LightningWork, abc.ABC):
         port: int = 7777,
         input_type: type = _DefaultInputData,
         output_type: type = _DefaultOutputData,
+        max_batch_size: int = 1,
+        max_wait_ms: float = 10,
         **kwargs,
     ):
         """The PythonServer Class enables to easily get your machine learning server up and running.
@@ -138,6 +209,11 @@ class PythonServer(LightningWork, abc.ABC):
                 and this can be accessed as `response.json()["prediction"]` in the client if
                 you are using requests library
 
+            max_batch_size: The maximum number of requests processed at once by `predict_batch`. The requests are
+                processed one by one by `predict` by default.
+            max_wait_ms: The number of milliseconds to wait for more requests after the first request of a batch,
+                when `max_batch_size` is greater than 1.
+
         Example:
 
             >>> from lightning_app.components.serve.python_server import PythonServer
@@ -158,8 +234,12 @@ class PythonServer(LightningWork, abc.ABC):
             raise TypeError("input_type must be a pydantic BaseModel class")
         if not issubclass(output_type, BaseModel):
             raise TypeError("output_type must be a pydantic BaseModel class")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be greater than 0. Found {max_batch_size}")
         self._input_type = input_type
         self._output_type = output_type
+        self._max_batch_size = max_batch_size
+        self._max_wait_ms = max_wait_ms
 
         # Note: Enable to run inference on GPUs.
         self._run_executor_cls = (
@@ -190,6 +270,14 @@ class PythonServer(LightningWork, abc.ABC):
         """
         pass
 
+    def predict_batch(self, requests: List[Any]) -> List[Any]:
+        """This method is called with a batch of requests when ``max_batch_size`` is greater than 1.
+
+        It must return one output per request, in the same order. Override it to run the model on the whole batch at
+        once. By default, the requests are passed one by one to ``predict``.
+        """
+        return [self.predict(request) for request in requests]
+
     @staticmethod
     def _get_sample_dict_from_datatype(datatype: Any) -> dict:
         if hasattr(datatype, "_get_sample_data"):
@@ -216,11 +304,28 @@ class PythonServer(LightningWork, abc.ABC):
         input_type: type = self.configure_input_type()
         output_type: type = self.configure_output_type()
 
-        def predict_fn(request: input_type):  # type: ignore
+        if self._max_batch_size == 1:
+
+            def predict_fn(request: input_type):  # type: ignore
+                with inference_mode():
+                    return self.predict(request)
+
+            fastapi_app.post("/predict", response_model=output_type)(predict_fn)
+            return
+
+        def predict_batch_fn(requests: List[Any]) -> List[Any]:
+            # the inference mode is local to the thread running the batches
             with inference_mode():
-                return self.predict(request)
+                return self.predict_batch(requests)
+
+        batcher = _DynamicBatcher(predict_batch_fn, self._max_batch_size, self._max_wait_ms)
+        fastapi_app.on_event("startup")(batcher.start)
+        fastapi_app.on_event("shutdown")(batcher.stop)
+
+        async def batched_predict_fn(request: input_type):  # type: ignore
+            return await batcher.predict(request)
 
-        fastapi_app.post("/predict", response_model=output_type)(predict_fn)
+        fastapi_app.post("/predict", response_model=output_type)(batched_predict_fn)
 
     def _attach_frontend(self, fastapi_app: FastAPI) -> None:
         from lightning_api_access import APIAccessFrontend
@@ -8,7 +8,7 @@ from multiprocessing import Queue
 from tempfile import TemporaryDirectory
 from threading import Event, Lock, Thread
 from time import sleep
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 import uvicorn
 from deepdiff import DeepDiff, Delta
@@ -38,6 +38,7 @@ from lightning_app.utilities.cloud import is_running_in_cloud
 from lightning_app.utilities.component import _context
 from lightning_app.utilities.enum import ComponentContext, OpenAPITags
 from lightning_app.utilities.imports import _is_starsessions_available
+from lightning_app.utilities.json_patch import _escape
 
 if _is_starsessions_available():
     from starsessions import SessionMiddleware
@@ -171,10 +172,17 @@ if _is_starsessions_available():
 @fastapi_service.get("/api/v1/state", response_class=JSONResponse)
 async def get_state(
     response: Response,
+    component: Optional[str] = None,
     x_lightning_type: Optional[str] = Header(None),
     x_lightning_session_uuid: Optional[str] = Header(None),
     x_lightning_session_id: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
 ) -> Mapping:
+    """Returns the app state, or the state of the given component, e.g. ``root.flow.work``.
+
+    The response carries the version of the app state as its ``ETag``. When the client sends it back with
+    ``If-None-Match`` and the requested state didn't change since this version, the state isn't sent again.
+    """
     if x_lightning_session_uuid is None:
         raise Exception("Missing X-Lightning-Session-UUID header")
     if x_lightning_session_id is None:
@@ -187,10 +195,77 @@ async def get_state(
     with lock:
         x_lightning_session_uuid = TEST_SESSION_UUID
         state = global_app_state_store.get_app_state(x_lightning_session_uuid)
-        global_app_state_store.set_served_state(x_lightning_session_uuid, state)
+        keys: Tuple[str, ...] = ()
+        if component is None:
+            global_app_state_store.set_served_state(x_lightning_session_uuid, state)
+        else:
+            keys = _component_state_keys(state, component)
+            if keys is None:
+                response.status_code = status.HTTP_404_NOT_FOUND
+                return {"status": "failure", "reason": f"The component {component} wasn't found."}
+
+        version = global_app_state_store.get_version(x_lightning_session_uuid)
+        etag = f'"{version}"'
+        since_version = _parse_etag(if_none_match)
+        if since_version is not None:
+            patch = global_app_state_store.get_patches(x_lightning_session_uuid, since_version)
+            if patch is not None and not _is_modified(patch, "".join(f"/{_escape(key)}" for key in keys)):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        for key in keys:
+            state = state[key]
         return state
 
 
+def _component_state_keys(state: Mapping, component_name: str) -> Optional[Tuple[str, ...]]:
+    """Returns the keys leading to the state of the component within the app state, or None if it isn't found."""
+    names = component_name.split(".")
+    if names[0] != "root":
+        return None
+    keys: Tuple[str, ...] = ()
+    for name in names[1:]:
+        for kind in ("flows", "works", "structures"):
+            if name in state.get(kind, {}):
+                state = state[kind][name]
+                keys += (kind, name)
+                break
+        else:
+            return None
+    return keys
+
+
+def _parse_etag(if_none_match: Optional[str]) -> Optional[int]:
+    """Returns the version of the app state held by the client, from the ETag it sent back."""
+    if if_none_match is None:
+        return None
+    etag = if_none_match.split(",")[0].strip()
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    etag = etag.strip('"')
+    return int(etag) if etag.isdigit() else None
+
+
+def _is_modified(patch: List[Dict], pointer: str) -> bool:
+    """Returns whether the JSON patch modifies the value at the JSON pointer, or any value under it."""
+    # an operation on a parent of the value, including the whole document, modifies it too
+    return any(
+        operation["path"].startswith(pointer + "/") or (pointer + "/").startswith(operation["path"] + "/")
+        for operation in patch
+    )
+
+
+def _rebase_delta(delta: Dict, keys: Tuple[str, ...]) -> Dict:
+    """Returns the delta of the state of a component, as computed by DeepDiff, as a delta of the app state."""
+    prefix = "root" + "".join(f"['{key}']" for key in keys)
+    return {
+        report: {prefix + path[len("root") :]: value for path, value in changes.items()}
+        if isinstance(changes, dict)
+        else changes
+        for report, changes in delta.items()
+    }
+
+
 def _get_component_by_name(component_name: str, state):
     child = state
     for child_name in component_name.split(".")[1:]:
@@ -241,12 +316,16 @@ async def get_spec(
 async def post_delta(
     request: Request,
     response: Response,
+    component: Optional[str] = None,
     x_lightning_type: Optional[str] = Header(None),
     x_lightning_session_uuid: Optional[str] = Header(None),
     x_lightning_session_id: Optional[str] = Header(None),
 ) -> Optional[Dict]:
     """This endpoint is used to make an update to the app state using delta diff, mainly used by streamlit to
-    update the state."""
+    update the state.
+
+    When a component is given, e.g. ``root.flow.work``, the delta is a delta of the state of this component.
+    """
 
     if x_lightning_session_uuid is None:
         raise Exception("Missing X-Lightning-Session-UUID header")
@@ -258,7 +337,15 @@ async def post_delta(
         return {"status": "failure", "reason": "This endpoint is disabled."}
 
     body: Dict = await request.json()
-    api_app_delta_queue.put(_DeltaRequest(delta=Delta(body["delta"])))
+    delta = body["delta"]
+    if component is not None:
+        with lock:
+            keys = _component_state_keys(global_app_state_store.get_app_state(TEST_SESSION_UUID), component)
+        if keys is None:
+            response.status_code = status.HTTP_404_NOT_FOUND
+            return {"status": "failure", "reason": f"The component {component} wasn't found."}
+        delta = _rebase_delta(delta, keys)
+    api_app_delta_queue.put(_DeltaRequest(delta=Delta(delta)))
 
 
 @fastapi_service.post("/api/v1/state")
@@ -354,9 +441,14 @@ async def websocket_endpoint(websocket: WebSocket):
     if not ENABLE_STATE_WEBSOCKET:
         await websocket.close()
         return
+    # the updates are sent until the client disconnects, which is only noticed when receiving from the websocket
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(websocket))
     try:
+        if websocket.query_params.get("mode") == "json-patch":
+            await _stream_state_patches(websocket, disconnected)
+            return
         counter = global_app_state_store.counter
-        while True:
+        while not disconnected.done():
             if global_app_state_store.counter != counter:
                 await websocket.send_text(f"{global_app_state_store.counter}")
                 counter = global_app_state_store.counter
@@ -364,7 +456,45 @@ async def websocket_endpoint(websocket: WebSocket):
             await asyncio.sleep(0.01)
     except ConnectionClosed:
         logger.debug("Websocket connection closed")
-    await websocket.close()
+        await websocket.close()
+    finally:
+        disconnected.cancel()
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+async def _stream_state_patches(websocket: WebSocket, disconnected: asyncio.Future) -> None:
+    """Pushes the changes of the app state as JSON patches, instead of the counter of the updates.
+
+    The client passes the version of the state it holds with the ``version`` query parameter when reconnecting. It
+    receives a ``snapshot`` message with the full state when it doesn't hold any or when the patches from its version
+    aren't kept anymore, then a ``patch`` message for each new version of the state.
+    """
+    version = websocket.query_params.get("version")
+    version = int(version) if version is not None and version.isdigit() else None
+    while not disconnected.done():
+        with lock:
+            current_version = global_app_state_store.get_version(TEST_SESSION_UUID)
+            if version == current_version:
+                message = None
+            else:
+                patch = None
+                if version is not None:
+                    patch = global_app_state_store.get_patches(TEST_SESSION_UUID, version)
+                if patch is None:
+                    state = global_app_state_store.get_app_state(TEST_SESSION_UUID)
+                    message = {"type": "snapshot", "version": current_version, "state": state}
+                else:
+                    message = {"type": "patch", "version": current_version, "patch": patch}
+        if message is not None:
+            # the state is serialized outside the lock, the store only replaces it and never mutates it
+            await websocket.send_json(message)
+            version = current_version
+            logger.debug(f"Sent the {message['type']} of the version {version} of the state.")
+        await asyncio.sleep(0.01)
 
 
 async def api_catch_all(request: Request, full_path: str):
@@ -1,6 +1,5 @@
 import logging
 import os
-import pickle
 import queue
 import threading
 import warnings
@@ -9,22 +8,26 @@ from time import time
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 from deepdiff import DeepDiff, Delta
-from lightning_utilities.core.apply_func import apply_to_collection
 
 import lightning_app
 from lightning_app import _console
 from lightning_app.api.request_types import _APIRequest, _CommandRequest, _DeltaRequest
 from lightning_app.core.constants import (
+    CHECKPOINT_MAX_SNAPSHOTS,
+    CHECKPOINT_SNAPSHOT_INTERVAL,
     DEBUG_ENABLED,
+    DELTA_QUEUE_BATCH_SIZE,
     FLOW_DURATION_SAMPLES,
     FLOW_DURATION_THRESHOLD,
     FRONTEND_DIR,
+    LOOP_IDLE_WAIT,
+    LOOP_WAKEUPS_MONITOR_INTERVAL,
     STATE_ACCUMULATE_WAIT,
 )
 from lightning_app.core.queues import BaseQueue, SingleProcessQueue
 from lightning_app.core.work import LightningWork
 from lightning_app.frontend import Frontend
-from lightning_app.storage import Drive, Path, Payload
+from lightning_app.storage import Path, Payload
 from lightning_app.storage.path import _storage_root_dir
 from lightning_app.utilities import frontend
 from lightning_app.utilities.app_helpers import (
@@ -35,8 +38,10 @@ from lightning_app.utilities.app_helpers import (
     _should_dispatch_app,
     Logger,
 )
+from lightning_app.utilities.checkpoint import _CheckpointLog, _load_checkpoint
 from lightning_app.utilities.commands.base import _process_requests
 from lightning_app.utilities.component import _convert_paths_after_init, _validate_root_flow
+from lightning_app.utilities.delta_engine import _component_state_path, _DeltaEngine
 from lightning_app.utilities.enum import AppStage, CacheCallsKeys
 from lightning_app.utilities.exceptions import CacheMissException, ExitAppException
 from lightning_app.utilities.layout import _collect_layout
@@ -150,6 +155,7 @@ class LightningApp:
         # we will need to revisit the logic at _should_snapshot, since right now
         # we are writing checkpoints too often, and this is expensive.
         self.checkpointing: bool = False
+        self._checkpoint_log: Optional[_CheckpointLog] = None
 
         self._update_layout()
 
@@ -158,6 +164,14 @@ class LightningApp:
         self._original_state = None
         self._last_state = self.state
         self.state_accumulate_wait = STATE_ACCUMULATE_WAIT
+        self.idle_wait = LOOP_IDLE_WAIT
+        self._delta_engine = _DeltaEngine(self)
+        # Whether nothing changed during the last loop iteration, in which case the app waits for a delta.
+        self._is_idle = False
+
+        self._num_wakeups = 0
+        self._wakeups_t0 = time()
+        self._wakeups_per_second = 0.0
 
         self._last_run_time = 0.0
         self._run_times = []
@@ -244,6 +258,8 @@ class LightningApp:
         self.set_last_state(state)
         self.root.set_state(state)
         self.stage = AppStage(state["app_state"]["stage"])
+        # Setting the state of the components marks all their variables as assigned.
+        self._delta_engine.reset()
 
     @property
     def last_state(self):
@@ -268,6 +284,7 @@ class LightningApp:
 
     def set_last_state(self, state):
         self._last_state = self.remove_changes(state)
+        self._delta_engine.reset()
 
     @staticmethod
     def populate_changes(last_state, new_state):
@@ -302,6 +319,13 @@ class LightningApp:
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_states_changed_from_queue(q: BaseQueue, timeout: Optional[int] = None) -> List:
+        try:
+            return q.get_many(DELTA_QUEUE_BATCH_SIZE, timeout=timeout or q.default_timeout)
+        except queue.Empty:
+            return []
+
     def check_error_queue(self) -> None:
         exception: Exception = self.get_state_changed_from_queue(self.error_queue)
         if isinstance(exception, Exception):
@@ -327,20 +351,32 @@ class LightningApp:
         # The aggregation would try to get as many deltas as possible
         # from both the `api_delta_queue` and `delta_queue`
         # during the `state_accumulate_wait` time.
-        # The while loop can exit sooner if both queues are empty.
+        # When the app is idle, it blocks on the queue until the first delta arrives instead of polling it.
+        # Otherwise, it waits for the whole time window so a flow changing its state on every run
+        # doesn't run and publish its state more often than every `state_accumulate_wait`.
+        # The works, the Rest API and the flow schedules all send their deltas through the `delta_queue`, and the works
+        # put a `None` wake-up in it along with their exceptions, so the error queue is checked right away.
 
         deltas = []
         api_or_command_request_deltas = []
+        wait_for_first_delta = self._is_idle
+        timeout = self.idle_wait if wait_for_first_delta else self.state_accumulate_wait
         t0 = time()
 
-        while (time() - t0) < self.state_accumulate_wait:
-
-            # TODO: Fetch all available deltas at once to reduce queue calls.
-            delta: Optional[
+        while True:
+            received: List[
                 Union[_DeltaRequest, _APIRequest, _CommandRequest, ComponentDelta]
-            ] = self.get_state_changed_from_queue(self.delta_queue)
-            if delta:
-                if isinstance(delta, _DeltaRequest):
+            ] = self.get_states_changed_from_queue(self.delta_queue, timeout=timeout)
+            if wait_for_first_delta:
+                if not received:
+                    break
+                # When idle, the time window starts once the first delta has been received.
+                wait_for_first_delta = False
+                t0 = time()
+            for delta in received:
+                if not delta:
+                    continue
+                elif isinstance(delta, _DeltaRequest):
                     deltas.append(delta.delta)
                 elif isinstance(delta, ComponentDelta):
                     logger.debug(f"Received from {delta.id} : {delta.delta.to_dict()}")
@@ -356,6 +392,10 @@ class LightningApp:
                 else:
                     api_or_command_request_deltas.append(delta)
 
+            timeout = self.state_accumulate_wait - (time() - t0)
+            if timeout <= 0:
+                break
+
         if api_or_command_request_deltas:
             _process_requests(self, api_or_command_request_deltas)
 
@@ -373,7 +413,7 @@ class LightningApp:
     def maybe_apply_changes(self) -> None:
         """Get the deltas from both the flow queue and the work queue, merge the two deltas and update the
         state."""
-        self._send_flow_to_work_deltas(self.state)
+        self._send_flow_to_work_deltas()
 
         if not self.collect_changes:
             return None
@@ -381,16 +421,18 @@ class LightningApp:
         deltas = self._collect_deltas_from_ui_and_work_queues()
 
         if not deltas:
-            # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
-            last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
-            state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
             # When no deltas are received from the Rest API or work queues,
             # we need to check if the flow modified the state and populate changes.
-            deep_diff = DeepDiff(last_state, state, verbose_level=2)
-            if deep_diff:
+            # The delta engine only compares the attributes set since the last iteration.
+            changes = self._delta_engine.collect()
+            if changes is None:
+                # The component tree changed, e.g. a work was dynamically created.
+                self.set_last_state(self.state)
+                self._has_updated = True
+            elif changes:
                 # TODO: Resolve changes with ``CacheMissException``.
                 # new_state = self.populate_changes(self.last_state, self.state)
-                self.set_last_state(self.state)
+                self._delta_engine.commit()
                 self._has_updated = True
             return False
 
@@ -421,6 +463,7 @@ class LightningApp:
         self._update_layout()
         self._update_is_headless()
         self.maybe_apply_changes()
+        self._is_idle = not self._has_updated
 
         if self.checkpointing and self._should_snapshot():
             self._dump_checkpoint()
@@ -479,6 +522,21 @@ class LightningApp:
                 LightningFlowWarning,
             )
 
+    @property
+    def wakeups_per_second(self) -> float:
+        """The number of iterations of the app loop per second, averaged over the last
+        ``LOOP_WAKEUPS_MONITOR_INTERVAL`` seconds."""
+        return self._wakeups_per_second
+
+    def _update_wakeups_monitor(self) -> None:
+        self._num_wakeups += 1
+        elapsed_time = time() - self._wakeups_t0
+        if elapsed_time >= LOOP_WAKEUPS_MONITOR_INTERVAL:
+            self._wakeups_per_second = self._num_wakeups / elapsed_time
+            logger.debug(f"The app loop woke up {self._wakeups_per_second:.2f} times per second.")
+            self._num_wakeups = 0
+            self._wakeups_t0 = time()
+
     def _run(self) -> bool:
         """Entry point of the LightningApp.
 
@@ -499,6 +557,7 @@ class LightningApp:
             done = self.run_once()
 
             self._update_run_time_monitor()
+            self._update_wakeups_monitor()
 
             if self.ready and self._has_updated and self.should_publish_changes_to_api and self.api_publish_state_queue:
                 self.api_publish_state_queue.put(self.state_vars)
@@ -570,48 +629,22 @@ class LightningApp:
         checkpoints_dir: str,
         version: Optional[int] = None,
     ) -> None:
-        if not os.path.exists(checkpoints_dir):
-            raise FileNotFoundError(f"The provided directory `{checkpoints_dir}` doesn't exist.")
-        checkpoints = [f for f in os.listdir(checkpoints_dir) if f.startswith("v_") and f.endswith(".json")]
-        if not checkpoints:
-            raise Exception(f"No checkpoints where found in `{checkpoints_dir}`.")
-
-        if version is None:
-            # take the latest checkpoint.
-            version = sorted(int(c.split("_")[1]) for c in checkpoints)[-1]
-
-        available_checkpoints = [c for c in checkpoints if c.startswith(f"v_{version}_")]
-        if not available_checkpoints:
-            raise FileNotFoundError(f"The version `{version}` wasn't found in {checkpoints}.")
-        elif len(available_checkpoints) > 1:
-            raise Exception(f"Found 2 checkpoints `{available_checkpoints}`with the same version.")
-        checkpoint_path = os.path.join(checkpoints_dir, available_checkpoints[0])
-        state = pickle.load(open(checkpoint_path, "rb"))
-        self.load_state_dict(state)
+        self.load_state_dict(_load_checkpoint(checkpoints_dir, version))
+        # the next checkpoint starts a new snapshot, as the loaded state isn't the latest one of the log
+        self._checkpoint_log = None
 
     def _dump_checkpoint(self) -> Optional[str]:
         checkpoints_dir = self.checkpoint_dir
         # TODO: Add supports to remotely saving checkpoints.
         if checkpoints_dir.startswith("s3:"):
             return None
-        os.makedirs(checkpoints_dir, exist_ok=True)
-
-        # Get all current version within the provided folder and sort them
-        checkpoint_versions = sorted(
-            int(f.split("_")[1]) for f in os.listdir(checkpoints_dir) if f.startswith("v_") and f.endswith(".json")
-        )
-
-        if checkpoint_versions:
-            previous_version = checkpoint_versions[-1]
-        else:
-            # initialization
-            previous_version = -1
-
-        checkpoint_path = os.path.join(checkpoints_dir, f"v_{previous_version + 1}_{time()}.json")
-
-        with open(checkpoint_path, "wb") as f:
-            pickle.dump(self.state_dict(), f)
-        return checkpoint_path
+        if self._checkpoint_log is None or self._checkpoint_log.checkpoints_dir != checkpoints_dir:
+            self._checkpoint_log = _CheckpointLog(
+                checkpoints_dir,
+                snapshot_interval=CHECKPOINT_SNAPSHOT_INTERVAL,
+                max_snapshots=CHECKPOINT_MAX_SNAPSHOTS,
+            )
+        return self._checkpoint_log.write(self.state_dict())
 
     def connect(self, runtime: "Runtime") -> None:
         """Override to customize your application to the runtime."""
@@ -644,16 +677,12 @@ class LightningApp:
 
     @staticmethod
     def _extract_vars_from_component_name(component_name: str, state):
+        keys = _component_state_path(component_name, state)
+        if keys is None:
+            return None
         child = state
-        for child_name in component_name.split(".")[1:]:
-            if child_name in child["flows"]:
-                child = child["flows"][child_name]
-            elif "structures" in child and child_name in child["structures"]:
-                child = child["structures"][child_name]
-            elif child_name in child["works"]:
-                child = child["works"][child_name]
-            else:
-                return None
+        for key in keys:
+            child = child[key]
 
         # Filter private keys and drives
         return {
@@ -666,7 +695,7 @@ class LightningApp:
             )
         }
 
-    def _send_flow_to_work_deltas(self, state) -> None:
+    def _send_flow_to_work_deltas(self) -> None:
         if not self.flow_to_work_delta_queues:
             return
 
@@ -678,18 +707,12 @@ class LightningApp:
             if w.run.has_sent:
                 continue
 
-            state_work = self._extract_vars_from_component_name(w.name, state)
-            last_state_work = self._extract_vars_from_component_name(w.name, self._last_state)
+            deep_diff = self._delta_engine.work_vars_diff(w)
 
             # Note: The work was dynamically created or deleted.
-            if state_work is None or last_state_work is None:
+            if deep_diff is None:
                 continue
 
-            deep_diff = DeepDiff(last_state_work, state_work, verbose_level=2).to_dict()
-
-            if "unprocessed" in deep_diff:
-                deep_diff.pop("unprocessed")
-
             if deep_diff:
                 logger.debug(f"Sending deep_diff to {w.name} : {deep_diff}")
                 self.flow_to_work_delta_queues[w.name].put(deep_diff)
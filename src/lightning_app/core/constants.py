@@ -14,6 +14,18 @@ def get_lightning_cloud_url() -> str:
 SUPPORTED_PRIMITIVE_TYPES = (type(None), str, int, float, bool)
 STATE_UPDATE_TIMEOUT = 0.001
 STATE_ACCUMULATE_WAIT = 0.05
+# Maximum duration in seconds the app loop waits for a delta when nothing changed during the previous iteration.
+LOOP_IDLE_WAIT = float(os.getenv("LIGHTNING_LOOP_IDLE_WAIT", "1.0"))
+# Duration in seconds over which the number of wakeups of the app loop is averaged.
+LOOP_WAKEUPS_MONITOR_INTERVAL = 10.0
+# Duration in seconds during which the attribute updates of a running work are merged into a single delta.
+WORK_DELTA_COALESCING_WINDOW = float(os.getenv("LIGHTNING_WORK_DELTA_COALESCING_WINDOW", "0.05"))
+# Duration in seconds during which the listings of a Drive are reused, unless the Drive modifies them.
+DRIVE_LIST_CACHE_TTL = float(os.getenv("LIGHTNING_DRIVE_LIST_CACHE_TTL", "1.0"))
+# Number of app checkpoints appended to the log of the latest snapshot before a new snapshot is written.
+CHECKPOINT_SNAPSHOT_INTERVAL = int(os.getenv("LIGHTNING_CHECKPOINT_SNAPSHOT_INTERVAL", "20"))
+# Number of app checkpoint snapshots kept along with their logs.
+CHECKPOINT_MAX_SNAPSHOTS = int(os.getenv("LIGHTNING_CHECKPOINT_MAX_SNAPSHOTS", "3"))
 # Duration in seconds of a moving average of a full flow execution
 # beyond which an exception is raised.
 FLOW_DURATION_THRESHOLD = 1.0
@@ -27,6 +39,24 @@ APP_STATE_MAX_SIZE_BYTES = 1024 * 1024  # 1 MB
 
 CLOUD_QUEUE_TYPE = os.getenv("LIGHTNING_CLOUD_QUEUE_TYPE", None)
 WARNING_QUEUE_SIZE = 1000
+# Number of puts between two checks of the queue length, for the queues where it costs a round-trip.
+WARNING_QUEUE_SIZE_CHECK_INTERVAL = int(os.getenv("LIGHTNING_WARNING_QUEUE_SIZE_CHECK_INTERVAL", "100"))
+# Maximum number of deltas fetched from the delta queue at once.
+DELTA_QUEUE_BATCH_SIZE = int(os.getenv("LIGHTNING_DELTA_QUEUE_BATCH_SIZE", "100"))
+# Queuing system used by the `MultiProcessRuntime`, either `multiprocess` or `shared_memory`.
+MULTIPROCESS_QUEUE_TYPE = os.getenv("LIGHTNING_MULTIPROCESS_QUEUE_TYPE", "multiprocess")
+# Size of the ring buffer backing each shared memory queue.
+SHARED_MEMORY_QUEUE_SIZE_BYTES = int(os.getenv("LIGHTNING_SHARED_MEMORY_QUEUE_SIZE_BYTES", str(16 * 1024 * 1024)))
+# Maximum duration in seconds a put waits for the readers to free space in a full shared memory queue.
+SHARED_MEMORY_QUEUE_PUT_TIMEOUT = float(os.getenv("LIGHTNING_SHARED_MEMORY_QUEUE_PUT_TIMEOUT", "60"))
+# Size of the chunks compared to only rewrite the modified parts of the large files transferred through the shared
+# storage, when it is a local filesystem. Set to 0 to always copy the modified files entirely.
+STORAGE_TRANSFER_CHUNK_SIZE = int(os.getenv("LIGHTNING_STORAGE_TRANSFER_CHUNK_SIZE", str(8 * 1024 * 1024)))
+# The files modified less than this amount of seconds before being hashed could still be modified within the
+# granularity of their modification time, so their digest isn't cached.
+RACY_MTIME_SECONDS = 2
+# Serializer used by the queues which send bytes, either `pickle` or `msgpack`.
+QUEUE_SERIALIZER = os.getenv("LIGHTNING_QUEUE_SERIALIZER", "pickle")
 # different flag because queue debug can be very noisy, and almost always not useful unless debugging the queue itself.
 QUEUE_DEBUG_ENABLED = bool(int(os.getenv("LIGHTNING_QUEUE_DEBUG_ENABLED", "0")))
 
@@ -37,6 +67,8 @@ REDIS_QUEUES_READ_DEFAULT_TIMEOUT = 0.005
 
 HTTP_QUEUE_URL = os.getenv("LIGHTNING_HTTP_QUEUE_URL", "http://localhost:9801")
 HTTP_QUEUE_REFRESH_INTERVAL = float(os.getenv("LIGHTNING_HTTP_QUEUE_REFRESH_INTERVAL", "1"))
+# Maximum duration in seconds the HTTP queue server holds a read request while waiting for an element.
+HTTP_QUEUE_LONG_POLL_TIMEOUT = float(os.getenv("LIGHTNING_HTTP_QUEUE_LONG_POLL_TIMEOUT", "20"))
 HTTP_QUEUE_TOKEN = os.getenv("LIGHTNING_HTTP_QUEUE_TOKEN", None)
 
 USER_ID = os.getenv("USER_ID", "1234")
@@ -12,6 +12,7 @@ from lightning_app.storage import Path
 from lightning_app.storage.drive import _maybe_create_drive, Drive
 from lightning_app.utilities.app_helpers import _is_json_serializable, _LightningAppRef, _set_child_name
 from lightning_app.utilities.component import _sanitize_state
+from lightning_app.utilities.delta_engine import _mark_dirty
 from lightning_app.utilities.exceptions import ExitAppException
 from lightning_app.utilities.introspection import _is_init_context, _is_run_context
 from lightning_app.utilities.packaging.cloud_compute import _maybe_create_cloud_compute, CloudCompute
@@ -204,6 +205,8 @@ class LightningFlow:
                     "and therefore don't need to be JSON-serializable."
                 )
 
+            _mark_dirty(self, name)
+
         super().__setattr__(name, value)
 
     @staticmethod
@@ -1,29 +1,40 @@
 import multiprocessing
-import pickle
+import os
 import queue  # needed as import instead from/import for mocking in tests
+import struct
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
 
 from lightning_app.core.constants import (
+    HTTP_QUEUE_LONG_POLL_TIMEOUT,
     HTTP_QUEUE_REFRESH_INTERVAL,
     HTTP_QUEUE_TOKEN,
     HTTP_QUEUE_URL,
     LIGHTNING_DIR,
     QUEUE_DEBUG_ENABLED,
+    QUEUE_SERIALIZER,
     REDIS_HOST,
     REDIS_PASSWORD,
     REDIS_PORT,
     REDIS_QUEUES_READ_DEFAULT_TIMEOUT,
+    SHARED_MEMORY_QUEUE_PUT_TIMEOUT,
+    SHARED_MEMORY_QUEUE_SIZE_BYTES,
     STATE_UPDATE_TIMEOUT,
     WARNING_QUEUE_SIZE,
+    WARNING_QUEUE_SIZE_CHECK_INTERVAL,
 )
 from lightning_app.utilities.app_helpers import Logger
 from lightning_app.utilities.imports import _is_redis_available, requires
-from lightning_app.utilities.network import HTTPClient
+from lightning_app.utilities.network import _DEFAULT_REQUEST_TIMEOUT, HTTPClient
+from lightning_app.utilities.serialization import _get_serializer, BaseSerializer
 
 if _is_redis_available():
     import redis
@@ -53,10 +64,13 @@ class QueuingSystem(Enum):
     MULTIPROCESS = "multiprocess"
     REDIS = "redis"
     HTTP = "http"
+    SHARED_MEMORY = "shared_memory"
 
     def get_queue(self, queue_name: str) -> "BaseQueue":
         if self == QueuingSystem.MULTIPROCESS:
             return MultiProcessQueue(queue_name, default_timeout=STATE_UPDATE_TIMEOUT)
+        elif self == QueuingSystem.SHARED_MEMORY:
+            return SharedMemoryQueue(queue_name, default_timeout=STATE_UPDATE_TIMEOUT)
         elif self == QueuingSystem.REDIS:
             return RedisQueue(queue_name, default_timeout=REDIS_QUEUES_READ_DEFAULT_TIMEOUT)
         elif self == QueuingSystem.HTTP:
@@ -170,6 +184,42 @@ class BaseQueue(ABC):
         """
         pass
 
+    def put_many(self, items: List[Any]) -> None:
+        """Adds all the items to the end of the queue.
+
+        Child classes should override this method when pushing several items at once can save round-trips.
+        """
+        for item in items:
+            self.put(item)
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` elements from the left of the queue.
+
+        Child classes should override this method when fetching several items at once can save round-trips. By default,
+        a single element is returned.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds used to wait for the first element, in case of input timeout is 0,
+            the `self.default_timeout` is used. A timeout of None can be used to block indefinitely.
+        """
+        return [self.get(timeout)]
+
+    @property
+    def serializer(self) -> BaseSerializer:
+        """The serializer used to encode the elements of the queues which send bytes, selected with
+        ``LIGHTNING_QUEUE_SERIALIZER``."""
+        if getattr(self, "_serializer", None) is None:
+            self._serializer = _get_serializer(QUEUE_SERIALIZER)
+        return self._serializer
+
+    @serializer.setter
+    def serializer(self, serializer: BaseSerializer) -> None:
+        self._serializer = serializer
+
     @property
     def is_running(self) -> bool:
         """Returns True if the queue is running, False otherwise.
@@ -179,6 +229,18 @@ class BaseQueue(ABC):
         return True
 
 
+def _get_many_from_queue(q: Any, max_items: int, timeout: Optional[float]) -> List[Any]:
+    """Returns up to ``max_items`` elements of a ``queue.Queue`` or a ``multiprocessing.Queue``."""
+    # Unlike ``get``, wait for the first element until the timeout is reached.
+    items = [q.get(timeout=timeout)]
+    while len(items) < max_items:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
 class SingleProcessQueue(BaseQueue):
     def __init__(self, name: str, default_timeout: float):
         self.name = name
@@ -193,6 +255,11 @@ class SingleProcessQueue(BaseQueue):
             timeout = self.default_timeout
         return self.queue.get(timeout=timeout, block=(timeout is None))
 
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        if timeout == 0:
+            timeout = self.default_timeout
+        return _get_many_from_queue(self.queue, max_items, timeout)
+
 
 class MultiProcessQueue(BaseQueue):
     def __init__(self, name: str, default_timeout: float):
@@ -209,6 +276,159 @@ class MultiProcessQueue(BaseQueue):
             timeout = self.default_timeout
         return self.queue.get(timeout=timeout, block=(timeout is None))
 
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        if timeout == 0:
+            timeout = self.default_timeout
+        return _get_many_from_queue(self.queue, max_items, timeout)
+
+
+def _release_shared_memory(shm: Any, owner_pid: int) -> None:
+    shm.close()
+    # Forked processes inherit the queue, but only the process which created the memory block can release it.
+    if os.getpid() == owner_pid:
+        shm.unlink()
+
+
+class SharedMemoryQueue(BaseQueue):
+    # head offset, tail offset, number of used bytes and number of elements.
+    _HEADER = struct.Struct("QQQQ")
+    _ITEM_SIZE = struct.Struct("Q")
+
+    def __init__(
+        self,
+        name: str,
+        default_timeout: float,
+        size_bytes: int = SHARED_MEMORY_QUEUE_SIZE_BYTES,
+        put_timeout: float = SHARED_MEMORY_QUEUE_PUT_TIMEOUT,
+    ):
+        """A queue backed by a ring buffer in shared memory, to be shared by processes on the same host.
+
+        The elements are serialized straight into the ring buffer and deserialized directly from it, so they aren't
+        copied through a pipe and a feeder thread as with the ``multiprocessing.Queue``.
+
+        Parameters
+        ----------
+        name:
+            The name of the queue, used for debugging.
+        default_timeout:
+            Default timeout for the reads.
+        size_bytes:
+            The size of the ring buffer. Elements bigger than this size can't be put in the queue.
+        put_timeout:
+            Maximum duration in seconds a put waits for the readers to free space in the ring buffer, after which
+            ``queue.Full`` is raised, e.g. when the reader process died.
+        """
+        from multiprocessing import shared_memory
+
+        self.name = name
+        self.default_timeout = default_timeout
+        self._capacity = size_bytes
+        self.put_timeout = put_timeout
+        self._shm = shared_memory.SharedMemory(create=True, size=self._HEADER.size + size_bytes)
+        self._HEADER.pack_into(self._shm.buf, 0, 0, 0, 0, 0)
+        context = multiprocessing.get_context("spawn")
+        self._cond = context.Condition(context.Lock())
+        self._finalizer = weakref.finalize(self, _release_shared_memory, self._shm, os.getpid())
+
+    def __getstate__(self) -> dict:
+        # Like the ``multiprocessing.Queue``, the queue can only be pickled while spawning a new process.
+        return {
+            "name": self.name,
+            "default_timeout": self.default_timeout,
+            "capacity": self._capacity,
+            "put_timeout": self.put_timeout,
+            "shm_name": self._shm.name,
+            "cond": self._cond,
+            "serializer": self.serializer,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        from multiprocessing import shared_memory
+
+        self.name = state["name"]
+        self.default_timeout = state["default_timeout"]
+        self._capacity = state["capacity"]
+        self.put_timeout = state["put_timeout"]
+        self._shm = shared_memory.SharedMemory(name=state["shm_name"])
+        self._cond = state["cond"]
+        self._serializer = state["serializer"]
+        self._finalizer = weakref.finalize(self, self._shm.close)
+
+    def put(self, item: Any) -> None:
+        self.put_many([item])
+
+    def put_many(self, items: List[Any]) -> None:
+        for item in items:
+            value = self.serializer.dumps(item)
+            size = self._ITEM_SIZE.size + len(value)
+            if size > self._capacity:
+                raise ValueError(
+                    f"The element put in the queue {self.name} is {size} bytes large, which is more than the queue"
+                    f" size of {self._capacity} bytes. HINT: Increase `LIGHTNING_SHARED_MEMORY_QUEUE_SIZE_BYTES`."
+                )
+            with self._cond:
+                # Wait for the readers to free enough space.
+                if not self._cond.wait_for(lambda: self._capacity - self._header()[2] >= size, self.put_timeout):
+                    raise queue.Full
+                head, tail, used, count = self._header()
+                tail = self._write(tail, self._ITEM_SIZE.pack(len(value)))
+                tail = self._write(tail, value)
+                self._HEADER.pack_into(self._shm.buf, 0, head, tail, used + size, count + 1)
+                self._cond.notify_all()
+
+    def get(self, timeout: int = None) -> Any:
+        return self.get_many(1, timeout=timeout)[0]
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        if timeout == 0:
+            timeout = self.default_timeout
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._header()[3] > 0, timeout):
+                raise queue.Empty
+            items = []
+            while len(items) < max_items and self._header()[3] > 0:
+                items.append(self._pop())
+            self._cond.notify_all()
+        return items
+
+    def length(self) -> int:
+        with self._cond:
+            return self._header()[3]
+
+    def _header(self) -> tuple:
+        return self._HEADER.unpack_from(self._shm.buf, 0)
+
+    def _write(self, offset: int, data: bytes) -> int:
+        """Writes the data at the given offset of the ring buffer and returns the offset following it."""
+        start = self._HEADER.size
+        first = min(len(data), self._capacity - offset)
+        self._shm.buf[start + offset : start + offset + first] = data[:first]
+        if first < len(data):
+            self._shm.buf[start : start + len(data) - first] = data[first:]
+        return (offset + len(data)) % self._capacity
+
+    def _read(self, offset: int, size: int) -> memoryview:
+        """Returns a view over the data at the given offset of the ring buffer, which is only copied if it wraps
+        around the end of the buffer."""
+        start = self._HEADER.size
+        if offset + size <= self._capacity:
+            return self._shm.buf[start + offset : start + offset + size]
+        first = self._capacity - offset
+        return memoryview(
+            bytes(self._shm.buf[start + offset : start + self._capacity])
+            + bytes(self._shm.buf[start : start + size - first])
+        )
+
+    def _pop(self) -> Any:
+        head, tail, used, count = self._header()
+        with self._read(head, self._ITEM_SIZE.size) as view:
+            (value_size,) = self._ITEM_SIZE.unpack(view)
+        with self._read((head + self._ITEM_SIZE.size) % self._capacity, value_size) as view:
+            item = self.serializer.loads(view)
+        size = self._ITEM_SIZE.size + value_size
+        self._HEADER.pack_into(self._shm.buf, 0, (head + size) % self._capacity, tail, used - size, count - 1)
+        return item
+
 
 class RedisQueue(BaseQueue):
     @requires("redis")
@@ -244,39 +464,58 @@ class RedisQueue(BaseQueue):
         self.redis = redis.Redis(host=self.host, port=self.port, password=self.password)
 
     def put(self, item: Any) -> None:
+        value = self._serialize(item)
+        try:
+            queue_len = self.redis.rpush(self.name, value)
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+        # RPUSH returns the length of the list, so there is no need for an extra LLEN round-trip.
+        self._maybe_warn_length(queue_len)
+
+    def put_many(self, items: List[Any]) -> None:
+        """Pushes all the items with a single RPUSH command."""
+        if not items:
+            return
+        values = [self._serialize(item) for item in items]
+        try:
+            queue_len = self.redis.rpush(self.name, *values)
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+        self._maybe_warn_length(queue_len)
+
+    def _serialize(self, item: Any) -> bytes:
         from lightning_app import LightningWork
 
-        is_work = isinstance(item, LightningWork)
+        if not isinstance(item, LightningWork):
+            return self.serializer.dumps(item)
 
         # TODO: Be careful to handle with a lock if another thread needs
         # to access the work backend one day.
         # The backend isn't picklable
         # Raises a TypeError: cannot pickle '_thread.RLock' object
-        if is_work:
-            backend = item._backend
-            item._backend = None
+        backend = item._backend
+        item._backend = None
+        try:
+            return self.serializer.dumps(item)
+        finally:
+            item._backend = backend
 
-        value = pickle.dumps(item)
-        queue_len = self.length()
-        if queue_len >= WARNING_QUEUE_SIZE:
+    def _maybe_warn_length(self, queue_len: Optional[int]) -> None:
+        if queue_len is not None and queue_len >= WARNING_QUEUE_SIZE:
             warnings.warn(
                 f"The Redis Queue {self.name} length is larger than the "
                 f"recommended length of {WARNING_QUEUE_SIZE}. "
                 f"Found {queue_len}. This might cause your application to crash, "
                 "please investigate this."
             )
-        try:
-            self.redis.rpush(self.name, value)
-        except redis.exceptions.ConnectionError:
-            raise ConnectionError(
-                "Your app failed because it couldn't connect to Redis. "
-                "Please try running your app again. "
-                "If the issue persists, please contact support@lightning.ai"
-            )
-
-        # The backend isn't pickable.
-        if is_work:
-            item._backend = backend
 
     def get(self, timeout: int = None):
         """Returns the left most element of the redis queue.
@@ -305,7 +544,37 @@ class RedisQueue(BaseQueue):
 
         if out is None:
             raise queue.Empty
-        return pickle.loads(out[1])
+        return self.serializer.loads(out[1])
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` elements from the left of the redis queue.
+
+        The available elements are drained in a single round-trip with a transaction of LRANGE and LTRIM. If the queue
+        is empty, this waits for the first element with BLPOP.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds, in case of input timeout is 0, the `self.default_timeout` is used.
+            A timeout of None can be used to block indefinitely.
+        """
+        try:
+            pipeline = self.redis.pipeline()
+            pipeline.lrange(self.name, 0, max_items - 1)
+            pipeline.ltrim(self.name, max_items, -1)
+            values, _ = pipeline.execute()
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+
+        if values:
+            return [self.serializer.loads(value) for value in values]
+        return [self.get(timeout)]
 
     def clear(self) -> None:
         """Clear all elements in the queue."""
@@ -347,7 +616,10 @@ class RedisQueue(BaseQueue):
 
 class HTTPQueue(BaseQueue):
     def __init__(self, name: str, default_timeout: float):
-        """
+        """The length of the queue is checked before the puts to warn when it exceeds ``WARNING_QUEUE_SIZE``. As
+        each check is an extra request, it is made every ``WARNING_QUEUE_SIZE_CHECK_INTERVAL`` puts, and before
+        every put once the last length found is within ``WARNING_QUEUE_SIZE_CHECK_INTERVAL`` of the limit.
+
         Parameters
         ----------
         name:
@@ -362,54 +634,138 @@ class HTTPQueue(BaseQueue):
         self.app_id, self._name_suffix = self._split_app_id_and_queue_name(name)
         self.name = name  # keeping the name for debugging
         self.default_timeout = default_timeout
+        self._num_puts = 0
+        self._last_length = 0
+        # Whether the server supports the batched actions. Set to False as soon as it rejects one of them.
+        self._batching = True
         self.client = HTTPClient(base_url=HTTP_QUEUE_URL, auth_token=HTTP_QUEUE_TOKEN, log_callback=debug_log_callback)
 
     def get(self, timeout: int = None) -> Any:
         if not self.app_id:
             raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
 
-        # it's a blocking call, we need to loop and call the backend to mimic this behavior
-        if timeout is None:
-            while True:
-                try:
-                    return self._get()
-                except queue.Empty:
-                    time.sleep(HTTP_QUEUE_REFRESH_INTERVAL)
-
         # make one request and return the result
         if timeout == 0:
             return self._get()
 
-        # timeout is some value - loop until the timeout is reached
-        start_time = time.time()
-        timeout += 0.1  # add 0.1 seconds as a safe margin
-        while (time.time() - start_time) < timeout:
+        try:
+            return self._wait(self._get, timeout)
+        except queue.Empty:
+            return None
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        if not self.app_id:
+            raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
+
+        if timeout == 0:
+            timeout = self.default_timeout
+        return self._wait(partial(self._get_many, max_items), timeout)
+
+    def _wait(self, pop: Callable[[float], Any], timeout: Optional[float]) -> Any:
+        """Calls ``pop`` with the number of seconds the server should wait for an element, until it returns or the
+        timeout is reached.
+
+        The server holds the request until an element is available, so a blocking read only costs a request per
+        ``HTTP_QUEUE_LONG_POLL_TIMEOUT``. If it answers earlier without any element, e.g. because it doesn't support
+        long-polling, the client sleeps ``HTTP_QUEUE_REFRESH_INTERVAL`` between two requests as a fallback.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = HTTP_QUEUE_LONG_POLL_TIMEOUT
+            if deadline is not None:
+                wait = min(wait, max(deadline - time.monotonic(), 0))
+            t0 = time.monotonic()
             try:
-                return self._get()
+                return pop(wait)
             except queue.Empty:
-                time.sleep(HTTP_QUEUE_REFRESH_INTERVAL)
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    raise
+                if now - t0 < wait:
+                    remaining = HTTP_QUEUE_REFRESH_INTERVAL if deadline is None else deadline - now
+                    time.sleep(min(HTTP_QUEUE_REFRESH_INTERVAL, remaining))
+
+    def _get(self, wait: float = 0) -> Any:
+        resp = self._post_pop({"action": "pop"}, wait)
+        if resp.status_code == 204:
+            raise queue.Empty
+        return self.serializer.loads(resp.content)
 
-    def _get(self):
-        resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", query_params={"action": "pop"})
+    def _get_many(self, max_items: int, wait: float = 0) -> List[Any]:
+        if max_items == 1 or not self._batching:
+            return [self._get(wait)]
+        try:
+            resp = self._post_pop({"action": "pop_many", "count": max_items}, wait)
+        except requests.exceptions.HTTPError as ex:
+            if not self._is_unsupported(ex):
+                raise
+            self._batching = False
+            return [self._get(wait)]
         if resp.status_code == 204:
             raise queue.Empty
-        return pickle.loads(resp.content)
+        return [self.serializer.loads(data) for data in _unpack_frames(resp.content)]
+
+    def _post_pop(self, query_params: Dict[str, Any], wait: float) -> requests.Response:
+        if wait > 0:
+            query_params["wait"] = wait
+        return self.client.post(
+            f"v1/{self.app_id}/{self._name_suffix}",
+            query_params=query_params,
+            # the server can hold the request for ``wait`` seconds before answering.
+            timeout=wait + _DEFAULT_REQUEST_TIMEOUT,
+        )
 
     def put(self, item: Any) -> None:
         if not self.app_id:
             raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
 
-        value = pickle.dumps(item)
-        queue_len = self.length()
-        if queue_len >= WARNING_QUEUE_SIZE:
-            warnings.warn(
-                f"The Queue {self._name_suffix} length is larger than the recommended length of {WARNING_QUEUE_SIZE}. "
-                f"Found {queue_len}. This might cause your application to crash, please investigate this."
-            )
+        value = self.serializer.dumps(item)
+        self._check_length(1)
         resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"})
         if resp.status_code != 201:
             raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
 
+    def put_many(self, items: List[Any]) -> None:
+        if not self._batching or len(items) == 1:
+            return super().put_many(items)
+        if not self.app_id:
+            raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
+        if not items:
+            return
+
+        values = [self.serializer.dumps(item) for item in items]
+        self._check_length(len(items))
+        try:
+            resp = self.client.post(
+                f"v1/{self.app_id}/{self._name_suffix}", data=_pack_frames(values), query_params={"action": "push_many"}
+            )
+        except requests.exceptions.HTTPError as ex:
+            if not self._is_unsupported(ex):
+                raise
+            self._batching = False
+            return super().put_many(items)
+        if resp.status_code != 201:
+            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+
+    def _check_length(self, num_items: int) -> None:
+        # Checking the length is an extra request, so it is only sampled, unless the puts until the next sample could
+        # reach the limit.
+        sampled = -self._num_puts % WARNING_QUEUE_SIZE_CHECK_INTERVAL < num_items
+        if sampled or self._last_length + WARNING_QUEUE_SIZE_CHECK_INTERVAL >= WARNING_QUEUE_SIZE:
+            self._last_length = self.length()
+            if self._last_length >= WARNING_QUEUE_SIZE:
+                warnings.warn(
+                    f"The Queue {self._name_suffix} length is larger than the recommended length of "
+                    f"{WARNING_QUEUE_SIZE}. Found {self._last_length}. This might cause your application to crash, "
+                    "please investigate this."
+                )
+        self._num_puts += num_items
+
+    @staticmethod
+    def _is_unsupported(ex: requests.exceptions.HTTPError) -> bool:
+        """Whether the server rejected a batched action it doesn't know about."""
+        return ex.response is not None and ex.response.status_code in (400, 404, 405, 422)
+
     def length(self):
         if not self.app_id:
             raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
@@ -441,6 +797,26 @@ class HTTPQueue(BaseQueue):
         return cls(**state)
 
 
+_FRAME_LENGTH = struct.Struct(">Q")
+
+
+def _pack_frames(values: List[bytes]) -> bytes:
+    """Concatenates the payloads, each prefixed by its length, to send several elements within a single request."""
+    return b"".join(_FRAME_LENGTH.pack(len(value)) + value for value in values)
+
+
+def _unpack_frames(data: bytes) -> List[bytes]:
+    view = memoryview(data)
+    values = []
+    offset = 0
+    while offset < len(view):
+        (length,) = _FRAME_LENGTH.unpack_from(view, offset)
+        offset += _FRAME_LENGTH.size
+        values.append(bytes(view[offset : offset + length]))
+        offset += length
+    return values
+
+
 def debug_log_callback(message: str, *args: Any, **kwargs: Any) -> None:
     if QUEUE_DEBUG_ENABLED or (Path(LIGHTNING_DIR) / "QUEUE_DEBUG_ENABLED").exists():
         logger.info(message, *args, **kwargs)
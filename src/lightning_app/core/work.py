@@ -13,6 +13,7 @@ from lightning_app.storage.drive import _maybe_create_drive, Drive
 from lightning_app.storage.payload import Payload
 from lightning_app.utilities.app_helpers import _is_json_serializable, _LightningAppRef, is_overridden
 from lightning_app.utilities.component import _is_flow_context, _sanitize_state
+from lightning_app.utilities.delta_engine import _mark_dirty
 from lightning_app.utilities.enum import (
     CacheCallsKeys,
     make_status,
@@ -420,6 +421,8 @@ class LightningWork:
                     "objects in the state, you can use the `lightning_app.storage.Payload` API."
                 )
 
+            _mark_dirty(self, name)
+
         super().__setattr__(name, value)
 
     def __getattribute__(self, name):
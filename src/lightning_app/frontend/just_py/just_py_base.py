@@ -2,13 +2,12 @@ import os
 import pydoc
 from typing import Any, Callable
 
-from lightning_app.frontend.utils import _reduce_to_flow_scope
+from lightning_app.frontend.utils import _get_scoped_app_state
 from lightning_app.utilities.state import AppState
 
 
 def _get_state() -> AppState:
-    app_state = AppState()
-    return _reduce_to_flow_scope(app_state, flow=os.environ["LIGHTNING_FLOW_NAME"])
+    return _get_scoped_app_state(os.environ["LIGHTNING_FLOW_NAME"])
 
 
 def _webpage() -> Any:
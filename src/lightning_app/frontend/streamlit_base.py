@@ -6,9 +6,8 @@ import os
 import pydoc
 from typing import Callable
 
-from lightning_app.frontend.utils import _reduce_to_flow_scope
+from lightning_app.frontend.utils import _get_scoped_app_state
 from lightning_app.utilities.app_helpers import StreamLitStatePlugin
-from lightning_app.utilities.state import AppState
 
 
 def _get_render_fn_from_environment() -> Callable:
@@ -20,10 +19,8 @@ def _get_render_fn_from_environment() -> Callable:
 
 def _main():
     """Run the render_fn with the current flow_state."""
-    app_state = AppState(plugin=StreamLitStatePlugin())
-
-    # Fetch the information of which flow attaches to this streamlit instance
-    flow_state = _reduce_to_flow_scope(app_state, flow=os.environ["LIGHTNING_FLOW_NAME"])
+    # Only the state of the flow which attaches to this streamlit instance is requested from the app
+    flow_state = _get_scoped_app_state(os.environ["LIGHTNING_FLOW_NAME"], plugin=StreamLitStatePlugin())
 
     # Call the provided render function.
     # Pass it the state, scoped to the current flow.
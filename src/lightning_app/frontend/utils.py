@@ -6,6 +6,7 @@ import os
 from typing import Callable
 
 from lightning_app.core.flow import LightningFlow
+from lightning_app.utilities.app_helpers import BaseStatePlugin
 from lightning_app.utilities.state import AppState
 
 
@@ -19,15 +20,20 @@ def _reduce_to_flow_scope(state: AppState, flow: str | LightningFlow) -> AppStat
     return flow_state
 
 
+def _get_scoped_app_state(flow: str | LightningFlow, plugin: BaseStatePlugin | None = None) -> AppState:
+    """Returns an AppState scoped to the given flow, which only requests the state of this flow from the app."""
+    flow_name = flow.name if isinstance(flow, LightningFlow) else flow
+    return AppState(my_affiliation=tuple(flow_name.split(".")[1:]), plugin=plugin)
+
+
 def _get_flow_state(flow: str) -> AppState:
     """Returns an AppState scoped to the current Flow.
 
     Returns:
         AppState: An AppState scoped to the current Flow.
     """
-    app_state = AppState()
-    app_state._request_state()  # pylint: disable=protected-access
-    flow_state = _reduce_to_flow_scope(app_state, flow)
+    flow_state = _get_scoped_app_state(flow)
+    flow_state._request_state()  # pylint: disable=protected-access
     return flow_state
 
 
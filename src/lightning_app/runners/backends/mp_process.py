@@ -2,6 +2,7 @@ import multiprocessing
 from typing import List, Optional
 
 import lightning_app
+from lightning_app.core.constants import MULTIPROCESS_QUEUE_TYPE
 from lightning_app.core.queues import QueuingSystem
 from lightning_app.runners.backends.backend import Backend, WorkManager
 from lightning_app.utilities.enum import WorkStageStatus
@@ -59,7 +60,7 @@ class MultiProcessWorkManager(WorkManager):
 
 class MultiProcessingBackend(Backend):
     def __init__(self, entrypoint_file: str):
-        super().__init__(entrypoint_file=entrypoint_file, queues=QueuingSystem.MULTIPROCESS, queue_id="0")
+        super().__init__(entrypoint_file=entrypoint_file, queues=QueuingSystem(MULTIPROCESS_QUEUE_TYPE), queue_id="0")
 
     def create_work(self, app, work) -> None:
         app.processes[work.name] = MultiProcessWorkManager(app, work)
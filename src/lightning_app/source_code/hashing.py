@@ -1,10 +1,148 @@
 import hashlib
-from typing import List
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple, Union
 
+from lightning_app.core.constants import RACY_MTIME_SECONDS
 
-def _get_hash(files: List[str], algorithm: str = "blake2", chunk_num_blocks: int = 128) -> str:
+_INDEX_VERSION = 2
+
+# The amount of files below which a thread isn't worth starting to hash them
+_MIN_FILES_PER_WORKER = 100
+
+# The threads updating the indexes in the background, by index file
+_updates: Dict[Path, Thread] = {}
+_updates_lock = Lock()
+
+
+def _new_hash(algorithm: str) -> "hashlib._Hash":
+    if algorithm == "blake2":
+        return hashlib.blake2b(digest_size=20)
+    if algorithm == "md5":
+        return hashlib.md5()
+    raise ValueError(f"Algorithm {algorithm} not supported")
+
+
+def _hash_file(file: str, algorithm: str, chunk_num_blocks: int) -> Tuple[bytes, os.stat_result]:
+    """Returns the digest of a file along with its status, taken before reading it."""
+    h = _new_hash(algorithm)
+    chunk_size = chunk_num_blocks * h.block_size
+    # the files are read without buffering, as they are read by chunks anyway, up to the size they had when opened
+    with open(file, "rb", buffering=0) as f:
+        stat = os.fstat(f.fileno())
+        remaining = stat.st_size
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            h.update(chunk)
+            remaining -= len(chunk)
+    return h.digest(), stat
+
+
+def _hash_files(algorithm: str, chunk_num_blocks: int, files: List[str]) -> List[Tuple[bytes, os.stat_result]]:
+    return [_hash_file(file, algorithm, chunk_num_blocks) for file in files]
+
+
+class _HashIndex:
+    """A persistent index of the digests of files, which is invalidated for a file when its size, modification time
+    or inode changes.
+
+    Parameters
+    ----------
+    index_file: Path
+        File storing the index
+    algorithm: str
+        Algorithm of the digests, the index is discarded if it was built with another one
+    """
+
+    def __init__(self, index_file: Union[str, Path], algorithm: str):
+        self.index_file = Path(index_file)
+        self.algorithm = algorithm
+        # the entries are strings, which are decoded faster than lists and aren't tracked by the garbage collector
+        self.entries: Dict[str, str] = {}
+        self._load()
+
+    @staticmethod
+    def _key(stat: os.stat_result) -> str:
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}:"
+
+    def get(self, file: str, stat: os.stat_result) -> Optional[str]:
+        entry = self.entries.get(file)
+        key = self._key(stat)
+        if entry is None or not entry.startswith(key):
+            return None
+        return entry[len(key) :]
+
+    def update(self, files: List[str], hashed: Dict[str, Tuple[bytes, os.stat_result]], hashed_at_ns: int) -> None:
+        """Sets the digests of the files hashed from ``hashed_at_ns`` on and writes the index, only keeping the given
+        files."""
+        min_mtime_ns = hashed_at_ns - RACY_MTIME_SECONDS * 10**9
+        for file, (digest, stat) in hashed.items():
+            if stat.st_mtime_ns < min_mtime_ns:
+                self.entries[file] = self._key(stat) + digest.hex()
+        if hashed or self.entries.keys() != set(files):
+            self.save(files)
+
+    def update_in_background(
+        self, files: List[str], hashed: Dict[str, Tuple[bytes, os.stat_result]], hashed_at_ns: int
+    ) -> None:
+        """Updates the index in a thread, which the next index loaded from the same file waits for."""
+        thread = Thread(target=self.update, args=(files, hashed, hashed_at_ns))
+        with _updates_lock:
+            _updates[self.index_file] = thread
+        thread.start()
+
+    def save(self, files: List[str]) -> None:
+        """Writes the index, only keeping the given files."""
+        entries = {f: self.entries[f] for f in files if f in self.entries}
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            # `json.dumps` encodes with the C encoder, unlike `json.dump`
+            f.write(json.dumps({"version": _INDEX_VERSION, "algorithm": self.algorithm, "entries": entries}))
+        os.replace(tmp_file, self.index_file)
+
+    def _load(self) -> None:
+        _wait_for_index(self.index_file)
+        try:
+            with open(self.index_file) as f:
+                index = json.load(f)
+            if index["version"] == _INDEX_VERSION and index["algorithm"] == self.algorithm:
+                self.entries = index["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # the index is rebuilt when missing or corrupted
+            self.entries = {}
+
+
+def _wait_for_index(index_file: Union[str, Path]) -> None:
+    """Waits for the index of the given file to be written, if it is being updated in the background."""
+    with _updates_lock:
+        thread = _updates.pop(Path(index_file), None)
+    if thread is not None:
+        thread.join()
+
+
+def _get_hash(
+    files: List[str],
+    algorithm: str = "blake2",
+    chunk_num_blocks: int = 128,
+    index_file: Optional[Union[str, Path]] = None,
+    num_workers: Optional[int] = None,
+) -> str:
     """Hashes the contents of a list of files.
 
+    Each file is hashed on its own, across a pool of threads, and the result is the hash of their digests. When an
+    index file is given, the digests of the files whose size, modification time and inode didn't change since the
+    previous call are read from it instead of being computed again. The index is written in the background, so the
+    first call isn't slower than without one.
+
     Parameters
     ----------
     files: List[Path]
@@ -14,6 +152,10 @@ def _get_hash(files: List[str], algorithm: str = "blake2", chunk_num_blocks: int
         is faster than "md5". [1]
     chunk_num_blocks: int, default 128
         Block size to user when iterating over file chunks.
+    index_file: Optional[Path], default None
+        File storing the digests of the files between calls.
+    num_workers: Optional[int], default None
+        Amount of threads hashing the files, one per CPU by default.
 
     References
     ----------
@@ -21,16 +163,39 @@ def _get_hash(files: List[str], algorithm: str = "blake2", chunk_num_blocks: int
     [2] https://stackoverflow.com/questions/1131220/get-md5-hash-of-big-files-in-python
     """
     # validate input
-    if algorithm == "blake2":
-        h = hashlib.blake2b(digest_size=20)
-    elif algorithm == "md5":
-        h = hashlib.md5()
+    h = _new_hash(algorithm)
+
+    index = _HashIndex(index_file, algorithm) if index_file is not None else None
+    hashed_at_ns = time.time_ns()
+    digests: Dict[str, Optional[bytes]] = dict.fromkeys(files)
+    if index is not None and index.entries:
+        for file in files:
+            digest = index.get(file, os.stat(file))
+            digests[file] = None if digest is None else bytes.fromhex(digest)
+
+    # calculate hash for the files which aren't indexed, hashlib releases the GIL while hashing
+    missing = [file for file, digest in digests.items() if digest is None]
+    # the small trees are hashed faster than the threads are started
+    num_workers = min(num_workers or os.cpu_count() or 1, math.ceil(len(missing) / _MIN_FILES_PER_WORKER))
+    results: Dict[str, Tuple[bytes, os.stat_result]] = {}
+    if num_workers > 1:
+        # the files are handed over in batches, as most source files are hashed faster than a task is scheduled
+        batch_size = math.ceil(len(missing) / (4 * num_workers))
+        batches = [missing[i : i + batch_size] for i in range(0, len(missing), batch_size)]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for batch, batch_results in zip(
+                batches, executor.map(partial(_hash_files, algorithm, chunk_num_blocks), batches)
+            ):
+                results.update(zip(batch, batch_results))
     else:
-        raise ValueError(f"Algorithm {algorithm} not supported")
+        results.update(zip(missing, _hash_files(algorithm, chunk_num_blocks, missing)))
+
+    for file, (digest, _) in results.items():
+        digests[file] = digest
+    if index is not None:
+        # the version is returned right away, the next index loaded from the same file waits for this one
+        index.update_in_background(files, results, hashed_at_ns)
 
-    # calculate hash for all files
     for file in files:
-        with open(file, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_num_blocks * h.block_size), b""):
-                h.update(chunk)
+        h.update(digests[file])
     return h.hexdigest()
@@ -1,3 +1,4 @@
+import hashlib
 import os
 from contextlib import contextmanager
 from pathlib import Path
@@ -44,9 +45,16 @@ class LocalSourceCodeDir:
             return self._version
 
         # stores both version and a set with the files used to generate the checksum
-        self._version = _get_hash(files=self.files, algorithm="blake2")
+        self._version = _get_hash(files=self.files, algorithm="blake2", index_file=self.hash_index_path)
         return self._version
 
+    @property
+    def hash_index_path(self) -> Path:
+        """Location of the digests of the source files in local cache, which are only computed again for the files
+        modified since the previous packaging."""
+        key = hashlib.sha1(str(Path(self.path).absolute()).encode()).hexdigest()
+        return self.cache_location / "hash_index" / f"{key}.json"
+
     @property
     def package_path(self):
         """Location to tarball in local cache."""
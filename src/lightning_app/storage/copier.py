@@ -1,14 +1,23 @@
 import concurrent.futures
+import hashlib
+import json
+import os
 import pathlib
+import shutil
 import threading
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass
 from threading import Thread
-from time import time
-from typing import Optional, TYPE_CHECKING, Union
+from time import time, time_ns
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
+from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
 
+from lightning_app.core.constants import RACY_MTIME_SECONDS, STORAGE_TRANSFER_CHUNK_SIZE
 from lightning_app.core.queues import BaseQueue
-from lightning_app.storage.path import _filesystem
+from lightning_app.storage.path import _filesystem, _shared_storage_path
 from lightning_app.storage.requests import _ExistsRequest, _GetRequest
 from lightning_app.utilities.app_helpers import Logger
 
@@ -17,6 +26,12 @@ _PathRequest = Union[_GetRequest, _ExistsRequest]
 _logger = Logger(__name__)
 
 num_workers = 8
+_MANIFEST_VERSION = 1
+# The entries of the local files hashed or written by this process, keyed by path along with their size, modification
+# time, change time and inode, the least recently used ones being evicted past `_MAX_DIGESTS`.
+_digests: "OrderedDict[str, Tuple[Tuple[int, ...], Dict[str, Any]]]" = OrderedDict()
+_digests_lock = threading.Lock()
+_MAX_DIGESTS = 10_000
 if TYPE_CHECKING:
     import lightning_app
 
@@ -39,6 +54,9 @@ class _Copier(Thread):
             will send a response to this queue whenever a requested copy has finished.
     """
 
+    # The amount of requests processed at the same time.
+    num_concurrent_requests = 4
+
     def __init__(
         self, work: "lightning_app.LightningWork", copy_request_queue: "BaseQueue", copy_response_queue: "BaseQueue"
     ) -> None:
@@ -47,12 +65,16 @@ class _Copier(Thread):
         self.copy_request_queue = copy_request_queue
         self.copy_response_queue = copy_response_queue
         self._exit_event = threading.Event()
-        self._sleep_time = 0.1
+        # The requests of the same object are processed one at a time, as they copy to the same shared directory.
+        self._locks: Dict[str, threading.Lock] = {}
 
     def run(self) -> None:
-        while not self._exit_event.is_set():
-            self._exit_event.wait(self._sleep_time)
-            self.run_once()
+        # The requests are processed concurrently, so a large transfer doesn't hold back the requests queued after it
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.num_concurrent_requests) as executor:
+            while not self._exit_event.is_set():
+                request: _PathRequest = self.copy_request_queue.get()  # blocks until we get a request
+                if request is not None:
+                    executor.submit(self._process_request, request).add_done_callback(_log_exception)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -60,7 +82,13 @@ class _Copier(Thread):
 
     def run_once(self):
         request: _PathRequest = self.copy_request_queue.get()  # blocks until we get a request
+        self._process_request(request)
+
+    def _process_request(self, request: _PathRequest) -> None:
+        with self._locks.setdefault(request.hash, threading.Lock()):
+            self._handle_request(request)
 
+    def _handle_request(self, request: _PathRequest) -> None:
         t0 = time()
 
         obj: Optional[lightning_app.storage.Path] = _find_matching_path(self._work, request)
@@ -82,6 +110,12 @@ class _Copier(Thread):
         self.copy_response_queue.put(response)
 
 
+def _log_exception(future: concurrent.futures.Future) -> None:
+    ex = future.exception()
+    if ex is not None:
+        _logger.error("".join(traceback.format_exception(type(ex), ex, ex.__traceback__)))
+
+
 def _find_matching_path(work, request: _GetRequest) -> Optional["lightning_app.storage.Path"]:
     for name in work._paths:
         candidate: lightning_app.storage.Path = getattr(work, name)
@@ -89,44 +123,362 @@ def _find_matching_path(work, request: _GetRequest) -> Optional["lightning_app.s
             return candidate
 
 
-def _copy_files(source_path: pathlib.Path, destination_path: pathlib.Path) -> None:
+def _copy_files(source_path: pathlib.Path, destination_path: pathlib.Path) -> "_TransferStats":
     """Copy files from one path to another.
 
     The source path must either be an existing file or folder. If the source is a folder, the destination path is
     interpreted as a folder as well. If the source is a file, the destination path is interpreted as a file too.
 
-    Files in a folder are copied recursively and efficiently using multiple threads.
+    Files in a folder are copied recursively and efficiently using multiple threads. The copy is incremental: the
+    files whose content the destination already has are skipped, and when copying a folder, a manifest describing the
+    copied files is stored in the shared storage so consumers can skip them as well, see :func:`_get_files`.
     """
     fs = _filesystem()
+    is_local = isinstance(fs, LocalFileSystem)
 
-    def _copy(from_path: pathlib.Path, to_path: pathlib.Path) -> Optional[Exception]:
+    if not source_path.exists():
+        # Let the filesystem raise the error
+        if is_local:
+            fs.makedirs(str(destination_path.parent), exist_ok=True)
+        fs.put(str(source_path), str(destination_path))
+        return _TransferStats()
+
+    # A single file doesn't get a manifest, which would cost more round-trips than it saves.
+    is_dir = source_path.is_dir()
+    # The local files which aren't at the destination yet are hashed while being copied, rather than beforehand.
+    is_copied = (lambda relpath: _join(destination_path, relpath).exists()) if is_local else None
+    files = _build_manifest(source_path, is_copied)
+    previous_files = _read_manifest(fs, destination_path) if is_dir else None
+
+    if is_local:
+
+        def _current(path: pathlib.Path, _) -> Optional[Dict[str, Any]]:
+            return _digest(path) if path.is_file() else None
+
+    else:
+        # The files described by the previous manifest are only trusted if they still exist with the same size.
+        previous_files = previous_files or {}
+        sizes = _remote_sizes(fs, destination_path) if previous_files else {}
+
+        def _current(_, relpath: str) -> Optional[Dict[str, Any]]:
+            entry = previous_files.get(relpath)
+            return entry if entry is not None and sizes.get(relpath) == entry["size"] else None
+
+    def _copy(from_path: pathlib.Path, to_path: pathlib.Path, entry: Dict, current: Optional[Dict]) -> int:
         _logger.debug(f"Copying {str(from_path)} -> {str(to_path)}")
 
-        try:
-            # NOTE: S3 does not have a concept of directories, so we do not need to create one.
-            if isinstance(fs, LocalFileSystem):
-                fs.makedirs(str(to_path.parent), exist_ok=True)
+        # NOTE: S3 does not have a concept of directories, so we do not need to create one.
+        if is_local:
+            fs.makedirs(str(to_path.parent), exist_ok=True)
+            if "hash" not in entry:
+                entry.update(_copy_digest(from_path, to_path))
+                return entry["size"]
+            num_bytes = _copy_chunks(from_path, to_path, entry, current)
+            if num_bytes is None:
+                fs.put(str(from_path), str(to_path), recursive=False)
+                num_bytes = entry["size"]
+            _remember_digest(to_path, entry)
+            return num_bytes
+
+        fs.put(str(from_path), str(to_path), recursive=False)
+        return entry["size"]
+
+    # NOTE: Cannot use `S3FileSystem.put(recursive=True)` because it tries to access parent directories
+    #       which it does not have access to.
+    stats = _transfer(files, source_path, destination_path, _current, _copy)
+    if is_dir and files != previous_files:
+        _write_manifest(fs, destination_path, files)
+    _logger.debug(f"Copied {source_path} -> {destination_path}: {stats}")
+    return stats
+
+
+def _get_files(
+    fs: AbstractFileSystem, source_path: pathlib.Path, destination_path: pathlib.Path, files: Dict[str, Dict]
+) -> "_TransferStats":
+    """Copy the files described by the manifest ``files`` from the shared storage to the local filesystem.
+
+    The local files having the same content are skipped, and the local files which aren't part of the manifest are
+    removed, so the destination ends up with the same content as the source.
+    """
+    is_file = list(files) == ["."]
+    if is_file and destination_path.is_dir():
+        shutil.rmtree(destination_path)
+    elif not is_file and destination_path.is_file():
+        destination_path.unlink()
+
+    if not is_file:
+        destination_path.mkdir(parents=True, exist_ok=True)
+        for file in [file for file in destination_path.rglob("*") if file.is_file()]:
+            if file.relative_to(destination_path).as_posix() not in files:
+                file.unlink()
+
+    def _current(path: pathlib.Path, _) -> Optional[Dict[str, Any]]:
+        return _digest(path) if path.is_file() else None
+
+    def _copy(from_path: pathlib.Path, to_path: pathlib.Path, entry: Dict, current: Optional[Dict]) -> int:
+        _logger.debug(f"Copying {str(from_path)} -> {str(to_path)}")
+        to_path.parent.mkdir(parents=True, exist_ok=True)
+        num_bytes = _copy_chunks(from_path, to_path, entry, current) if isinstance(fs, LocalFileSystem) else None
+        if num_bytes is None:
+            fs.get(str(from_path), str(to_path), recursive=False)
+            num_bytes = entry["size"]
+        _remember_digest(to_path, entry)
+        return num_bytes
+
+    stats = _transfer(files, source_path, destination_path, _current, _copy)
+    _logger.debug(f"Copied {source_path} -> {destination_path}: {stats}")
+    return stats
+
+
+@dataclass
+class _TransferStats:
+    """The number of files and bytes copied, and skipped because the destination already had their content."""
+
+    files_transferred: int = 0
+    files_skipped: int = 0
+    bytes_transferred: int = 0
+    bytes_skipped: int = 0
+
+
+def _transfer(
+    files: Dict[str, Dict],
+    source_path: pathlib.Path,
+    destination_path: pathlib.Path,
+    current: Callable[[pathlib.Path, str], Optional[Dict]],
+    copy: Callable[[pathlib.Path, pathlib.Path, Dict, Optional[Dict]], int],
+) -> _TransferStats:
+    """Copy the files whose content differs from the one at the destination using multiple threads.
 
-            fs.put(str(from_path), str(to_path), recursive=False)
+    Args:
+        files: The manifest of the source.
+        source_path: The source file or folder.
+        destination_path: The destination file or folder.
+        current: Returns the manifest entry of a destination file given its path and relative path, if it exists.
+        copy: Copies a file given its source and destination paths, its manifest entry and the one of the destination
+            file. Returns the number of bytes written.
+    """
+    stats = _TransferStats()
+    to_copy = []
+    for relpath, entry in files.items():
+        to_path = _join(destination_path, relpath)
+        current_entry = current(to_path, relpath)
+        if current_entry is not None and current_entry["hash"] == entry.get("hash"):
+            stats.files_skipped += 1
+            stats.bytes_skipped += entry["size"]
+        else:
+            to_copy.append((_join(source_path, relpath), to_path, entry, current_entry))
+
+    def _copy(args: Tuple) -> Union[int, Exception]:
+        try:
+            return copy(*args)
         except Exception as e:
             # Return the exception so that it can be handled in the main thread
             return e
 
-    # NOTE: Cannot use `S3FileSystem.put(recursive=True)` because it tries to access parent directories
-    #       which it does not have access to.
-    if source_path.is_dir():
-        src = [file for file in source_path.rglob("*") if file.is_file()]
-        dst = [destination_path / file.relative_to(source_path) for file in src]
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        results = list(executor.map(_copy, to_copy))
+
+    # Raise the first exception found
+    exception = next((e for e in results if isinstance(e, Exception)), None)
+    if exception:
+        raise exception
+
+    stats.files_transferred = len(to_copy)
+    stats.bytes_transferred = sum(results)
+    stats.bytes_skipped += sum(entry["size"] for _, _, entry, _ in to_copy) - stats.bytes_transferred
+    return stats
+
 
-        with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
-            results = executor.map(_copy, src, dst)
+def _join(root: pathlib.Path, relpath: str) -> pathlib.Path:
+    return root if relpath == "." else root / relpath
 
-        # Raise the first exception found
-        exception = next((e for e in results if isinstance(e, Exception)), None)
-        if exception:
-            raise exception
+
+def _digest(path: pathlib.Path) -> Dict[str, Any]:
+    """Returns the manifest entry of a local file: its size, modification time and content hash.
+
+    The files are hashed by chunks of ``STORAGE_TRANSFER_CHUNK_SIZE`` bytes, whose hashes are kept for the large files
+    along with the chunk size to only rewrite their modified chunks. The entries are cached until the file changes, see
+    :func:`_remember_digest`.
+    """
+    cached = _cached_digest(path)
+    if cached is not None:
+        return cached
+    hashed_at_ns = time_ns()
+    stat = path.stat()
+    with open(path, "rb") as f:
+        entry = _hash_file(f)
+    return _remember_digest(path, entry, stat, hashed_at_ns)
+
+
+def _copy_digest(source_path: pathlib.Path, destination_path: pathlib.Path) -> Dict[str, Any]:
+    """Copies a local file while hashing it, so it is only read once, and returns its manifest entry."""
+    hashed_at_ns = time_ns()
+    stat = source_path.stat()
+    with open(source_path, "rb") as src, open(destination_path, "wb") as dst:
+        entry = _hash_file(src, dst)
+    _remember_digest(destination_path, entry)
+    return _remember_digest(source_path, entry, stat, hashed_at_ns)
+
+
+def _hash_file(f: BinaryIO, dst: Optional[BinaryIO] = None) -> Dict[str, Any]:
+    """Hashes the content of a file, writing it to ``dst`` along the way if given."""
+    chunk_size = STORAGE_TRANSFER_CHUNK_SIZE
+    file_hash = hashlib.sha256()
+    chunks: List[str] = []
+    size = 0
+    while True:
+        data = f.read(chunk_size or 1024 * 1024)
+        if not data:
+            break
+        size += len(data)
+        if dst is not None:
+            dst.write(data)
+        if chunk_size:
+            chunks.append(hashlib.sha256(data).hexdigest())
+        else:
+            file_hash.update(data)
+
+    if chunk_size:
+        file_hash.update("".join(chunks).encode())
+    entry = {"size": size, "hash": file_hash.hexdigest()}
+    if len(chunks) > 1:
+        entry["chunks"] = chunks
+        entry["chunk_size"] = chunk_size
+    return entry
+
+
+def _digest_key(stat: os.stat_result) -> Tuple[int, ...]:
+    # The change time and the inode also catch the modification times set back and the files replaced
+    return stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino
+
+
+def _cached_digest(path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    key = str(path.absolute())
+    with _digests_lock:
+        cached = _digests.get(key)
+        if cached is None or cached[0] != _digest_key(path.stat()):
+            return None
+        _digests.move_to_end(key)
+        return cached[1]
+
+
+def _remember_digest(
+    path: pathlib.Path, entry: Dict[str, Any], stat: Optional[os.stat_result] = None, hashed_at_ns: int = 0
+) -> Dict[str, Any]:
+    """Caches the manifest entry of a file which was just hashed, or written by this process if ``stat`` isn't
+    given.
+
+    A hashed file modified less than ``RACY_MTIME_SECONDS`` before ``hashed_at_ns`` could still be rewritten with the
+    same size within the granularity of its modification time, so its entry isn't cached.
+    """
+    is_racy = stat is not None and stat.st_mtime_ns >= hashed_at_ns - RACY_MTIME_SECONDS * 10**9
+    stat = stat or path.stat()
+    entry = {**entry, "mtime": stat.st_mtime}
+    if is_racy:
+        return entry
+    key = str(path.absolute())
+    with _digests_lock:
+        _digests[key] = (_digest_key(stat), entry)
+        _digests.move_to_end(key)
+        while len(_digests) > _MAX_DIGESTS:
+            _digests.popitem(last=False)
+    return entry
+
+
+def _stat_entry(path: pathlib.Path) -> Dict[str, Any]:
+    """Returns the manifest entry of a local file without its hash, which gets computed while copying it."""
+    return _cached_digest(path) or {"size": path.stat().st_size}
+
+
+def _build_manifest(path: pathlib.Path, is_copied: Optional[Callable[[str], bool]] = None) -> Dict[str, Dict]:
+    """Returns the manifest of a local file or folder, mapping the relative path of each file to its entry.
+
+    A file is described by the relative path ``"."``. The files for which ``is_copied`` returns ``False`` aren't
+    hashed, as there is nothing to compare them with: their entries only have a size until they get copied with
+    :func:`_copy_digest`.
+    """
+    if not path.is_dir():
+        files = {".": path}
     else:
-        if isinstance(fs, LocalFileSystem):
-            fs.makedirs(str(destination_path.parent), exist_ok=True)
+        files = {file.relative_to(path).as_posix(): file for file in sorted(path.rglob("*")) if file.is_file()}
 
-        fs.put(str(source_path), str(destination_path))
+    def _entry(relpath: str) -> Dict[str, Any]:
+        if is_copied is None or is_copied(relpath):
+            return _digest(files[relpath])
+        return _stat_entry(files[relpath])
+
+    if len(files) == 1:
+        return {relpath: _entry(relpath) for relpath in files}
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        return dict(zip(files, executor.map(_entry, files)))
+
+
+def _manifest_path(destination_path: pathlib.Path) -> pathlib.Path:
+    # The manifests are kept apart from the files, so they don't show up when listing the shared storage.
+    name = hashlib.sha256(str(destination_path).encode()).hexdigest()
+    return _shared_storage_path() / ".manifests" / f"{name}.json"
+
+
+def _read_manifest(fs: AbstractFileSystem, destination_path: pathlib.Path) -> Optional[Dict[str, Dict]]:
+    """Returns the manifest of the files copied to the given path of the shared storage or ``None`` if there is
+    none."""
+    try:
+        manifest = json.loads(fs.cat_file(str(_manifest_path(destination_path))))
+    except (OSError, ValueError, TypeError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        return None
+    return manifest["files"]
+
+
+def _write_manifest(fs: AbstractFileSystem, destination_path: pathlib.Path, files: Dict[str, Dict]) -> None:
+    path = _manifest_path(destination_path)
+    if isinstance(fs, LocalFileSystem):
+        fs.makedirs(str(path.parent), exist_ok=True)
+    fs.pipe_file(str(path), json.dumps({"version": _MANIFEST_VERSION, "files": files}).encode())
+
+
+def _delete_manifest(fs: AbstractFileSystem, destination_path: pathlib.Path) -> None:
+    """Deletes the manifest of the files copied to the given path of the shared storage, if there is one."""
+    try:
+        fs.rm(str(_manifest_path(destination_path)))
+    except (FileNotFoundError, OSError):
+        pass
+
+
+def _remote_sizes(fs: AbstractFileSystem, destination_path: pathlib.Path) -> Dict[str, int]:
+    """Lists the files under the given path of a remote filesystem with a single request."""
+    root = fs._strip_protocol(str(destination_path)).rstrip("/")
+    sizes = {}
+    for name, info in fs.find(root, detail=True).items():
+        relpath = "." if name == root else name[len(root) + 1 :]
+        sizes[relpath] = info["size"]
+    return sizes
+
+
+def _copy_chunks(
+    source_path: pathlib.Path, destination_path: pathlib.Path, entry: Dict, current: Optional[Dict]
+) -> Optional[int]:
+    """Rewrites the chunks of the destination file which differ from the source file in place.
+
+    Returns the number of bytes written or ``None`` if the files weren't both hashed by chunks of the same size, e.g.
+    when ``STORAGE_TRANSFER_CHUNK_SIZE`` differs between the processes which wrote and read them.
+    """
+    chunks = entry.get("chunks")
+    current_chunks = (current or {}).get("chunks")
+    chunk_size = entry.get("chunk_size")
+    if not chunks or not current_chunks or not chunk_size or current.get("chunk_size") != chunk_size:
+        return None
+
+    num_bytes = 0
+    with open(source_path, "rb") as src, open(destination_path, "r+b") as dst:
+        for index, chunk_hash in enumerate(chunks):
+            if index < len(current_chunks) and current_chunks[index] == chunk_hash:
+                continue
+            src.seek(index * chunk_size)
+            data = src.read(chunk_size)
+            dst.seek(index * chunk_size)
+            dst.write(data)
+            num_bytes += len(data)
+        dst.truncate(entry["size"])
+    return num_bytes
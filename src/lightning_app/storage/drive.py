@@ -2,13 +2,49 @@ import os
 import pathlib
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from time import sleep, time
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from time import perf_counter, sleep, time
+from typing import Dict, List, Optional, Tuple, Union
 
+from lightning_app.core.constants import DRIVE_LIST_CACHE_TTL
 from lightning_app.storage.path import _filesystem, _shared_storage_path, LocalFileSystem
 from lightning_app.utilities.component import _is_flow_context
 
+# The maximum amount of files transferred concurrently by `Drive.put_many` and `Drive.get_many`.
+_MAX_WORKERS = 8
+
+
+@dataclass
+class _DriveStats:
+    """The calls of a Drive to its filesystem and the bytes it transferred."""
+
+    num_puts: int = 0
+    num_gets: int = 0
+    num_lists: int = 0
+    num_list_cache_hits: int = 0
+    bytes_put: int = 0
+    bytes_got: int = 0
+    put_duration: float = 0.0
+    get_duration: float = 0.0
+
+    @property
+    def put_throughput(self) -> float:
+        """The bytes put per second."""
+        return self.bytes_put / self.put_duration if self.put_duration else 0.0
+
+    @property
+    def get_throughput(self) -> float:
+        """The bytes got per second."""
+        return self.bytes_got / self.get_duration if self.get_duration else 0.0
+
+
+def _local_size(path: pathlib.Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
 
 class Drive:
 
@@ -66,6 +102,9 @@ class Drive:
         self.component_name = component_name
         self.allow_duplicates = allow_duplicates
         self.fs = _filesystem()
+        self.stats = _DriveStats()
+        # the paths listed by the filesystem along with the time of the listing
+        self._listings: Dict[str, Tuple[float, List[str]]] = {}
 
     @property
     def root(self) -> pathlib.Path:
@@ -85,22 +124,24 @@ class Drive:
         Arguments:
             path: The relative path to your files to be added to the Drive.
         """
-        if not self.component_name:
-            raise Exception("The component name needs to be known to put a path to the Drive.")
-        if _is_flow_context():
-            raise Exception("The flow isn't allowed to put files into a Drive.")
+        self._check_put(path)
+        t0 = perf_counter()
+        num_bytes = self._put(path)
+        self._record_puts(1, num_bytes, perf_counter() - t0)
 
-        self._validate_path(path)
+    def put_many(self, paths: List[str], max_workers: int = _MAX_WORKERS) -> None:
+        """This method enables to put several files to the Drive concurrently, in a blocking fashion.
 
-        if not self.allow_duplicates:
-            self._check_for_allow_duplicates(path)
-
-        from lightning_app.storage.copier import _copy_files
-
-        src = pathlib.Path(os.path.join(self.root_folder, path)).resolve()
-        dst = self._to_shared_path(path, component_name=self.component_name)
-
-        _copy_files(src, dst)
+        Arguments:
+            paths: The relative paths to your files to be added to the Drive.
+            max_workers: The maximum amount of files put concurrently.
+        """
+        for path in paths:
+            self._check_put(path)
+        t0 = perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            num_bytes = sum(executor.map(self._put, paths))
+        self._record_puts(len(paths), num_bytes, perf_counter() - t0)
 
     def list(self, path: Optional[str] = ".", component_name: Optional[str] = None) -> List[str]:
         """This method enables to list files under the provided path from the Drive in a blocking fashion.
@@ -133,9 +174,8 @@ class Drive:
         sep = "\\" if sys.platform == "win32" else "/"
         prefix_len = len(str(self.root).split(sep))
         for p in paths:
-            if self.fs.exists(p):
-                for f in self.fs.ls(p):
-                    files.append(str(pathlib.Path(*pathlib.Path(f).parts[prefix_len:])))
+            for f in self._ls(p):
+                files.append(str(pathlib.Path(*pathlib.Path(f).parts[prefix_len:])))
         return files
 
     def get(
@@ -157,42 +197,33 @@ class Drive:
         if _is_flow_context():
             raise Exception("The flow isn't allowed to get files from a Drive.")
 
-        if component_name:
-            shared_path = self._to_shared_path(
-                path,
-                component_name=component_name,
-            )
-            if timeout:
-                start_time = time()
-                while not self.fs.exists(shared_path):
-                    sleep(1)
-                    if (time() - start_time) > timeout:
-                        raise Exception(f"The following {path} wasn't found in {timeout} seconds")
-                    break
+        t0 = perf_counter()
+        num_bytes = self._get_path(path, component_name, timeout, overwrite)
+        self._record_gets(1, num_bytes, perf_counter() - t0)
 
-            self._get(
-                self.fs,
-                shared_path,
-                pathlib.Path(os.path.join(self.root_folder, path)).resolve(),
-                overwrite=overwrite,
-            )
-        else:
-            if timeout:
-                start_time = time()
-                while True:
-                    if (time() - start_time) > timeout:
-                        raise Exception(f"The following {path} wasn't found in {timeout} seconds.")
-                    match = self._find_match(path)
-                    if match is None:
-                        sleep(1)
-                        continue
-                    break
-            else:
-                match = self._find_match(path)
-                if not match:
-                    raise Exception(f"We didn't find any match for the associated {path}.")
+    def get_many(
+        self,
+        paths: List[str],
+        component_name: Optional[str] = None,
+        overwrite: bool = False,
+        max_workers: int = _MAX_WORKERS,
+    ) -> None:
+        """This method enables to get several files from the Drive concurrently, in a blocking fashion.
 
-            self._get(self.fs, match, pathlib.Path(os.path.join(self.root_folder, path)).resolve(), overwrite=overwrite)
+        Arguments:
+            paths: The relative paths you want to get from the Drive.
+            component_name: By default, the Drive get the matching files across all components.
+                If you provide a component name, the matching is specific to this component.
+            overwrite: Whether to override the provided paths if they exist.
+            max_workers: The maximum amount of files got concurrently.
+        """
+        if _is_flow_context():
+            raise Exception("The flow isn't allowed to get files from a Drive.")
+
+        t0 = perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            num_bytes = sum(executor.map(lambda path: self._get_path(path, component_name, None, overwrite), paths))
+        self._record_gets(len(paths), num_bytes, perf_counter() - t0)
 
     def delete(self, path: str) -> None:
         """This method enables to delete files under the provided path from the Drive in a blocking fashion. Only
@@ -201,6 +232,8 @@ class Drive:
         Arguments:
             path: The relative path you want to delete files from the Drive.
         """
+        from lightning_app.storage.copier import _delete_manifest
+
         if not self.component_name:
             raise Exception("The component name needs to be known to delete a path to the Drive.")
 
@@ -209,7 +242,9 @@ class Drive:
             component_name=self.component_name,
         )
         if self.fs.exists(str(shared_path)):
-            self.fs.rm(str(shared_path))
+            self.fs.rm(str(shared_path), recursive=True)
+            _delete_manifest(self.fs, shared_path)
+            self._listings.clear()
         else:
             raise Exception(f"The file {path} doesn't exists in the component_name space {self.component_name}.")
 
@@ -244,12 +279,92 @@ class Drive:
 
     def _collect_component_names(self) -> List[str]:
         sep = "/"
-        if self.fs.exists(self.drive_root):
-            # Invalidate cache before running ls in case new directories have been added
-            # TODO: Re-evaluate this - may lead to performance issues
-            self.fs.invalidate_cache()
-            return [str(p.split(sep)[-1]) for p in self.fs.ls(self.drive_root)]
-        return []
+        return [str(p.split(sep)[-1]) for p in self._ls(self.drive_root)]
+
+    def _ls(self, path: Union[str, pathlib.Path]) -> List[str]:
+        """Lists the provided path of the filesystem, or returns its listing if it is less than
+        ``LIGHTNING_DRIVE_LIST_CACHE_TTL`` seconds old and the Drive didn't modify it since."""
+        key = str(path)
+        listing = self._listings.get(key)
+        if listing is not None and time() - listing[0] < DRIVE_LIST_CACHE_TTL:
+            self.stats.num_list_cache_hits += 1
+            return listing[1]
+
+        self.stats.num_lists += 1
+        # Invalidate the cache of the filesystem in case new files have been added
+        self.fs.invalidate_cache(key)
+        files = self.fs.ls(key) if self.fs.exists(key) else []
+        self._listings[key] = (time(), files)
+        return files
+
+    def _check_put(self, path: str) -> None:
+        if not self.component_name:
+            raise Exception("The component name needs to be known to put a path to the Drive.")
+        if _is_flow_context():
+            raise Exception("The flow isn't allowed to put files into a Drive.")
+
+        self._validate_path(path)
+
+        if not self.allow_duplicates:
+            self._check_for_allow_duplicates(path)
+
+    def _put(self, path: str) -> int:
+        from lightning_app.storage.copier import _copy_files
+
+        src = pathlib.Path(os.path.join(self.root_folder, path)).resolve()
+        dst = self._to_shared_path(path, component_name=self.component_name)
+
+        stats = _copy_files(src, dst)
+        self._listings.clear()
+        return stats.bytes_transferred
+
+    def _record_puts(self, num_puts: int, num_bytes: int, duration: float) -> None:
+        self.stats.num_puts += num_puts
+        self.stats.bytes_put += num_bytes
+        self.stats.put_duration += duration
+
+    def _record_gets(self, num_gets: int, num_bytes: int, duration: float) -> None:
+        self.stats.num_gets += num_gets
+        self.stats.bytes_got += num_bytes
+        self.stats.get_duration += duration
+
+    def _get_path(self, path: str, component_name: Optional[str], timeout: Optional[float], overwrite: bool) -> int:
+        """Gets the files under the provided path from the Drive and returns their size."""
+        if component_name:
+            shared_path = self._to_shared_path(
+                path,
+                component_name=component_name,
+            )
+            if timeout:
+                start_time = time()
+                while not self.fs.exists(shared_path):
+                    sleep(1)
+                    if (time() - start_time) > timeout:
+                        raise Exception(f"The following {path} wasn't found in {timeout} seconds")
+                    break
+
+            match = shared_path
+        else:
+            if timeout:
+                start_time = time()
+                while True:
+                    if (time() - start_time) > timeout:
+                        raise Exception(f"The following {path} wasn't found in {timeout} seconds.")
+                    match = self._find_match(path)
+                    if match is None:
+                        # the components which started putting files since the latest listing are listed again
+                        self._listings.clear()
+                        sleep(1)
+                        continue
+                    break
+            else:
+                match = self._find_match(path)
+                if not match:
+                    raise Exception(f"We didn't find any match for the associated {path}.")
+
+        destination = pathlib.Path(os.path.join(self.root_folder, path)).resolve()
+        self._get(self.fs, match, destination, overwrite=overwrite)
+        return _local_size(destination)
 
     def _to_shared_path(self, path: str, component_name: Optional[str] = None) -> pathlib.Path:
         shared_path = self.drive_root
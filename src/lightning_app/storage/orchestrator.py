@@ -1,9 +1,13 @@
 import os
+import queue
 import threading
+import time
 import traceback
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from queue import Empty
 from threading import Thread
-from typing import Dict, Optional, TYPE_CHECKING, Union
+from typing import Callable, Deque, Dict, Optional, Tuple, TYPE_CHECKING, Union
 
 from lightning_app.core.queues import BaseQueue
 from lightning_app.storage.path import _filesystem, _path_to_work_artifact
@@ -19,10 +23,49 @@ _PathRequest = Union[_GetRequest, _ExistsRequest]
 _PathResponse = Union[_ExistsResponse, _GetResponse]
 _logger = Logger(__name__)
 
+# The maximum amount of elements read at once from the queue of a work.
+_MAX_EVENTS = 64
+
+
+@dataclass
+class _TransferMetrics:
+    """The durations of the file transfers completed through the orchestrator, in seconds.
+
+    The queue wait is the time a request spent in the queues between the orchestrator and the Copier of the source
+    Work, and the transfer time is the time the Copier spent processing it.
+    """
+
+    num_transfers: int = 0
+    queue_wait: float = 0.0
+    transfer_time: float = 0.0
+    max_queue_wait: float = 0.0
+    max_transfer_time: float = 0.0
+
+    def update(self, queue_wait: float, transfer_time: float) -> None:
+        self.num_transfers += 1
+        self.queue_wait += queue_wait
+        self.transfer_time += transfer_time
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.max_transfer_time = max(self.max_transfer_time, transfer_time)
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.queue_wait / self.num_transfers if self.num_transfers else 0.0
+
+    @property
+    def mean_transfer_time(self) -> float:
+        return self.transfer_time / self.num_transfers if self.num_transfers else 0.0
+
 
 class StorageOrchestrator(Thread):
     """The StorageOrchestrator processes file transfer requests from Work that need file(s) from other Work.
 
+    A listener thread blocks on each of the queues read by the orchestrator and forwards the elements it receives to a
+    single channel, so the requests are processed as soon as they arrive, whatever the number of Works. The copy
+    responses of a Work are only listened to once a file was requested from it, so the idle Works cost a single blocked
+    thread each. The requests aren't serialized per Work: the transfers requested to different Works, or by different
+    Works, run concurrently.
+
     Args:
         app: A reference to the ``LightningApp`` which holds the copy request- and response queues for storage.
         request_queues: A dictionary with Queues connected to consumer Work. The Queue will contain transfer requests
@@ -49,13 +92,20 @@ class StorageOrchestrator(Thread):
         self.response_queues = response_queues
         self.copy_request_queues = copy_request_queues
         self.copy_response_queues = copy_response_queues
-        self.waiting_for_response: Dict[str, str] = {}
+        # the times at which the pending transfers were requested, by destination, source, hash and name
+        self.waiting_for_response: Dict[Tuple[str, str, str, str], Deque[float]] = defaultdict(deque)
+        self.metrics = _TransferMetrics()
         self._validate_queues()
         self._exit_event = threading.Event()
+        self._events: "queue.Queue[Tuple[Callable, str, object, float]]" = queue.Queue()
+        # the listener threads, by work name and handler name
+        self._listeners: Dict[Tuple[str, str], Thread] = {}
 
-        # Note: Use different sleep time locally and in the cloud
-        # to reduce queue calls.
+        # Note: The queues of the new Works are listened to within this interval. Use different intervals locally
+        # and in the cloud to reduce queue calls.
         self._sleep_time = 0.1 if "LIGHTNING_APP_STATE_URL" not in os.environ else 2
+        # The listeners block on their queue up to this timeout, which only bounds the time to notice the exit.
+        self._listen_timeout = 10 * self._sleep_time
         self.fs = _filesystem()
 
     def _validate_queues(self):
@@ -68,114 +118,147 @@ class StorageOrchestrator(Thread):
 
     def run(self) -> None:
         while not self._exit_event.is_set():
-            for work_name in list(self.request_queues.keys()):
-                try:
-                    self.run_once(work_name)
-                except Exception:
-                    _logger.error(traceback.format_exc())
-            self._exit_event.wait(self._sleep_time)
+            self._start_listeners()
+            self.run_once(timeout=self._sleep_time)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
         super().join(timeout)
 
-    def run_once(self, work_name: str) -> None:
-        if work_name not in self.waiting_for_response:
-            # check if there is a new request from this work for a file transfer
-            # there can only be one pending request per work
-            request_queue = self.request_queues[work_name]
+    def run_once(self, timeout: Optional[float] = None) -> None:
+        """Processes the requests and responses received by the listeners, waiting up to ``timeout`` seconds for the
+        first one."""
+        try:
+            events = [self._events.get(timeout=timeout)]
+        except Empty:
+            return
+        while True:
             try:
-                request: _PathRequest = request_queue.get(timeout=0)  # this should not block
+                events.append(self._events.get_nowait())
             except Empty:
-                pass
-            else:
-                request.destination = work_name
-                source_work = self.app.get_component_by_name(request.source)
-                maybe_artifact_path = str(_path_to_work_artifact(request.path, source_work))
-
-                if self.fs.exists(maybe_artifact_path):
-                    # First check if the shared filesystem has the requested file stored as an artifact
-                    # If so, we will let the destination Work access this file directly
-                    # NOTE: This is NOT the right thing to do, because the Work could still be running and producing
-                    # a newer version of the requested file, but we can't rely on the Work status to be accurate
-                    # (at the moment)
-                    if isinstance(request, _GetRequest):
-                        response = _GetResponse(
-                            source=request.source,
-                            name=request.name,
-                            path=maybe_artifact_path,
-                            hash=request.hash,
-                            destination=request.destination,
-                        )
-                    if isinstance(request, _ExistsRequest):
-                        response = _ExistsResponse(
-                            source=request.source,
-                            path=maybe_artifact_path,
-                            name=request.name,
-                            hash=request.hash,
-                            destination=request.destination,
-                            exists=True,
-                        )
-                    response_queue = self.response_queues[response.destination]
-                    response_queue.put(response)
-                elif source_work.status.stage not in (
-                    WorkStageStatus.NOT_STARTED,
-                    WorkStageStatus.STOPPED,
-                    WorkStageStatus.FAILED,
-                ):
-                    _logger.debug(
-                        f"Request for File Transfer received from {work_name}: {request}. Sending request to"
-                        f" {request.source} to copy the file."
-                    )
-                    # The Work is running, and we can send a request to the copier for moving the file to the
-                    # shared storage
-                    self.copy_request_queues[request.source].put(request)
-                    # Store a destination to source mapping.
-                    self.waiting_for_response[work_name] = request.source
-                else:
-                    if isinstance(request, _GetRequest):
-                        response = _GetResponse(
-                            source=request.source,
-                            path=request.path,
-                            name=request.name,
-                            hash=request.hash,
-                            destination=request.destination,
-                        )
-                    if isinstance(request, _ExistsRequest):
-                        response = _ExistsResponse(
-                            source=request.source,
-                            path=request.path,
-                            hash=request.hash,
-                            destination=request.destination,
-                            exists=False,
-                            name=request.name,
-                        )
-                    response.exception = FileNotFoundError(
-                        "The work is not running and the requested object is not available in the artifact store."
-                    )
-                    response_queue = self.response_queues[response.destination]
-                    response_queue.put(response)
-
-        # Check the current work is within the sources.
-        # It is possible to have multiple destination targeting
-        # the same source concurrently.
-        if work_name in self.waiting_for_response.values():
-
-            # check if the current work has responses for file transfers to other works.
-            copy_response_queue = self.copy_response_queues[work_name]
+                break
+        for handler, work_name, item, received_at in events:
+            try:
+                handler(work_name, item, received_at)
+            except Exception:
+                _logger.error(traceback.format_exc())
+
+    def _start_listeners(self) -> None:
+        for work_name in list(self.request_queues.keys()):
+            self._start_listener(work_name, self.request_queues, self._on_request)
+
+    def _start_listener(self, work_name: str, queues: Dict[str, BaseQueue], handler: Callable) -> None:
+        key = (work_name, handler.__name__)
+        if key in self._listeners:
+            return
+        listener = Thread(target=self._listen, args=(queues[work_name], handler, work_name), daemon=True)
+        self._listeners[key] = listener
+        listener.start()
+
+    def _listen(self, source_queue: BaseQueue, handler: Callable, work_name: str) -> None:
+        while not self._exit_event.is_set():
             try:
-                # check if the share-point file manager has confirmed a copy request
-                response: _PathResponse = copy_response_queue.get(timeout=0)  # this should not block
+                items = source_queue.get_many(_MAX_EVENTS, timeout=self._listen_timeout)
             except Empty:
-                pass
-            else:
-                _logger.debug(
-                    f"Received confirmation of a completed file copy request from {work_name}:{response}."
-                    f" Sending the confirmation back to {response.destination}."
+                continue
+            except Exception:
+                _logger.error(traceback.format_exc())
+                self._exit_event.wait(self._sleep_time)
+                continue
+            received_at = time.monotonic()
+            for item in items:
+                if item is not None:
+                    self._events.put((handler, work_name, item, received_at))
+
+    def _on_request(self, work_name: str, request: _PathRequest, received_at: float) -> None:
+        request.destination = work_name
+        source_work = self.app.get_component_by_name(request.source)
+        maybe_artifact_path = str(_path_to_work_artifact(request.path, source_work))
+
+        if self.fs.exists(maybe_artifact_path):
+            # First check if the shared filesystem has the requested file stored as an artifact
+            # If so, we will let the destination Work access this file directly
+            # NOTE: This is NOT the right thing to do, because the Work could still be running and producing
+            # a newer version of the requested file, but we can't rely on the Work status to be accurate
+            # (at the moment)
+            if isinstance(request, _GetRequest):
+                response = _GetResponse(
+                    source=request.source,
+                    name=request.name,
+                    path=maybe_artifact_path,
+                    hash=request.hash,
+                    destination=request.destination,
+                )
+            if isinstance(request, _ExistsRequest):
+                response = _ExistsResponse(
+                    source=request.source,
+                    path=maybe_artifact_path,
+                    name=request.name,
+                    hash=request.hash,
+                    destination=request.destination,
+                    exists=True,
                 )
-                destination = response.destination
-                assert response.source == work_name
-                response_queue = self.response_queues[destination]
-                response_queue.put(response)
-                # the request has been processed, allow new requests to come in for the destination work
-                del self.waiting_for_response[destination]
+            response_queue = self.response_queues[response.destination]
+            response_queue.put(response)
+        elif source_work.status.stage not in (
+            WorkStageStatus.NOT_STARTED,
+            WorkStageStatus.STOPPED,
+            WorkStageStatus.FAILED,
+        ):
+            _logger.debug(
+                f"Request for File Transfer received from {work_name}: {request}. Sending request to"
+                f" {request.source} to copy the file."
+            )
+            # The Work is running, and we can send a request to the copier for moving the file to the
+            # shared storage
+            self.waiting_for_response[self._key(request)].append(received_at)
+            self._start_listener(request.source, self.copy_response_queues, self._on_copy_response)
+            self.copy_request_queues[request.source].put(request)
+        else:
+            if isinstance(request, _GetRequest):
+                response = _GetResponse(
+                    source=request.source,
+                    path=request.path,
+                    name=request.name,
+                    hash=request.hash,
+                    destination=request.destination,
+                )
+            if isinstance(request, _ExistsRequest):
+                response = _ExistsResponse(
+                    source=request.source,
+                    path=request.path,
+                    hash=request.hash,
+                    destination=request.destination,
+                    exists=False,
+                    name=request.name,
+                )
+            response.exception = FileNotFoundError(
+                "The work is not running and the requested object is not available in the artifact store."
+            )
+            response_queue = self.response_queues[response.destination]
+            response_queue.put(response)
+
+    def _on_copy_response(self, work_name: str, response: _PathResponse, received_at: float) -> None:
+        _logger.debug(
+            f"Received confirmation of a completed file copy request from {work_name}:{response}."
+            f" Sending the confirmation back to {response.destination}."
+        )
+        assert response.source == work_name
+
+        key = self._key(response)
+        if self.waiting_for_response.get(key):
+            requested_at = self.waiting_for_response[key].popleft()
+            if not self.waiting_for_response[key]:
+                del self.waiting_for_response[key]
+            transfer_time = response.timedelta or 0.0
+            queue_wait = max(received_at - requested_at - transfer_time, 0.0)
+            self.metrics.update(queue_wait, transfer_time)
+            _logger.debug(
+                f"The transfer of {response.name} from {response.source} to {response.destination} waited"
+                f" {queue_wait:.3f}s in the queues and took {transfer_time:.3f}s."
+            )
+        self.response_queues[response.destination].put(response)
+
+    @staticmethod
+    def _key(item: Union[_PathRequest, _PathResponse]) -> Tuple[str, str, str, str]:
+        return item.destination, item.source, item.hash, item.name
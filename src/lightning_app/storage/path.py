@@ -23,6 +23,7 @@ PathlibPath = type(pathlib.Path())  # PosixPath or a WindowsPath depending on th
 
 if TYPE_CHECKING:
     from lightning_app.core.work import LightningWork
+    from lightning_app.storage.copier import _TransferStats
 
 num_workers = 8
 
@@ -85,6 +86,9 @@ class Path(PathlibPath):
         self._request_queue: Optional[BaseQueue] = None
         # response queue: used to receive status message from storage orchestrator
         self._response_queue: Optional[BaseQueue] = None
+        # the stats of the copies made by the last `get()`: into the shared storage, then to the local filesystem
+        self._upload_stats: Optional["_TransferStats"] = None
+        self._download_stats: Optional["_TransferStats"] = None
 
     @property
     def origin_name(self) -> str:
@@ -106,6 +110,24 @@ class Path(PathlibPath):
 
         return self._consumer.name if isinstance(self._consumer, LightningWork) else self._consumer
 
+    @property
+    def upload_stats(self) -> Optional["_TransferStats"]:
+        """The number of files and bytes the origin Work copied to the shared storage during the last :meth:`get`,
+        and skipped because the shared storage already had their content.
+
+        Returns ``None`` if :meth:`get` was not called yet.
+        """
+        return self._upload_stats
+
+    @property
+    def download_stats(self) -> Optional["_TransferStats"]:
+        """The number of files and bytes copied from the shared storage to the local filesystem during the last
+        :meth:`get`, and skipped because the local files already had their content.
+
+        Returns ``None`` if :meth:`get` was not called yet.
+        """
+        return self._download_stats
+
     @property
     def hash(self) -> Optional[str]:
         """The hash of this Path uniquely identifies the file path and the associated origin Work.
@@ -167,6 +189,8 @@ class Path(PathlibPath):
         return response.exists
 
     def get(self, overwrite: bool = False) -> None:
+        from lightning_app.storage.copier import _get_files, _read_manifest, _TransferStats
+
         if _is_flow_context():
             raise RuntimeError("`Path.get()` can only be called from within the `run()` method of LightningWork.")
         if self._request_queue is None or self._response_queue is None:
@@ -195,6 +219,7 @@ class Path(PathlibPath):
         # 2. Wait for the transfer to finish
         response: _GetResponse = self._response_queue.get()  # blocking
         self._validate_get_response(response)
+        self._upload_stats = response.transfer_stats
 
         fs = _filesystem()
 
@@ -203,12 +228,19 @@ class Path(PathlibPath):
             # TODO: Existence check on folder is not enough, files may not be completely transferred yet
             sleep(0.5)
 
+        # 4. Copy the files of a folder which changed since the last transfer, if the shared storage has a manifest
+        is_dir = fs.isdir(response.path)
+        files = _read_manifest(fs, pathlib.Path(response.path)) if is_dir else None
+        if files is not None:
+            self._download_stats = _get_files(fs, pathlib.Path(response.path), pathlib.Path(self.absolute()), files)
+            return
+
         if self.exists_local() and self.is_dir():
             # Delete the directory, otherwise we can't overwrite it
             shutil.rmtree(self)
 
-        # 4. Copy the file from the shared storage to the destination on the local filesystem
-        if fs.isdir(response.path):
+        # 5. Otherwise, copy the file from the shared storage to the destination on the local filesystem
+        if is_dir:
             if isinstance(fs, LocalFileSystem):
                 shutil.copytree(response.path, self.resolve())
             else:
@@ -219,6 +251,11 @@ class Path(PathlibPath):
             _logger.debug(f"Attempting to copy {str(response.path)} -> {str(self.absolute())}")
             fs.get(str(response.path), str(self.absolute()), recursive=False)
 
+        files = [p for p in self.rglob("*") if p.is_file()] if is_dir else [self]
+        self._download_stats = _TransferStats(
+            files_transferred=len(files), bytes_transferred=sum(p.stat().st_size for p in files)
+        )
+
     def to_dict(self) -> dict:
         """Serialize this Path to a dictionary."""
         return dict(
@@ -347,7 +384,7 @@ class Path(PathlibPath):
         )
 
         try:
-            _copy_files(source_path, destination_path)
+            response.transfer_stats = _copy_files(source_path, destination_path)
             _logger.debug(f"All files copied from {request.path} to {response.path}.")
         except Exception as e:
             response.exception = e
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lightning_app.storage.copier import _TransferStats
 
 
 @dataclass
@@ -20,6 +23,7 @@ class _GetResponse:
     destination: str = ""
     exception: Optional[Exception] = None
     timedelta: Optional[float] = None
+    transfer_stats: Optional["_TransferStats"] = None
 
 
 @dataclass
@@ -0,0 +1,130 @@
+"""A local stand-in for the HTTP queue server used by the :class:`~lightning_app.core.queues.HTTPQueue`.
+
+It implements the same routes as the server running in the cloud, plus the long-polling and the batched ``push_many``
+and ``pop_many`` actions, and counts the requests it receives. It is meant for tests and local debugging only.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from lightning_app.core.queues import _pack_frames, _unpack_frames
+
+
+class _HTTPQueueServer:
+    """Serves in-memory queues over HTTP from a background thread.
+
+    Arguments:
+        port: The port to listen on. A free port is picked by default.
+        batching: Whether the long-polling and batched actions are supported. When disabled, the server behaves as a
+            server unaware of them, which is useful to test the fallbacks of the client.
+    """
+
+    def __init__(self, port: int = 0, batching: bool = True) -> None:
+        self.batching = batching
+        self.num_requests = 0
+        self._queues: Dict[str, Deque[bytes]] = defaultdict(deque)
+        self._condition = threading.Condition()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_cls())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "_HTTPQueueServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        with self._condition:
+            # wake up the pending long-polls.
+            self._condition.notify_all()
+
+    def __enter__(self) -> "_HTTPQueueServer":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def push(self, name: str, items: list) -> None:
+        with self._condition:
+            self._queues[name].extend(items)
+            self._condition.notify_all()
+
+    def pop(self, name: str, count: int, wait: float) -> list:
+        """Pops up to ``count`` items, waiting up to ``wait`` seconds for the first one."""
+        deadline = time.monotonic() + wait
+        with self._condition:
+            queue = self._queues[name]
+            while not queue:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+            return [queue.popleft() for _ in range(min(count, len(queue)))]
+
+    def length(self, name: str) -> int:
+        with self._condition:
+            return len(self._queues[name])
+
+    def _handler_cls(self) -> type:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                server.num_requests += 1
+                path = urlparse(self.path).path.strip("/").split("/")
+                if len(path) != 4 or path[0] != "v1" or path[3] != "length":
+                    return self._respond(404)
+                self._respond(200, str(server.length(self._queue_name(path))).encode())
+
+            def do_POST(self) -> None:
+                server.num_requests += 1
+                url = urlparse(self.path)
+                path = url.path.strip("/").split("/")
+                if len(path) != 3 or path[0] != "v1":
+                    return self._respond(404)
+                name = self._queue_name(path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                action = params.get("action")
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                wait = float(params.get("wait", 0)) if server.batching else 0.0
+
+                if action == "push":
+                    server.push(name, [body])
+                    return self._respond(201)
+                if action == "pop":
+                    items = server.pop(name, 1, wait)
+                    return self._respond(200, items[0]) if items else self._respond(204)
+                if action == "push_many" and server.batching:
+                    server.push(name, _unpack_frames(body))
+                    return self._respond(201)
+                if action == "pop_many" and server.batching:
+                    items = server.pop(name, int(params.get("count", 1)), wait)
+                    return self._respond(200, _pack_frames(items)) if items else self._respond(204)
+                self._respond(400)
+
+            def _queue_name(self, path: list) -> str:
+                return f"{path[1]}_{path[2]}"
+
+            def _respond(self, status: int, body: bytes = b"") -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return _Handler
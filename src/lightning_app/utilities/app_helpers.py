@@ -11,10 +11,11 @@ import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, Generator, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import websockets
@@ -23,6 +24,7 @@ from lightning_cloud.openapi import AppinstancesIdBody, Externalv1LightningappIn
 
 import lightning_app
 from lightning_app.utilities.exceptions import LightningAppStateException
+from lightning_app.utilities.json_patch import _json_patch
 from lightning_app.utilities.tree import breadth_first
 
 if TYPE_CHECKING:
@@ -32,6 +34,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The amount of app state versions whose JSON patches are kept to catch up the clients of the state websocket.
+_MAX_STATE_PATCHES = 100
+
 
 @dataclass
 class StateEntry:
@@ -40,6 +45,9 @@ class StateEntry:
     app_state: Mapping = field(default_factory=dict)
     served_state: Mapping = field(default_factory=dict)
     session_id: Optional[str] = None
+    version: int = 0
+    # the JSON patches from the version `i - 1` to `i`, as `(i, patch)` for the latest versions
+    patches: Deque[Tuple[int, List[Dict[str, Any]]]] = field(default_factory=lambda: deque(maxlen=_MAX_STATE_PATCHES))
 
 
 class StateStore(ABC):
@@ -90,6 +98,17 @@ class StateStore(ABC):
         """sets the session id for state of a key 'k'."""
         pass
 
+    @abstractmethod
+    def get_version(self, k: str) -> int:
+        """returns the version of the app state of a key 'k', incremented each time it changes."""
+        pass
+
+    @abstractmethod
+    def get_patches(self, k: str, since_version: int) -> Optional[List[Dict[str, Any]]]:
+        """returns the JSON patches turning the app state of a key 'k' at ``since_version`` into the current one,
+        or None if they aren't available anymore."""
+        pass
+
 
 class InMemoryStateStore(StateStore):
     """In memory simple store to keep track of state through the app REST API."""
@@ -120,9 +139,26 @@ class InMemoryStateStore(StateStore):
                 f"App state size is {state_size} bytes, which is larger than the recommended size "
                 f"of {lightning_app.core.constants.APP_STATE_MAX_SIZE_BYTES}. Please investigate this."
             )
-        self.store[k].app_state = deepcopy(v)
+        entry = self.store[k]
+        patch = _json_patch(entry.app_state, v)
+        entry.app_state = deepcopy(v)
+        if not patch and entry.version:
+            return
+        entry.version += 1
+        entry.patches.append((entry.version, patch))
         self.counter += 1
 
+    def get_version(self, k):
+        return self.store[k].version
+
+    def get_patches(self, k, since_version):
+        entry = self.store[k]
+        if since_version == entry.version:
+            return []
+        if not entry.patches or not entry.patches[0][0] <= since_version + 1 <= entry.version:
+            return None
+        return [op for version, patch in entry.patches if version > since_version for op in patch]
+
     def set_served_state(self, k, v):
         self.store[k].served_state = deepcopy(v)
 
@@ -0,0 +1,248 @@
+"""The checkpoints of the :class:`~lightning_app.core.app.LightningApp` state, stored as an append-only log.
+
+Each checkpoint gets a version, incremented from the latest one found in the directory. A checkpoint is either a full
+snapshot of the state, ``v_<version>.snapshot``, or a record appended to the log of the latest snapshot,
+``v_<snapshot version>.log``, holding the changes since the previous checkpoint. The changes are pairs of the keys
+leading to a value of the state and the new value. The snapshots and the records are compressed pickles.
+
+A new snapshot compacts the log once it holds ``snapshot_interval`` records or gets larger than the snapshot, and only
+the ``max_snapshots`` latest snapshots are kept along with their logs. The checkpoints written as a single pickle,
+``v_<version>_<timestamp>.json``, can still be loaded.
+"""
+import os
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from lightning_app.utilities.app_helpers import Logger
+
+logger = Logger(__name__)
+
+_SNAPSHOT_SUFFIX = ".snapshot"
+_LOG_SUFFIX = ".log"
+_LEGACY_SUFFIX = ".json"
+# The length of each record of a log, followed by the record itself.
+_RECORD_HEADER = struct.Struct(">Q")
+_COMPRESSION_LEVEL = 1
+
+# The keys leading to a value of the state followed by the new value, or without any value when it was removed.
+_Changes = List[Tuple[Any, ...]]
+
+
+def _is_same(old: Any, new: Any) -> bool:
+    """Whether two values are equal and of the same types, e.g. ``1`` and ``True`` or ``1`` and ``1.0`` aren't."""
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_is_same(value, new[key]) for key, value in old.items())
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(map(_is_same, old, new))
+    return old == new
+
+
+def _state_changes(old: Dict, new: Dict, keys: Tuple[Any, ...] = ()) -> _Changes:
+    """Returns the changes turning the state ``old`` into ``new``.
+
+    The dictionaries are compared key by key, any other value is replaced when it changes, including when it only
+    changes type, such as ``1`` and ``1.0``.
+    """
+    changes: _Changes = [(keys + (key,),) for key in old if key not in new]
+    for key, value in new.items():
+        if key in old and isinstance(value, dict) and isinstance(old[key], dict):
+            changes.extend(_state_changes(old[key], value, keys + (key,)))
+        elif key not in old or not _is_same(old[key], value):
+            changes.append((keys + (key,), value))
+    return changes
+
+
+def _apply_changes(state: Dict, changes: _Changes) -> None:
+    for change in changes:
+        keys = change[0]
+        parent = state
+        for key in keys[:-1]:
+            parent = parent[key]
+        if len(change) == 1:
+            del parent[keys[-1]]
+        else:
+            parent[keys[-1]] = change[1]
+
+
+def _compress(obj: Any) -> bytes:
+    return zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), _COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes) -> Any:
+    return pickle.loads(zlib.decompress(data))
+
+
+def _list_checkpoints(checkpoints_dir: str) -> Dict[str, Dict[int, str]]:
+    """Returns the paths of the snapshots, logs and legacy checkpoints of a directory, by version."""
+    files: Dict[str, Dict[int, str]] = {_SNAPSHOT_SUFFIX: {}, _LOG_SUFFIX: {}, _LEGACY_SUFFIX: {}}
+    for filename in os.listdir(checkpoints_dir):
+        if not filename.startswith("v_"):
+            continue
+        path = os.path.join(checkpoints_dir, filename)
+        for suffix in (_SNAPSHOT_SUFFIX, _LOG_SUFFIX):
+            if filename.endswith(suffix) and filename[2 : -len(suffix)].isdigit():
+                files[suffix][int(filename[2 : -len(suffix)])] = path
+        parts = filename.split("_")
+        if filename.endswith(_LEGACY_SUFFIX) and len(parts) > 2 and parts[1].isdigit():
+            files[_LEGACY_SUFFIX][int(parts[1])] = path
+    return files
+
+
+def _read_log(path: str) -> List[Tuple[int, _Changes]]:
+    """Returns the records of a log, up to the first incomplete one, e.g. if the app stopped while writing it."""
+    with open(path, "rb") as f:
+        data = f.read()
+    records, offset = [], 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        (size,) = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        if offset + size > len(data):
+            break
+        try:
+            records.append(_decompress(data[offset : offset + size]))
+        except (zlib.error, pickle.UnpicklingError, EOFError):
+            break
+        offset += size
+    return records
+
+
+def _latest_version(files: Dict[str, Dict[int, str]]) -> Optional[int]:
+    versions = list(files[_LEGACY_SUFFIX]) + list(files[_SNAPSHOT_SUFFIX])
+    if files[_SNAPSHOT_SUFFIX]:
+        # the versions only grow, so the records of the latest snapshot are the latest ones
+        latest_snapshot = max(files[_SNAPSHOT_SUFFIX])
+        if latest_snapshot in files[_LOG_SUFFIX]:
+            versions.extend(version for version, _ in _read_log(files[_LOG_SUFFIX][latest_snapshot]))
+    return max(versions) if versions else None
+
+
+def _load_checkpoint(checkpoints_dir: str, version: Optional[int] = None) -> Dict:
+    """Returns the state of the checkpoint with the given version, the latest one by default.
+
+    The state is read from the latest snapshot preceding the version, and the records of its log are replayed up to
+    the version.
+    """
+    if not os.path.exists(checkpoints_dir):
+        raise FileNotFoundError(f"The provided directory `{checkpoints_dir}` doesn't exist.")
+    files = _list_checkpoints(checkpoints_dir)
+    if version is None:
+        version = _latest_version(files)
+        if version is None:
+            raise Exception(f"No checkpoints where found in `{checkpoints_dir}`.")
+
+    if version in files[_LEGACY_SUFFIX]:
+        with open(files[_LEGACY_SUFFIX][version], "rb") as f:
+            return pickle.load(f)
+
+    snapshots = [v for v in files[_SNAPSHOT_SUFFIX] if v <= version]
+    if snapshots:
+        snapshot_version = max(snapshots)
+        with open(files[_SNAPSHOT_SUFFIX][snapshot_version], "rb") as f:
+            state = _decompress(f.read())
+        if snapshot_version == version:
+            return state
+        if snapshot_version in files[_LOG_SUFFIX]:
+            for record_version, changes in _read_log(files[_LOG_SUFFIX][snapshot_version]):
+                if record_version > version:
+                    break
+                _apply_changes(state, changes)
+                if record_version == version:
+                    return state
+    raise FileNotFoundError(f"The version `{version}` wasn't found in `{checkpoints_dir}`.")
+
+
+@dataclass
+class _CheckpointStats:
+    """The duration and the size of the latest checkpoint written."""
+
+    is_snapshot: bool = False
+    num_bytes: int = 0
+    duration: float = 0.0
+
+
+class _CheckpointLog:
+    """Writes the checkpoints of a state into a directory.
+
+    Arguments:
+        checkpoints_dir: The directory of the checkpoints.
+        snapshot_interval: The maximum amount of records in the log of a snapshot before a new snapshot is written.
+        max_snapshots: The amount of snapshots kept along with their logs, the older ones are deleted.
+    """
+
+    def __init__(self, checkpoints_dir: str, snapshot_interval: int = 20, max_snapshots: int = 3) -> None:
+        if snapshot_interval < 0:
+            raise ValueError(f"The snapshot interval should be positive, got {snapshot_interval}.")
+        if max_snapshots < 1:
+            raise ValueError(f"At least one snapshot should be kept, got {max_snapshots}.")
+        self.checkpoints_dir = checkpoints_dir
+        self.snapshot_interval = snapshot_interval
+        self.max_snapshots = max_snapshots
+        self.stats = _CheckpointStats()
+        # the state of the latest checkpoint, which the changes of the next one are computed against
+        self._state: Optional[Dict] = None
+        self._version = -1
+        self._snapshot_version = -1
+        self._snapshot_bytes = 0
+        self._log_records = 0
+        self._log_bytes = 0
+
+    def write(self, state: Dict) -> str:
+        """Writes a checkpoint of the state and returns the path of the file it was written to."""
+        t0 = perf_counter()
+        if self._state is None:
+            os.makedirs(self.checkpoints_dir, exist_ok=True)
+            latest_version = _latest_version(_list_checkpoints(self.checkpoints_dir))
+            self._version = -1 if latest_version is None else latest_version
+        if self._state is None or self._log_records >= self.snapshot_interval or self._log_bytes > self._snapshot_bytes:
+            path = self._write_snapshot(state)
+        else:
+            path = self._append(state)
+        self.stats.duration = perf_counter() - t0
+        logger.debug(
+            f"Wrote the {'snapshot' if self.stats.is_snapshot else 'log record'} of the checkpoint {self._version}"
+            f" in {self.stats.duration:.3f}s ({self.stats.num_bytes} bytes)."
+        )
+        return path
+
+    def _write_snapshot(self, state: Dict) -> str:
+        self._version += 1
+        data = _compress(state)
+        path = os.path.join(self.checkpoints_dir, f"v_{self._version}{_SNAPSHOT_SUFFIX}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        # the state is copied from the snapshot, so that the changes of the app don't alter it
+        self._state = _decompress(data)
+        self._snapshot_version = self._version
+        self._snapshot_bytes = len(data)
+        self._log_records = self._log_bytes = 0
+        self.stats.is_snapshot, self.stats.num_bytes = True, len(data)
+        self._apply_retention()
+        return path
+
+    def _append(self, state: Dict) -> str:
+        self._version += 1
+        data = _compress((self._version, _state_changes(self._state, state)))
+        path = os.path.join(self.checkpoints_dir, f"v_{self._snapshot_version}{_LOG_SUFFIX}")
+        with open(path, "ab") as f:
+            f.write(_RECORD_HEADER.pack(len(data)) + data)
+        # the changes are copied from the record, so that the changes of the app don't alter them
+        _apply_changes(self._state, _decompress(data)[1])
+        self._log_records += 1
+        self._log_bytes += _RECORD_HEADER.size + len(data)
+        self.stats.is_snapshot, self.stats.num_bytes = False, _RECORD_HEADER.size + len(data)
+        return path
+
+    def _apply_retention(self) -> None:
+        files = _list_checkpoints(self.checkpoints_dir)
+        for version in sorted(files[_SNAPSHOT_SUFFIX])[: -self.max_snapshots]:
+            os.remove(files[_SNAPSHOT_SUFFIX][version])
+            if version in files[_LOG_SUFFIX]:
+                os.remove(files[_LOG_SUFFIX][version])
@@ -25,6 +25,7 @@ def _convert_paths_after_init(root: "LightningFlow"):
     """
     from lightning_app import LightningFlow, LightningWork
     from lightning_app.storage import Path
+    from lightning_app.utilities.delta_engine import _mark_dirty
 
     for component in breadth_first(root, types=(LightningFlow, LightningWork)):
         for attr in list(component.__dict__.keys()):
@@ -32,6 +33,7 @@ def _convert_paths_after_init(root: "LightningFlow"):
             if isinstance(value, Path):
                 delattr(component, attr)
                 component._paths[attr] = value.to_dict()
+                _mark_dirty(component, attr)
 
 
 def _sanitize_state(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,307 @@
+"""Incremental state diffing for the :class:`~lightning_app.core.app.LightningApp` loop.
+
+Instead of running a ``DeepDiff`` over the whole app state on every loop iteration, flows and works record the names
+of the state attributes assigned through ``__setattr__``. The :class:`_DeltaEngine` then only compares those attributes
+(and the non-primitive values which can be mutated in place, e.g. ``self.list.append(1)``) against the last published
+state.
+"""
+from copy import deepcopy
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from deepdiff import DeepDiff, Delta
+from lightning_utilities.core.apply_func import apply_to_collection
+
+from lightning_app.utilities.component import _sanitize_state
+
+if TYPE_CHECKING:
+    from lightning_app import LightningApp, LightningWork
+    from lightning_app.utilities.types import Component
+
+# Values of these types can only change through ``__setattr__``, so they are compared only when marked as dirty. The
+# values of any other type (containers, paths, drives, cloud computes, user objects...) can be mutated in place, so
+# they are always compared.
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+# The values of these types are compared as they are first, so the unchanged ones aren't sanitized.
+_CONTAINER_TYPES = (list, dict, set, tuple)
+_MISSING = object()
+
+
+def _mark_dirty(component: "Component", name: str) -> None:
+    """Record that the state attribute ``name`` of the component has been assigned."""
+    component.__dict__.setdefault("_dirty_vars", set()).add(name)
+
+
+def _pop_dirty(component: "Component") -> Set[str]:
+    """Return and reset the names of the state attributes assigned since the last call."""
+    return component.__dict__.pop("_dirty_vars", set())
+
+
+def _get_dirty(component: "Component") -> Set[str]:
+    return component.__dict__.get("_dirty_vars", set())
+
+
+def _set_dirty(component: "Component", names: Set[str]) -> None:
+    if names:
+        component.__dict__["_dirty_vars"] = names
+    else:
+        component.__dict__.pop("_dirty_vars", None)
+
+
+def _component_state_path(component_name: str, state: Dict) -> Optional[List[str]]:
+    """Return the list of keys leading to the state of the given component within the app state or ``None`` if the
+    component doesn't exist within the provided state."""
+    keys = []
+    child = state
+    for child_name in component_name.split(".")[1:]:
+        if child_name in child.get("flows", {}):
+            key = "flows"
+        elif child_name in child.get("structures", {}):
+            key = "structures"
+        elif child_name in child.get("works", {}):
+            key = "works"
+        else:
+            return None
+        child = child[key][child_name]
+        keys.extend([key, child_name])
+    return keys
+
+
+def _get_from_path(state: Dict, keys: Iterable[str]) -> Dict:
+    for key in keys:
+        state = state[key]
+    return state
+
+
+def _to_deepdiff_path(keys: Iterable[str]) -> str:
+    return "root" + "".join(f"[{key!r}]" for key in keys)
+
+
+def _comparable(value: Any) -> Any:
+    from lightning_app.storage import Drive, Path
+    from lightning_app.storage.payload import _BasePayload
+
+    return apply_to_collection(value, (Path, Drive, _BasePayload), lambda x: x.to_dict())
+
+
+def _has_changed(old: Any, new: Any) -> bool:
+    from lightning_app.storage import Path
+
+    if type(old) is not type(new):
+        return True
+    if old == new:
+        # ``Path`` equality only compares the filesystem path, so their origin and consumer need a closer look.
+        return isinstance(new, Path) and old.to_dict() != new.to_dict()
+    return _comparable(old) != _comparable(new)
+
+
+def _add_change(diff: Dict[str, Dict], path: str, old: Any, new: Any) -> None:
+    """Register a change into a dictionary following the format of ``DeepDiff(...).to_dict()`` with
+    ``verbose_level=2``, which can be consumed by :class:`deepdiff.Delta`."""
+    if old is _MISSING:
+        diff.setdefault("dictionary_item_added", {})[path] = new
+    elif type(old) is not type(new):
+        diff.setdefault("type_changes", {})[path] = {
+            "old_type": type(old),
+            "new_type": type(new),
+            "old_value": old,
+            "new_value": new,
+        }
+    else:
+        diff.setdefault("values_changed", {})[path] = {"new_value": new, "old_value": old}
+
+
+def _mutable_vars(component: "Component", names: Iterable[str]) -> Set[str]:
+    """Return the names among ``names`` of the state variables of the component whose values can be mutated in
+    place, i.e. which aren't primitive values."""
+    return {n for n in names if not isinstance(getattr(component, n), _IMMUTABLE_TYPES)}
+
+
+def _changed_vars(
+    component: "Component", last_vars: Dict[str, Any], mutable_vars: Set[str]
+) -> Dict[str, Tuple[Any, Any]]:
+    """Return the ``(old, new)`` values of the state variables of the component which differ from ``last_vars``.
+
+    Only the variables assigned since the last reset and the ``mutable_vars``, whose values could have been mutated in
+    place, are compared.
+    """
+    dirty = _get_dirty(component)
+    changes = {}
+    for name in component._state & (dirty | mutable_vars):
+        if name not in last_vars:
+            changes[name] = (_MISSING, _sanitize_state({name: getattr(component, name)})[name])
+            continue
+        old = last_vars[name]
+        if name not in dirty:
+            if isinstance(old, _IMMUTABLE_TYPES):
+                continue
+            value = getattr(component, name)
+            if type(value) in _CONTAINER_TYPES and value == old:
+                # fast path: the container wasn't mutated in place.
+                continue
+        new = _sanitize_state({name: getattr(component, name)})[name]
+        if _has_changed(old, new):
+            changes[name] = (old, new)
+    return changes
+
+
+class _DeltaEngine:
+    """Computes the changes of the app state against ``app.last_state`` in O(changed keys).
+
+    The engine relies on :func:`_mark_dirty` being called by ``LightningFlow.__setattr__`` and
+    ``LightningWork.__setattr__``. Besides the assigned variables, it only compares the ones holding mutable values,
+    which it keeps track of per component. Whenever the component tree changes (e.g. a work gets dynamically created),
+    the engine reports it so the caller can fall back to rebuilding the full state.
+
+    Arguments:
+        app: The app whose state should be tracked.
+    """
+
+    def __init__(self, app: "LightningApp") -> None:
+        self._app = app
+        self._component_names: Set[str] = set()
+        self._state_paths: Dict[str, List[str]] = {}
+        self._changes: List[Tuple[List[str], Any]] = []
+        self._collected_components: List["Component"] = []
+        # the state variables holding values which can be mutated in place, by component name
+        self._mutable_vars: Dict[str, Set[str]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the dirty attributes of all components and re-index the component tree."""
+        self._state_paths = {}
+        self._changes = []
+        self._collected_components = []
+        components = self._components()
+        self._mutable_vars = {}
+        for component in components:
+            _pop_dirty(component)
+            self._mutable_vars[component.name] = _mutable_vars(component, component._state)
+        self._component_names = {c.name for c in components}
+
+    def _components(self) -> List["Component"]:
+        return self._app.flows + self._app.works
+
+    def _state_path(self, component_name: str) -> Optional[List[str]]:
+        if component_name not in self._state_paths:
+            keys = _component_state_path(component_name, self._app.last_state)
+            if keys is None:
+                return None
+            self._state_paths[component_name] = keys
+        return self._state_paths[component_name]
+
+    def _vars_to_compare(self, component: "Component", component_name: str, dirty: Set[str]) -> Set[str]:
+        """Return the state variables of the component holding mutable values, updated with the ``dirty`` ones."""
+        mutable_vars = self._mutable_vars.get(component_name)
+        if mutable_vars is None:
+            mutable_vars = _mutable_vars(component, component._state)
+        elif dirty:
+            mutable_vars = (mutable_vars - dirty) | _mutable_vars(component, dirty & component._state)
+        self._mutable_vars[component_name] = mutable_vars
+        return mutable_vars
+
+    def has_tree_changed(self, components: Optional[List["Component"]] = None) -> bool:
+        """Whether components were added or removed since the last reset."""
+        components = self._components() if components is None else components
+        return {c.name for c in components} != self._component_names
+
+    def collect(self) -> Optional[Dict[str, Dict]]:
+        """Return the changes of the app state as a ``DeepDiff``-like dictionary or ``None`` if the component tree
+        changed and the full state needs to be recomputed.
+
+        Only the assigned variables which changed are kept as dirty, so the next calls don't compare the other ones
+        again.
+        """
+        components = self._components()
+        component_names = [c.name for c in components]
+        if set(component_names) != self._component_names:
+            return None
+
+        last_state = self._app.last_state
+        changes = []
+        dirty_components = []
+        for component, component_name in zip(components, component_names):
+            keys = self._state_path(component_name)
+            if keys is None:
+                return None
+            component_state = _get_from_path(last_state, keys)
+            # the components without assigned or mutable variables are skipped, only their calls are compared
+            dirty = _get_dirty(component)
+            mutable_vars = self._vars_to_compare(component, component_name, dirty)
+            if mutable_vars or dirty:
+                changed_vars = _changed_vars(component, component_state["vars"], mutable_vars)
+                for name, (old, new) in changed_vars.items():
+                    changes.append((keys + ["vars", name], old, new))
+            if dirty:
+                # the assigned variables which compared equal are dropped, the changed ones stay dirty until the
+                # changes are committed, so they are still found if the changes are collected again.
+                dirty = dirty & changed_vars.keys()
+                _set_dirty(component, dirty)
+                if dirty:
+                    dirty_components.append(component)
+            calls = component._calls
+            if calls != component_state["calls"]:
+                changes.append((keys + ["calls"], component_state["calls"], calls.copy()))
+
+        stage = self._app.stage.value
+        if last_state["app_state"]["stage"] != stage:
+            changes.append((["app_state", "stage"], last_state["app_state"]["stage"], stage))
+
+        self._changes = [(keys, new) for keys, _, new in changes]
+        self._collected_components = dirty_components
+        diff: Dict[str, Dict] = {}
+        for keys, old, new in changes:
+            _add_change(diff, _to_deepdiff_path(keys), old, new)
+        return diff
+
+    def to_delta(self) -> Optional[Delta]:
+        """Return the changes of the app state as a :class:`deepdiff.Delta`."""
+        diff = self.collect()
+        if diff is None:
+            return None
+        return Delta(diff)
+
+    def commit(self) -> None:
+        """Apply the changes found by the last :meth:`collect` call to ``app.last_state`` in place and reset the
+        dirty attributes."""
+        last_state = self._app.last_state
+        for keys, new in self._changes:
+            parent = _get_from_path(last_state, keys[:-1])
+            parent[keys[-1]] = deepcopy(new)
+        self._changes = []
+        for component in self._collected_components:
+            _pop_dirty(component)
+        self._collected_components = []
+
+    def work_vars_diff(self, work: "LightningWork") -> Optional[Dict[str, Any]]:
+        """Return the changes of the public variables of the given work as a ``DeepDiff``-like dictionary, relative to
+        the work state. Private variables, drives, paths and payloads aren't included.
+
+        Returns ``None`` if the work doesn't exist in the last state.
+        """
+        from lightning_app.storage import Path, Payload
+
+        keys = self._state_path(work.name)
+        if keys is None:
+            return None
+        last_vars = _get_from_path(self._app.last_state, keys)["vars"]
+
+        def is_shared(value: Any) -> bool:
+            return not (isinstance(value, dict) and value.get("type", None) == "__drive__") and not isinstance(
+                value, (Payload, Path)
+            )
+
+        old_vars, new_vars = {}, {}
+        dirty = _get_dirty(work)
+        mutable_vars = self._vars_to_compare(work, work.name, dirty)
+        for name, (old, new) in _changed_vars(work, last_vars, mutable_vars).items():
+            if name.startswith("_") or name not in last_vars or not is_shared(old) or not is_shared(new):
+                continue
+            old_vars[name] = old
+            new_vars[name] = new
+        if not new_vars:
+            return {}
+        # Only the changed variables are diffed so the work receives the same fine-grained changes as before
+        # (e.g. ``dictionary_item_added``), which it validates in ``LightningWork.apply_flow_delta``.
+        diff = DeepDiff(old_vars, new_vars, verbose_level=2).to_dict()
+        diff.pop("unprocessed", None)
+        return diff
@@ -73,6 +73,10 @@ def _is_redis_available() -> bool:
     return module_available("redis")
 
 
+def _is_msgpack_available() -> bool:
+    return module_available("msgpack")
+
+
 def _is_torch_available() -> bool:
     return module_available("torch")
 
@@ -0,0 +1,74 @@
+"""A minimal implementation of `JSON Patch <https://www.rfc-editor.org/rfc/rfc6902>`_ to stream the changes of the
+app state to the UI.
+
+Only the ``add``, ``remove`` and ``replace`` operations are produced and applied.
+"""
+from copy import deepcopy
+from typing import Any, Dict, List, Tuple
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Returns the operations turning the JSON document ``old`` into ``new``.
+
+    The dictionaries are compared key by key and the lists of the same length item by item. Any other change replaces
+    the value. The values comparing equal but of different types, such as ``1`` and ``1.0`` or ``0`` and ``False``,
+    are replaced too.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        operations = [{"op": "remove", "path": f"{path}/{_escape(key)}"} for key in old if key not in new]
+        for key, value in new.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key in old:
+                operations.extend(_json_patch(old[key], value, key_path))
+            else:
+                operations.append({"op": "add", "path": key_path, "value": value})
+        return operations
+    if isinstance(old, list) and len(old) == len(new):
+        operations = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            operations.extend(_json_patch(old_item, new_item, f"{path}/{index}"))
+        return operations
+    if old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _resolve(document: Any, path: str) -> Tuple[Any, Any]:
+    """Returns the container of the value at ``path`` and its key within the container."""
+    tokens = [_unescape(token) for token in path.split("/")[1:]]
+    container = document
+    for token in tokens[:-1]:
+        container = container[int(token) if isinstance(container, list) else token]
+    key = tokens[-1]
+    return container, int(key) if isinstance(container, list) and key != "-" else key
+
+
+def _apply_json_patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    """Returns a copy of the JSON document with the operations applied."""
+    document = deepcopy(document)
+    for operation in operations:
+        op, path = operation["op"], operation["path"]
+        if op not in ("add", "remove", "replace"):
+            raise ValueError(f"The JSON patch operation {op} isn't supported.")
+        if not path:
+            # the whole document is replaced
+            document = deepcopy(operation["value"])
+            continue
+        container, key = _resolve(document, path)
+        if op == "remove":
+            del container[key]
+        elif op == "add" and isinstance(container, list):
+            container.insert(len(container) if key == "-" else key, deepcopy(operation["value"]))
+        else:
+            container[key] = deepcopy(operation["value"])
+    return document
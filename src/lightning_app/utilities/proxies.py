@@ -17,6 +17,7 @@ from typing import Any, Callable, Dict, Generator, Optional, Set, Tuple, Type, T
 from deepdiff import DeepDiff, Delta
 from lightning_utilities.core.apply_func import apply_to_collection
 
+from lightning_app.core.constants import WORK_DELTA_COALESCING_WINDOW
 from lightning_app.core.queues import MultiProcessQueue
 from lightning_app.storage import Path
 from lightning_app.storage.copier import _Copier, _copy_files
@@ -24,7 +25,7 @@ from lightning_app.storage.drive import _maybe_create_drive, Drive
 from lightning_app.storage.path import _path_to_work_artifact
 from lightning_app.storage.payload import Payload
 from lightning_app.utilities.app_helpers import affiliation
-from lightning_app.utilities.component import _set_work_context
+from lightning_app.utilities.component import _sanitize_state, _set_work_context
 from lightning_app.utilities.enum import (
     CacheCallsKeys,
     make_status,
@@ -42,6 +43,7 @@ from lightning_app.utilities.app_helpers import Logger
 
 logger = Logger(__name__)
 _state_observer_lock = threading.Lock()
+_MISSING = object()
 
 
 @dataclass
@@ -266,6 +268,11 @@ class WorkStateObserver(Thread):
 
     def run_once(self) -> None:
         with _state_observer_lock:
+            # Send the updates the LightningWorkSetAttrProxy is holding, so they aren't diffed twice.
+            setattr_proxy = _get_setattr_proxy(self._work)
+            if setattr_proxy:
+                setattr_proxy._flush()
+
             # Add all deltas the LightningWorkSetAttrProxy has processed and sent to the Flow already while
             # the WorkStateObserver was sleeping
             for delta in self._delta_memory:
@@ -290,10 +297,15 @@ class WorkStateObserver(Thread):
                 except Exception as e:
                     print(traceback.print_exc())
                     self._error_queue.put(e)
+                    # wake the app loop up, which only blocks on the delta queue when idle
+                    self._delta_queue.put(None)
                     raise e
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
+        setattr_proxy = _get_setattr_proxy(self._work)
+        if setattr_proxy:
+            setattr_proxy.flush()
         super().join(timeout)
 
 
@@ -302,35 +314,88 @@ class LightningWorkSetAttrProxy:
     """This wrapper around the ``LightningWork.__setattr__`` ensures that state changes get sent to the delta queue
     to be reflected in the Flow.
 
+    When a ``coalescing_window`` is provided, the updates of the same attribute made within the window are merged into
+    a single delta, e.g. a progress counter incremented in a tight loop is only sent once per window. The pending
+    updates are flushed before any status change of the work.
+
     Example:
 
         class Work(LightningWork):
             ...
 
             def run(self):
-                self.var += 1  # This update gets sent to the Flow immediately
+                self.var += 1  # This update gets sent to the Flow immediately or once the window elapsed
     """
 
     work_name: str
     work: "LightningWork"
     delta_queue: "BaseQueue"
     state_observer: Optional["WorkStateObserver"]
+    coalescing_window: float = 0.0
+
+    def __post_init__(self):
+        # The values of the state attributes updated since the last delta, before their first update.
+        self._pending: Dict[str, Any] = {}
+        self._timer: Optional[threading.Timer] = None
+        self.num_deltas_produced = 0
+        self.num_deltas_sent = 0
 
     def __call__(self, name: str, value: Any) -> None:
         logger.debug(f"Setting {name}: {value}")
         with _state_observer_lock:
-            state = deepcopy(self.work.state)
+            if name not in self._pending:
+                self._pending[name] = self._get_var(name)
             self.work._default_setattr(name, value)
-            delta = Delta(DeepDiff(state, self.work.state, verbose_level=2))
-            if not delta.to_dict():
+            if name not in self.work._state:
+                # not a state attribute
+                self._pending.pop(name)
                 return
 
-            # push the delta only if there is any
-            self.delta_queue.put(ComponentDelta(id=self.work_name, delta=delta))
+            self.num_deltas_produced += 1
+            if self.coalescing_window <= 0:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.coalescing_window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
 
-            # add the delta to the buffer to let WorkStateObserver know we already sent this one to the Flow
-            if self.state_observer:
-                self.state_observer._delta_memory.append(delta)
+    def flush(self) -> None:
+        """Send the pending updates to the delta queue."""
+        with _state_observer_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        # The caller must hold the ``_state_observer_lock``.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        old_vars = {name: value for name, value in pending.items() if value is not _MISSING}
+        new_vars = _sanitize_state({name: getattr(self.work, name) for name in pending if name in self.work._state})
+        delta = Delta(DeepDiff({"vars": old_vars}, {"vars": new_vars}, verbose_level=2))
+        if not delta.to_dict():
+            return
+
+        # push the delta only if there is any
+        self.delta_queue.put(ComponentDelta(id=self.work_name, delta=delta))
+        self.num_deltas_sent += 1
+
+        # add the delta to the buffer to let WorkStateObserver know we already sent this one to the Flow
+        if self.state_observer:
+            self.state_observer._delta_memory.append(delta)
+
+    def _get_var(self, name: str) -> Any:
+        if name not in self.work._state:
+            return _MISSING
+        return deepcopy(_sanitize_state({name: getattr(self.work, name)})[name])
+
+
+def _get_setattr_proxy(work: "LightningWork") -> Optional[LightningWorkSetAttrProxy]:
+    setattr_proxy = getattr(work, "_setattr_replacement", None)
+    return setattr_proxy if isinstance(setattr_proxy, LightningWorkSetAttrProxy) else None
 
 
 @dataclass
@@ -411,6 +476,8 @@ class WorkRunner:
             except Exception as e:
                 # Inform the flow the work failed. This would fail the entire application.
                 self.error_queue.put(e)
+                # Wake the app loop up, which only blocks on the delta queue when idle.
+                self.delta_queue.put(None)
                 # Terminate the threads
                 if self.state_observer:
                     self.state_observer.join(0)
@@ -517,6 +584,7 @@ class WorkRunner:
             raise e
         except BaseException as e:
             # 10.2 Send failed delta to the flow.
+            self._flush_setattr_deltas()
             reference_state = deepcopy(self.work.state)
             exp, val, tb = sys.exc_info()
             listing = traceback.format_exception(exp, val, tb)
@@ -553,7 +621,8 @@ class WorkRunner:
             print("########## CAPTURED EXCEPTION ###########")
             return
 
-        # 13. Destroy the state observer.
+        # 13. Send the pending state updates and destroy the state observer.
+        self._flush_setattr_deltas()
         if self.run_executor_cls.enable_start_observer:
             self.state_observer.join(0)
         self.state_observer = None
@@ -587,6 +656,9 @@ class WorkRunner:
         logger.info(f"Received SIGTERM signal. Gracefully terminating {self.work.name.replace('root.', '')}...")
         persist_artifacts(work=self.work)
         with _state_observer_lock:
+            setattr_proxy = _get_setattr_proxy(self.work)
+            if setattr_proxy:
+                setattr_proxy._flush()
             self.work.on_exit()
             self.work._calls[call_hash]["statuses"] = []
             state = deepcopy(self.work.state)
@@ -606,6 +678,11 @@ class WorkRunner:
     def _proxy_setattr(self, cleanup: bool = False):
         _proxy_setattr(self.work, self.delta_queue, self.state_observer, cleanup=cleanup)
 
+    def _flush_setattr_deltas(self) -> None:
+        setattr_proxy = _get_setattr_proxy(self.work)
+        if setattr_proxy:
+            setattr_proxy.flush()
+
     def _process_call_args(
         self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
     ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
@@ -714,6 +791,14 @@ def persist_artifacts(work: "LightningWork") -> None:
 
 
 def _proxy_setattr(work, delta_queue, state_observer: Optional[WorkStateObserver], cleanup: bool = False):
+    previous_setattr_proxy = _get_setattr_proxy(work)
+    if previous_setattr_proxy:
+        previous_setattr_proxy.flush()
+        logger.debug(
+            f"Work {work.name} sent {previous_setattr_proxy.num_deltas_sent} deltas for"
+            f" {previous_setattr_proxy.num_deltas_produced} state updates."
+        )
+
     if cleanup:
         setattr_proxy = None
     else:
@@ -722,5 +807,6 @@ def _proxy_setattr(work, delta_queue, state_observer: Optional[WorkStateObserver
             work,
             delta_queue=delta_queue,
             state_observer=state_observer,
+            coalescing_window=WORK_DELTA_COALESCING_WINDOW,
         )
     work._setattr_replacement = setattr_proxy
@@ -0,0 +1,151 @@
+import pickle
+from abc import ABC, abstractmethod
+from dataclasses import fields
+from typing import Any, List, Type
+
+from lightning_app.utilities.imports import requires
+
+# Leading byte of the payloads encoded with msgpack. Pickle payloads always start with the `PROTO` opcode (0x80).
+_MSGPACK_MAGIC = b"\x01"
+
+_EXT_TUPLE = 1
+_EXT_NDARRAY = 2
+_EXT_TENSOR = 3
+_EXT_DELTA = 4
+_EXT_MESSAGE = 5
+
+
+class BaseSerializer(ABC):
+    """Base class of the serializers used by the queues to encode and decode their elements."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+
+class PickleSerializer(BaseSerializer):
+    def dumps(self, obj: Any) -> bytes:
+        return pickle.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+def _message_types() -> List[Type]:
+    """The dataclasses exchanged between the app, the works and the Rest API, encoded field by field.
+
+    The list is only appended to, as the index of a type is part of the encoding.
+    """
+    from lightning_app.api.request_types import _APIRequest, _CommandRequest, _DeltaRequest, _RequestResponse
+    from lightning_app.utilities.proxies import ComponentDelta
+
+    return [ComponentDelta, _DeltaRequest, _APIRequest, _CommandRequest, _RequestResponse]
+
+
+class MsgpackSerializer(BaseSerializer):
+    """A compact binary serializer based on `msgpack <https://msgpack.org>`_.
+
+    It natively encodes the deltas, the requests and the state dictionaries made of primitive types, with numpy arrays
+    and CPU tensors encoded as raw buffers. Any message containing another type of object is pickled instead.
+    """
+
+    @requires("msgpack")
+    def __init__(self) -> None:
+        self._message_types: List[Type] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return _MSGPACK_MAGIC + self._pack(obj)
+        except (TypeError, ValueError, OverflowError):
+            return pickle.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        view = memoryview(data)
+        # The payloads produced by a `PickleSerializer` can be decoded too.
+        if view[:1] != _MSGPACK_MAGIC:
+            return pickle.loads(data)
+        return self._unpack(view[1:])
+
+    def _pack(self, obj: Any) -> bytes:
+        import msgpack
+
+        return msgpack.packb(obj, default=self._encode, use_bin_type=True, strict_types=True)
+
+    def _unpack(self, data: bytes) -> Any:
+        import msgpack
+
+        return msgpack.unpackb(data, ext_hook=self._decode, raw=False, strict_map_key=False)
+
+    def _get_message_types(self) -> List[Type]:
+        if not self._message_types:
+            self._message_types = _message_types()
+        return self._message_types
+
+    def _encode(self, obj: Any) -> Any:
+        import msgpack
+        from deepdiff import Delta
+
+        obj_type = type(obj)
+        if obj_type is tuple:
+            return msgpack.ExtType(_EXT_TUPLE, self._pack(list(obj)))
+        if obj_type is Delta:
+            if obj.mutate or obj.verify_symmetry or obj.raise_errors or not obj.log_errors:
+                raise TypeError("Only the deltas created with the default options are supported.")
+            return msgpack.ExtType(_EXT_DELTA, self._pack(obj.diff))
+        message_types = self._get_message_types()
+        if obj_type in message_types:
+            values = [getattr(obj, field.name) for field in fields(obj)]
+            return msgpack.ExtType(_EXT_MESSAGE, self._pack([message_types.index(obj_type), values]))
+        if obj_type.__module__ == "numpy" and obj_type.__name__ == "ndarray":
+            return msgpack.ExtType(_EXT_NDARRAY, self._pack(self._encode_array(obj)))
+        if obj_type.__module__ == "torch" and obj_type.__name__ == "Tensor":
+            if obj.device.type != "cpu" or obj.requires_grad:
+                raise TypeError("Only the CPU tensors which don't require gradients are supported.")
+            return msgpack.ExtType(_EXT_TENSOR, self._pack(self._encode_array(obj.numpy())))
+        raise TypeError(f"The type {obj_type} isn't supported.")
+
+    @staticmethod
+    def _encode_array(array: Any) -> List[Any]:
+        import numpy as np
+
+        if array.dtype.hasobject:
+            raise TypeError("The arrays of objects aren't supported.")
+        return [array.dtype.str, list(array.shape), np.ascontiguousarray(array).data]
+
+    @staticmethod
+    def _decode_array(dtype: str, shape: List[int], buffer: bytes) -> Any:
+        import numpy as np
+
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape).copy()
+
+    def _decode(self, code: int, data: bytes) -> Any:
+        from deepdiff import Delta
+
+        value = self._unpack(data)
+        if code == _EXT_TUPLE:
+            return tuple(value)
+        if code == _EXT_DELTA:
+            return Delta(value)
+        if code == _EXT_MESSAGE:
+            index, values = value
+            return self._get_message_types()[index](*values)
+        if code == _EXT_NDARRAY:
+            return self._decode_array(*value)
+        if code == _EXT_TENSOR:
+            import torch
+
+            return torch.from_numpy(self._decode_array(*value))
+        raise ValueError(f"Unknown msgpack extension type {code}.")
+
+
+_SERIALIZERS = {"pickle": PickleSerializer, "msgpack": MsgpackSerializer}
+
+
+def _get_serializer(name: str) -> BaseSerializer:
+    if name not in _SERIALIZERS:
+        raise ValueError(f"The serializer should be one of {list(_SERIALIZERS)}. Found {name}.")
+    return _SERIALIZERS[name]()
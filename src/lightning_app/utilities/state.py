@@ -18,6 +18,10 @@ logger = Logger(__name__)
 # GLOBAL APP STATE
 _LAST_STATE = None
 _STATE = None
+# The name of the component whose state is held by the global state, None when it holds the whole app state.
+_STATE_COMPONENT_NAME: Optional[str] = None
+# The ETag of the global state as served by the app, None once it is modified.
+_STATE_ETAG: Optional[str] = None
 
 
 class AppStateType(enum.Enum):
@@ -44,6 +48,8 @@ class AppState:
         "_port",
         "_request_state",
         "_store_state",
+        "_store_component_state",
+        "_component_name",
         "_send_state",
         "_my_affiliation",
         "_find_state_under_affiliation",
@@ -115,19 +121,43 @@ class AppState:
                 raise ValueError(f"Failed to extract the state under the affiliation '{my_affiliation}'.")
         return children_state
 
+    def _component_name(self) -> Optional[str]:
+        """Returns the name of the component this AppState is scoped to, or None when it is the root flow."""
+        if not self._my_affiliation:
+            return None
+        return ".".join(("root",) + tuple(self._my_affiliation))
+
     def _store_state(self, state: Dict[str, Any]) -> None:
         # Relying on the global variable to ensure the
         # deep_diff is done on the entire state.
         global _LAST_STATE
         global _STATE
+        global _STATE_COMPONENT_NAME
+        global _STATE_ETAG
         _LAST_STATE = deepcopy(state)
         _STATE = state
+        _STATE_COMPONENT_NAME = None
+        _STATE_ETAG = None
         # If the affiliation is passed, the AppState was created in a LightningFlow context.
         # The state should be only the one of this LightningFlow and its children.
         self._last_state = self._find_state_under_affiliation(_LAST_STATE, self._my_affiliation)
         self._state = self._find_state_under_affiliation(_STATE, self._my_affiliation)
 
+    def _store_component_state(self, state: Dict[str, Any], component_name: str) -> None:
+        """Stores the state of the component this AppState is scoped to, as served by the app."""
+        global _LAST_STATE
+        global _STATE
+        global _STATE_COMPONENT_NAME
+        global _STATE_ETAG
+        _LAST_STATE = deepcopy(state)
+        _STATE = state
+        _STATE_COMPONENT_NAME = component_name
+        _STATE_ETAG = None
+        self._last_state = _LAST_STATE
+        self._state = _STATE
+
     def send_delta(self) -> None:
+        global _STATE_ETAG
         app_url = f"{self._url}/api/v1/delta"
         deep_diff = DeepDiff(_LAST_STATE, _STATE, verbose_level=2)
         assert self._plugin is not None
@@ -135,9 +165,13 @@ class AppState:
         if self._plugin.should_update_app(deep_diff):
             data = {"delta": json.loads(deep_diff.to_json())}
             headers = headers_for(self._plugin.get_context())
+            # The global state now differs from the one served by the app, so it is requested again next time.
+            _STATE_ETAG = None
+            # The delta of the state of a component is applied by the app under the state of this component.
+            params = {"component": _STATE_COMPONENT_NAME} if _STATE_COMPONENT_NAME else None
             try:
                 # TODO: Send the delta directly to the REST API.
-                response = self._session.post(app_url, json=data, headers=headers)
+                response = self._session.post(app_url, json=data, headers=headers, params=params)
             except ConnectionError as e:
                 raise AttributeError("Failed to connect and send the app state. Is the app running?") from e
 
@@ -145,20 +179,39 @@ class AppState:
                 raise Exception(f"The response from the server was {response.status_code}. Your inputs were rejected.")
 
     def _request_state(self) -> None:
+        """Fetches the state of the component this AppState is scoped to, or of the whole app.
+
+        The state held by the previous AppState is reused when the app answers that it didn't change since.
+        """
+        global _STATE_ETAG
         if self._state is not None:
             return
         app_url = f"{self._url}/api/v1/state"
         headers = headers_for(self._plugin.get_context()) if self._plugin else {}
+        component_name = self._component_name()
+        params = {"component": component_name} if component_name else None
+        if _STATE_ETAG is not None and _STATE_COMPONENT_NAME == component_name:
+            headers["If-None-Match"] = _STATE_ETAG
         try:
-            response = self._session.get(app_url, headers=headers, timeout=1)
+            response = self._session.get(app_url, headers=headers, params=params, timeout=1)
         except ConnectionError as e:
             raise AttributeError("Failed to connect and fetch the app state. Is the app running?") from e
 
+        if response.status_code == 304:
+            self._authorized = 200
+            self._last_state = _LAST_STATE
+            self._state = _STATE
+            return
+
         self._authorized = response.status_code
         if self._authorized != 200:
             return
         logger.debug(f"GET STATE {response} {response.json()}")
-        self._store_state(response.json())
+        if component_name:
+            self._store_component_state(response.json(), component_name)
+        else:
+            self._store_state(response.json())
+        _STATE_ETAG = response.headers.get("ETag")
 
     def __getattr__(self, name: str) -> Union[Any, "AppState"]:
         if name in self._APP_PRIVATE_KEYS:
@@ -42,6 +42,9 @@ class ExperimentWriter:
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    The metrics are kept in memory until they are saved, and are then appended to the CSV file. The file is only
+    rewritten when new metric keys are logged, to add their columns.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -51,7 +54,10 @@ class ExperimentWriter:
 
     def __init__(self, log_dir: str) -> None:
         self.hparams: Dict[str, Any] = {}
+        # the metrics logged since the last save
         self.metrics: List[Dict[str, float]] = []
+        self.metrics_keys: List[str] = []
+        self._num_logged_metrics = 0
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -76,11 +82,12 @@ class ExperimentWriter:
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_logged_metrics
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics["step"] = step
         self.metrics.append(metrics)
+        self._num_logged_metrics += 1
 
     def save(self) -> None:
         """Save recorded hparams and metrics into files."""
@@ -90,15 +97,40 @@ class ExperimentWriter:
         if not self.metrics:
             return
 
-        last_m = {}
-        for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+        # the previous rows are in the file unless nothing was saved yet, in which case it is overwritten
+        is_new_file = not self.metrics_keys
+        new_keys = self._record_new_keys()
+        if new_keys and not is_new_file:
+            self._rewrite_with_new_keys()
 
-        with open(self.metrics_file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            writer.writeheader()
+        with open(self.metrics_file_path, "w" if is_new_file else "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+            if is_new_file:
+                writer.writeheader()
             writer.writerows(self.metrics)
+        self.metrics = []
+
+    def _record_new_keys(self) -> List[str]:
+        """Records the keys of the metrics to save which aren't columns of the file yet, in the order they were
+        logged."""
+        current_keys = set(self.metrics_keys)
+        new_keys = []
+        for metrics in self.metrics:
+            for key in metrics:
+                if key not in current_keys:
+                    current_keys.add(key)
+                    new_keys.append(key)
+        self.metrics_keys.extend(new_keys)
+        return new_keys
+
+    def _rewrite_with_new_keys(self) -> None:
+        """Rewrites the metrics file with the new header, one row at a time."""
+        tmp_file_path = self.metrics_file_path + ".tmp"
+        with open(self.metrics_file_path, newline="") as source, open(tmp_file_path, "w", newline="") as dest:
+            writer = csv.DictWriter(dest, fieldnames=self.metrics_keys)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(source))
+        os.replace(tmp_file_path, self.metrics_file_path)
 
 
 class CSVLogger(Logger):
@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
+import torch
 from lightning_utilities.core.apply_func import apply_to_collection
 from torch import Tensor
 
@@ -24,6 +25,43 @@ from pytorch_lightning.trainer.connectors.logger_connector.result import _METRIC
 from pytorch_lightning.utilities.metrics import metrics_to_scalars
 
 
+class _HostMetrics:
+    """Copies the metric tensors on CUDA devices to pinned host memory without blocking the host.
+
+    The values are only converted to scalars once the copies are done, so that reading them doesn't wait for the work
+    queued on the devices before the copies.
+    """
+
+    def __init__(self, metrics: _OUT_DICT) -> None:
+        devices = set()
+
+        def copy(value: Tensor) -> Tensor:
+            if value.device.type != "cuda":
+                return value
+            devices.add(value.device)
+            host_value = torch.empty(value.shape, dtype=value.dtype, pin_memory=True)
+            return host_value.copy_(value, non_blocking=True)
+
+        self.metrics = apply_to_collection(metrics, Tensor, copy)
+        self._events: List[torch.cuda.Event] = []
+        for device in devices:
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(device))
+            self._events.append(event)
+
+    @property
+    def is_async(self) -> bool:
+        return bool(self._events)
+
+    def ready(self) -> bool:
+        return all(event.query() for event in self._events)
+
+    def to_scalars(self) -> Any:
+        for event in self._events:
+            event.synchronize()
+        return metrics_to_scalars(self.metrics)
+
+
 class LoggerConnector:
     def __init__(self, trainer: "pl.Trainer") -> None:
         self.trainer = trainer
@@ -34,6 +72,11 @@ class LoggerConnector:
         self._current_fx: Optional[str] = None
         self._batch_idx: Optional[int] = None
         self._split_idx: Optional[int] = None
+        # the metrics of a step still being copied to the host, with their step, epoch and default step
+        self._pending_metrics: Optional[Tuple[_HostMetrics, Optional[int], int, int]] = None
+        self._pending_progress_bar_metrics: Optional[_HostMetrics] = None
+        # the progress bar metrics of the steps received while the previous ones were still being copied to the host
+        self._next_progress_bar_metrics: _OUT_DICT = {}
 
     def on_trainer_init(
         self,
@@ -74,27 +117,100 @@ class LoggerConnector:
             step: Step for which metrics should be logged. Default value is `self.global_step` during training or
                 the total validation / test log step count during validation and testing.
         """
-        if not self.trainer.loggers or not metrics:
+        if not self.trainer.loggers:
+            return
+        # the metrics of the previous steps are passed first so that the loggers receive them in order
+        self._flush_logged_metrics()
+        if not metrics:
             return
 
         self._logged_metrics.update(metrics)
 
         # turn all tensors to scalars
         scalar_metrics = metrics_to_scalars(metrics)
+        self._log_scalar_metrics(
+            scalar_metrics, step, self.trainer.current_epoch, self.trainer.fit_loop.epoch_loop._batches_that_stepped
+        )
 
+    def _log_step_metrics(self, metrics: _OUT_DICT, step: Optional[int] = None) -> None:
+        """Logs the metrics of a step like :meth:`log_metrics`, without waiting for the devices.
+
+        The metrics on CUDA devices are copied to the host without blocking, and are passed to the loggers by the
+        next call to :meth:`log_metrics` or :meth:`flush_metrics`, once the copies are long done.
+        """
+        if not self.trainer.loggers:
+            return
+        self._flush_logged_metrics()
+        if not metrics:
+            return
+
+        self._logged_metrics.update(metrics)
+
+        host_metrics = _HostMetrics(metrics)
+        epoch = self.trainer.current_epoch
+        default_step = self.trainer.fit_loop.epoch_loop._batches_that_stepped
+        if host_metrics.is_async:
+            self._pending_metrics = (host_metrics, step, epoch, default_step)
+        else:
+            self._log_scalar_metrics(host_metrics.to_scalars(), step, epoch, default_step)
+
+    def flush_metrics(self) -> None:
+        """Passes the metrics of the latest steps still being copied to the host to the loggers and the progress
+        bar."""
+        self._flush_logged_metrics()
+        self._flush_progress_bar_metrics()
+
+    def _flush_logged_metrics(self) -> None:
+        if self._pending_metrics is None:
+            return
+        host_metrics, step, epoch, default_step = self._pending_metrics
+        self._pending_metrics = None
+        self._log_scalar_metrics(host_metrics.to_scalars(), step, epoch, default_step)
+
+    def _log_scalar_metrics(self, scalar_metrics: dict, step: Optional[int], epoch: int, default_step: int) -> None:
         if step is None:
             step = scalar_metrics.pop("step", None)
 
         if step is None:
             # added metrics for convenience
-            scalar_metrics.setdefault("epoch", self.trainer.current_epoch)
-            step = self.trainer.fit_loop.epoch_loop._batches_that_stepped
+            scalar_metrics.setdefault("epoch", epoch)
+            step = default_step
 
         # log actual metrics
         for logger in self.trainer.loggers:
             logger.log_metrics(metrics=scalar_metrics, step=step)
             logger.save()
 
+    def _update_progress_bar_metrics(self, metrics: _OUT_DICT) -> None:
+        if self._epoch_end_reached:
+            self._flush_progress_bar_metrics()
+            self._progress_bar_metrics.update(metrics_to_scalars(metrics))
+            return
+
+        # performance: the values of the steps are copied to the host without blocking, and shown once copied. Until
+        # then, the last copied values are shown and the newer ones are kept to be copied next
+        self._next_progress_bar_metrics.update(metrics)
+        pending = self._pending_progress_bar_metrics
+        if pending is not None:
+            if not pending.ready():
+                return
+            self._progress_bar_metrics.update(pending.to_scalars())
+            self._pending_progress_bar_metrics = None
+        metrics, self._next_progress_bar_metrics = self._next_progress_bar_metrics, {}
+        host_metrics = _HostMetrics(metrics)
+        if host_metrics.is_async:
+            self._pending_progress_bar_metrics = host_metrics
+        else:
+            self._progress_bar_metrics.update(host_metrics.to_scalars())
+
+    def _flush_progress_bar_metrics(self) -> None:
+        if self._pending_progress_bar_metrics is not None:
+            self._progress_bar_metrics.update(self._pending_progress_bar_metrics.to_scalars())
+            self._pending_progress_bar_metrics = None
+        if self._next_progress_bar_metrics:
+            self._progress_bar_metrics.update(metrics_to_scalars(self._next_progress_bar_metrics))
+            self._next_progress_bar_metrics = {}
+
     """
     Evaluation metric updates
     """
@@ -107,14 +223,14 @@ class LoggerConnector:
     def update_eval_step_metrics(self, step: int) -> None:
         assert not self._epoch_end_reached
         # logs user requested information to logger
-        self.log_metrics(self.metrics["log"], step=step)
+        self._log_step_metrics(self.metrics["log"], step=step)
 
     def update_eval_epoch_metrics(self) -> _OUT_DICT:
         assert self._epoch_end_reached
         if self.trainer.sanity_checking:
             return {}
         metrics = self.metrics
-        self._progress_bar_metrics.update(metrics["pbar"])
+        self._update_progress_bar_metrics(metrics["pbar"])
         self._callback_metrics.update(metrics["callback"])
         self._logged_metrics.update(metrics["log"])
         return metrics["log"]
@@ -141,7 +257,7 @@ class LoggerConnector:
         # when metrics should be logged
         assert not self._epoch_end_reached
         if self.should_update_logs or self.trainer.fast_dev_run:
-            self.log_metrics(self.metrics["log"])
+            self._log_step_metrics(self.metrics["log"])
 
     def update_train_epoch_metrics(self) -> None:
         # add the metrics to the loggers
@@ -177,7 +293,7 @@ class LoggerConnector:
     def on_epoch_end(self) -> None:
         assert self._epoch_end_reached
         metrics = self.metrics
-        self._progress_bar_metrics.update(metrics["pbar"])
+        self._update_progress_bar_metrics(metrics["pbar"])
         self._callback_metrics.update(metrics["callback"])
         self._logged_metrics.update(metrics["log"])
         self._current_fx = None
@@ -185,7 +301,7 @@ class LoggerConnector:
     def on_batch_end(self) -> None:
         assert not self._epoch_end_reached
         metrics = self.metrics
-        self._progress_bar_metrics.update(metrics["pbar"])
+        self._update_progress_bar_metrics(metrics["pbar"])
         self._callback_metrics.update(metrics["callback"])
         self._logged_metrics.update(metrics["log"])
 
@@ -204,6 +320,8 @@ class LoggerConnector:
 
     def reset_metrics(self) -> None:
         self._progress_bar_metrics = {}
+        self._pending_progress_bar_metrics = None
+        self._next_progress_bar_metrics = {}
         self._logged_metrics = {}
         self._callback_metrics = {}
 
@@ -241,10 +359,11 @@ class LoggerConnector:
     def progress_bar_metrics(self) -> _PBAR_DICT:
         if self.trainer._results:
             metrics = self.metrics["pbar"]
-            self._progress_bar_metrics.update(metrics)
+            self._update_progress_bar_metrics(metrics)
         return self._progress_bar_metrics
 
     def teardown(self) -> None:
+        self.flush_metrics()
         args = (Tensor, move_data_to_device, "cpu")
         self._logged_metrics = apply_to_collection(self._logged_metrics, *args)
         self._progress_bar_metrics = apply_to_collection(self._progress_bar_metrics, *args)
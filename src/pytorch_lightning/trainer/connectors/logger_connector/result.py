@@ -29,7 +29,6 @@ from pytorch_lightning.utilities.data import extract_batch_size
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _fault_tolerant_training
 from pytorch_lightning.utilities.memory import recursive_detach
-from pytorch_lightning.utilities.metrics import metrics_to_scalars
 from pytorch_lightning.utilities.rank_zero import rank_zero_warn
 from pytorch_lightning.utilities.warnings import PossibleUserWarning
 
@@ -43,7 +42,7 @@ _PBAR_DICT = Dict[str, _PBAR_METRIC]
 class _METRICS(TypedDict):
     callback: _OUT_DICT
     log: _OUT_DICT
-    pbar: _PBAR_DICT
+    pbar: _OUT_DICT
 
 
 warning_cache = WarningCache()
@@ -402,6 +401,9 @@ class _ResultCollection(dict):
         self.batch: Optional[Any] = None
         self.batch_size: Optional[int] = None
         self.dataloader_idx: Optional[int] = None
+        # the arguments of the latest `log` call of each key along with their metadata. performance: the following
+        # calls with the same arguments don't need to create and compare a new `_Metadata`
+        self._logged_metadata: Dict[str, Tuple[Tuple, _Metadata]] = {}
 
     @property
     def result_metrics(self) -> List[_ResultMetric]:
@@ -454,7 +456,8 @@ class _ResultCollection(dict):
         """See :meth:`~pytorch_lightning.core.module.LightningModule.log`"""
         # no metrics should be logged with graphs
         if not enable_graph:
-            value = recursive_detach(value)
+            # performance: most of the logged values are single tensors
+            value = value.detach() if isinstance(value, Tensor) else recursive_detach(value)
 
         # move metrics to cpu on TPU.
         if isinstance(value, Tensor) and value.device.type == "xla":
@@ -467,30 +470,51 @@ class _ResultCollection(dict):
             key += f".{self.dataloader_idx}"
             fx += f".{self.dataloader_idx}"
 
-        meta = _Metadata(
-            fx=fx,
-            name=name,
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            reduce_fx=reduce_fx,
-            enable_graph=enable_graph,
-            add_dataloader_idx=add_dataloader_idx,
-            dataloader_idx=self.dataloader_idx,
-            metric_attribute=metric_attribute,
+        arguments = (
+            fx,
+            prog_bar,
+            logger,
+            on_step,
+            on_epoch,
+            reduce_fx,
+            enable_graph,
+            sync_dist,
+            sync_dist_fn,
+            sync_dist_group,
+            add_dataloader_idx,
+            self.dataloader_idx,
+            metric_attribute,
+            rank_zero_only,
         )
-        meta.sync = _Sync(_should=sync_dist, fn=sync_dist_fn, _group=sync_dist_group, rank_zero_only=rank_zero_only)
+        logged = self._logged_metadata.get(key)
+        if key in self and logged is not None and logged[0] == arguments:
+            meta = logged[1]
+        else:
+            meta = _Metadata(
+                fx=fx,
+                name=name,
+                prog_bar=prog_bar,
+                logger=logger,
+                on_step=on_step,
+                on_epoch=on_epoch,
+                reduce_fx=reduce_fx,
+                enable_graph=enable_graph,
+                add_dataloader_idx=add_dataloader_idx,
+                dataloader_idx=self.dataloader_idx,
+                metric_attribute=metric_attribute,
+            )
+            meta.sync = _Sync(_should=sync_dist, fn=sync_dist_fn, _group=sync_dist_group, rank_zero_only=rank_zero_only)
 
-        # register logged value if it doesn't exist
-        if key not in self:
-            self.register_key(key, meta, value)
+            # register logged value if it doesn't exist
+            if key not in self:
+                self.register_key(key, meta, value)
 
-        # check the stored metadata and the current one match
-        elif meta != self[key].meta:
-            raise MisconfigurationException(
-                f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
-            )
+            # check the stored metadata and the current one match
+            elif meta != self[key].meta:
+                raise MisconfigurationException(
+                    f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
+                )
+            self._logged_metadata[key] = (arguments, meta)
 
         batch_size = self._extract_batch_size(self[key], batch_size, meta)
         self.update_metrics(key, value, batch_size)
@@ -516,7 +540,12 @@ class _ResultCollection(dict):
             result_metric.forward(v.to(self.device), batch_size)
             result_metric.has_reset = False
 
-        apply_to_collections(self[key], value, _ResultMetric, fn)
+        result_metric = self[key]
+        if isinstance(result_metric, _ResultMetric) and isinstance(value, Tensor):
+            # performance: skip traversing the collections for a single tensor
+            fn(result_metric, value)
+        else:
+            apply_to_collections(result_metric, value, _ResultMetric, fn)
 
     @staticmethod
     def _get_cache(result_metric: _ResultMetric, on_step: bool) -> Optional[Tensor]:
@@ -575,9 +604,59 @@ class _ResultCollection(dict):
             forked_name += dataloader_suffix
         return name, forked_name
 
+    def _sync_epoch_values(self) -> None:
+        """Computes the epoch values of the tensor metrics logged with ``sync_dist=True`` with one collective per
+        bucket of states sharing the same syncing function, reduction, process group, dtype and device, instead of one
+        collective per state."""
+        buckets: Dict[Tuple, List[Tuple[_ResultMetric, str]]] = {}
+
+        def collect(result_metric: _ResultMetric) -> None:
+            meta = result_metric.meta
+            sync = meta.sync
+            if (
+                not result_metric.is_tensor
+                or not meta.on_epoch
+                or meta.enable_graph
+                or result_metric._computed is not None
+                or not sync.should
+                or sync.rank_zero_only
+                or sync.fn is None
+            ):
+                return
+            states = ("value", "cumulated_batch_size") if meta.is_mean_reduction else ("value",)
+            for state in states:
+                tensor = getattr(result_metric, state)
+                # the insertion order is the logging order, so all ranks issue the collectives in the same order
+                buckets.setdefault((sync.fn, sync.op, sync.group, tensor.dtype, tensor.device), []).append(
+                    (result_metric, state)
+                )
+
+        for _, result_metric in self.valid_items():
+            apply_to_collection(result_metric, _ResultMetric, collect)
+
+        synced: Dict[_ResultMetric, Dict[str, Tensor]] = {}
+        for (fn, op, group, _, _), states in buckets.items():
+            tensors = [getattr(result_metric, state) for result_metric, state in states]
+            # the reductions are elementwise, so the states can be reduced together as a flat buffer
+            buffer = fn(torch.cat([tensor.reshape(-1) for tensor in tensors]), reduce_op=op, group=group)
+            values = buffer.split([tensor.numel() for tensor in tensors])
+            for (result_metric, state), tensor, value in zip(states, tensors, values):
+                synced.setdefault(result_metric, {})[state] = value.reshape(tensor.shape)
+
+        for result_metric, values in synced.items():
+            value = values["value"]
+            if result_metric.meta.is_mean_reduction:
+                value = value / values["cumulated_batch_size"]
+            # `_get_cache` returns the cached value instead of syncing the metric again
+            result_metric._computed = value
+
     def metrics(self, on_step: bool) -> _METRICS:
         metrics = _METRICS(callback={}, log={}, pbar={})
 
+        if not on_step:
+            # performance: sync the epoch values of all the metrics at once rather than one by one in `_get_cache`
+            self._sync_epoch_values()
+
         for _, result_metric in self.valid_items():
 
             # extract forward_cache or computed from the _ResultMetric. ignore when the output is None
@@ -609,9 +688,9 @@ class _ResultCollection(dict):
                 metrics["callback"][name] = value
                 metrics["callback"][forked_name] = value
 
-            # populate progress_bar metrics. convert tensors to numbers
+            # populate progress_bar metrics. the `LoggerConnector` converts the tensors to numbers
             if result_metric.meta.prog_bar:
-                metrics["pbar"][forked_name] = metrics_to_scalars(value)
+                metrics["pbar"][forked_name] = value
 
         return metrics
 
@@ -664,7 +743,7 @@ class _ResultCollection(dict):
         return f"{{{self.training}, {repr(self.device)}, {super().__repr__()}}}"
 
     def __getstate__(self, drop_value: bool = True) -> dict:
-        d = self.__dict__.copy()
+        d = {k: v for k, v in self.__dict__.items() if k != "_logged_metadata"}
         # all the items should be either `_ResultMetric`s or `_ResultMetricCollection`s
         items = {k: v.__getstate__(drop_value=drop_value) for k, v in self.items()}
         return {**d, "items": items}
@@ -673,6 +752,8 @@ class _ResultCollection(dict):
         self, state: dict, map_location: Optional[Union[str, torch.device]] = None, sync_fn: Optional[Callable] = None
     ) -> None:
         self.__dict__.update({k: v for k, v in state.items() if k != "items"})
+        # the reloaded metadata is checked against the arguments of the next `log` calls
+        self._logged_metadata = {}
 
         def setstate(k: str, item: dict) -> Union[_ResultMetric, _ResultMetricCollection]:
             if not isinstance(item, dict):
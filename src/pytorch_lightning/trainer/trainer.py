@@ -30,7 +30,7 @@ from contextlib import contextmanager
 from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Type, Union
 from weakref import proxy
 
 import torch
@@ -64,7 +64,7 @@ from pytorch_lightning.plugins import (
     PLUGIN_INPUT,
     PrecisionPlugin,
 )
-from pytorch_lightning.profilers import Profiler
+from pytorch_lightning.profilers import PassThroughProfiler, Profiler
 from pytorch_lightning.strategies import (
     DDPFullyShardedNativeStrategy,
     DDPStrategy,
@@ -431,6 +431,9 @@ class Trainer:
         self._checkpoint_connector = CheckpointConnector(self, resume_from_checkpoint)
         self._signal_connector = SignalConnector(self)
         self.tuner = Tuner(self)
+        # the dispatch table of each hook for the callbacks below, see `_get_callback_hooks`
+        self._callback_hooks: Dict[str, Tuple[List[Callback], List[Tuple[Callback, str]]]] = {}
+        self._callback_hooks_callbacks: List[Callback] = []
 
         fit_loop = FitLoop(min_epochs=min_epochs, max_epochs=max_epochs)
         training_epoch_loop = TrainingEpochLoop(min_steps=min_steps, max_steps=max_steps)
@@ -1016,6 +1019,8 @@ class Trainer:
 
         self._callback_connector._attach_model_callbacks()
         self._callback_connector._attach_model_logging_functions()
+        # the hooks of the callbacks could have been replaced since the previous run
+        self._callback_hooks = {}
 
         verify_loop_configurations(self)
 
@@ -1307,6 +1312,9 @@ class Trainer:
         # these could have become stale if metrics are defined in `setup`
         self.lightning_module._metric_attributes = None
 
+        # the metrics of the last logged step might still be copied to the host
+        self._logger_connector.flush_metrics()
+
         # todo: TPU 8 cores hangs in flush with TensorBoard. Might do for all loggers.
         # It might be related to xla tensors blocked when moving the cpu kill loggers.
         for logger in self.loggers:
@@ -1369,16 +1377,46 @@ class Trainer:
             prev_fx_name = pl_module._current_fx_name
             pl_module._current_fx_name = hook_name
 
-        for callback in self.callbacks:
-            fn = getattr(callback, hook_name)
-            if callable(fn):
-                with self.profiler.profile(f"[Callback]{callback.state_key}.{hook_name}"):
-                    fn(self, self.lightning_module, *args, **kwargs)
+        overriding_callbacks, profiled_callbacks = self._get_callback_hooks(hook_name)
+        if isinstance(self.profiler, PassThroughProfiler):
+            # performance: skip the no-op hooks and the profiler contexts, which do nothing
+            for callback in overriding_callbacks:
+                getattr(callback, hook_name)(self, self.lightning_module, *args, **kwargs)
+        else:
+            for callback, action_name in profiled_callbacks:
+                with self.profiler.profile(action_name):
+                    getattr(callback, hook_name)(self, self.lightning_module, *args, **kwargs)
 
         if pl_module:
             # restore current_fx when nested context
             pl_module._current_fx_name = prev_fx_name
 
+    def _get_callback_hooks(self, hook_name: str) -> Tuple[List[Callback], List[Tuple[Callback, str]]]:
+        """Returns the callbacks overriding the no-op hook of :class:`~pytorch_lightning.callbacks.Callback`, and
+        all the callbacks with the hook along with their profiler action names.
+
+        The table is computed once per hook and recomputed when the callbacks change.
+        """
+        if self.callbacks != self._callback_hooks_callbacks:
+            self._callback_hooks = {}
+            self._callback_hooks_callbacks = list(self.callbacks)
+
+        callback_hooks = self._callback_hooks.get(hook_name)
+        if callback_hooks is None:
+            no_op = getattr(Callback, hook_name, None)
+            overriding_callbacks = []
+            profiled_callbacks = []
+            for callback in self.callbacks:
+                fn = getattr(callback, hook_name)
+                if not callable(fn):
+                    continue
+                if getattr(fn, "__func__", fn) is not no_op:
+                    overriding_callbacks.append(callback)
+                # the profiler reports all the callbacks, as before
+                profiled_callbacks.append((callback, f"[Callback]{callback.state_key}.{hook_name}"))
+            callback_hooks = self._callback_hooks[hook_name] = (overriding_callbacks, profiled_callbacks)
+        return callback_hooks
+
     def _call_callbacks_state_dict(self) -> Dict[str, dict]:
         """Called when saving a model checkpoint, calls and returns every callback's `state_dict`, keyed by
         `Callback.state_key`."""
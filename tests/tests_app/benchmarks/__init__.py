@@ -0,0 +1,74 @@
+import os
+import statistics
+import time
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+# The benchmarks run with small sizes by default, set `LIGHTNING_RUNNING_BENCHMARKS=1` to run the full sweeps.
+_EXTEND_BENCHMARKS = os.getenv("LIGHTNING_RUNNING_BENCHMARKS", "0") == "1"
+_MARK_SHORT_BM = pytest.mark.skipif(not _EXTEND_BENCHMARKS, reason="Only run during Benchmarking")
+
+
+class Timer:
+    """Records the wall time of each of its ``with`` blocks.
+
+    Example:
+
+        timer = Timer()
+        for _ in range(10):
+            with timer:
+                fn()
+        print(format_duration(timer.mean))
+    """
+
+    def __init__(self) -> None:
+        self.durations: List[float] = []
+        self._t0 = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.durations.append(time.perf_counter() - self._t0)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self.durations)
+
+    def quantile(self, q: float) -> float:
+        """Returns the ``q`` quantile of the durations, e.g. ``0.99`` for the p99."""
+        return statistics.quantiles(self.durations, n=100)[round(q * 100) - 1]
+
+
+def measure(fn: Callable, *args: Any, **kwargs: Any) -> Tuple[float, Any]:
+    """Returns the wall time of ``fn(*args, **kwargs)`` and its result."""
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - t0, result
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+
+def print_results(case: str, **results: Any) -> None:
+    """Prints a row of the results of a benchmark case, the floats being durations in seconds.
+
+    The underscores of the names are printed as spaces, e.g. ``print_results("10 works", first_get=0.5)`` prints
+    ``10 works | first get 500.00ms``.
+    """
+    columns = [
+        f"{name.replace('_', ' ')} {format_duration(value) if isinstance(value, float) else value}"
+        for name, value in results.items()
+    ]
+    print(" | ".join([case] + columns))
@@ -0,0 +1,106 @@
+import json
+import time
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.utilities.app_helpers import InMemoryStateStore
+
+
+def make_state(num_works: int, step: int) -> dict:
+    """The state of an app with ``num_works`` works, where a single work reports its progress at each step."""
+    works = {
+        f"work_{i}": {"vars": {"progress": step if i == 0 else 0, "logs": ["line"] * 10, "_url": f"http://work_{i}"}}
+        for i in range(num_works)
+    }
+    return {"vars": {"step": step}, "flows": {}, "works": works}
+
+
+@pytest.mark.parametrize("num_works", [10, 100, pytest.param(1000, marks=_MARK_SHORT_BM)])
+def test_state_update_payload(num_works):
+    """Compare the bytes sent to the UI for an update of the app state, as the full state fetched from ``GET
+    /api/v1/state`` and as the JSON patch pushed over the websocket."""
+    store = InMemoryStateStore()
+    store.add("1234")
+    store.set_app_state("1234", make_state(num_works, 0))
+    num_updates = 100
+    full_bytes = patch_bytes = 0
+    timer = Timer()
+    for step in range(1, num_updates + 1):
+        state = make_state(num_works, step)
+        with timer:
+            store.set_app_state("1234", state)
+        full_bytes += len(json.dumps(store.get_app_state("1234")))
+        version = store.get_version("1234")
+        message = {"type": "patch", "version": version, "patch": store.get_patches("1234", version - 1)}
+        patch_bytes += len(json.dumps(message))
+    print_results(
+        f"{num_works} works",
+        full_state=f"{full_bytes // num_updates}B",
+        patch=f"{patch_bytes // num_updates}B",
+        stored_in=timer.mean,
+    )
+    assert patch_bytes < full_bytes
+
+
+@pytest.mark.parametrize("num_works", [10, pytest.param(1000, marks=_MARK_SHORT_BM)])
+def test_frontend_rerun_latency(num_works, monkeypatch):
+    """Compare the duration of the reruns of a frontend attached to a flow, reading the state of the flow through an
+    AppState of the whole app state and through an AppState scoped to the flow, while the works report their
+    progress."""
+    import queue
+    import threading
+
+    import uvicorn
+
+    from lightning_app.core import api
+    from lightning_app.frontend.utils import _get_scoped_app_state, _reduce_to_flow_scope
+    from lightning_app.utilities import state as state_module
+    from lightning_app.utilities.network import find_free_network_port
+    from lightning_app.utilities.state import AppState
+
+    monkeypatch.setattr(api, "api_app_delta_queue", queue.Queue())
+    port = find_free_network_port()
+    monkeypatch.setattr(state_module, "APP_SERVER_PORT", port)
+    server = uvicorn.Server(uvicorn.Config(api.fastapi_service, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    def publish(step):
+        state = make_state(num_works, step)
+        state["flows"]["flow"] = {"vars": {"value": 0, "_layout": {"target": "http://flow"}}, "flows": {}, "works": {}}
+        with api.lock:
+            api.global_app_state_store.set_app_state(api.TEST_SESSION_UUID, state)
+
+    num_reruns = 50
+    durations = {}
+    try:
+        for name in ("app state", "scoped"):
+            for write in (False, True):
+                timer = Timer()
+                for step in range(num_reruns):
+                    publish(step)
+                    with timer:
+                        if name == "app state":
+                            flow_state = _reduce_to_flow_scope(AppState(), "root.flow")
+                        else:
+                            flow_state = _get_scoped_app_state("root.flow")
+                        assert flow_state.value == 0
+                        if write:
+                            flow_state.value = step + 1
+                durations[(name, write)] = timer.mean
+    finally:
+        server.should_exit = True
+        thread.join()
+        api.global_app_state_store.remove(api.TEST_SESSION_UUID)
+        api.global_app_state_store.add(api.TEST_SESSION_UUID)
+
+    print_results(
+        f"{num_works} works",
+        rerun=durations[("app state", False)],
+        scoped_rerun=durations[("scoped", False)],
+        rerun_with_an_update=durations[("app state", True)],
+        scoped_rerun_with_an_update=durations[("scoped", True)],
+    )
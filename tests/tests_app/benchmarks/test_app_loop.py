@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+from deepdiff import DeepDiff
+from lightning_utilities.core.apply_func import apply_to_collection
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app import LightningApp, LightningFlow, LightningWork
+from lightning_app.core.queues import SingleProcessQueue
+from lightning_app.storage import Drive, Path
+from lightning_app.structures import List
+from lightning_app.utilities import delta_engine
+
+
+class CounterWork(LightningWork):
+    def __init__(self):
+        super().__init__(parallel=True, start_with_flow=False)
+        self.counter = 0
+        self.history = list(range(10))
+
+    def run(self):
+        pass
+
+
+class CounterFlow(LightningFlow):
+    def __init__(self, num_works: int):
+        super().__init__()
+        self.counter = 0
+        self.ws = List(*[CounterWork() for _ in range(num_works)])
+
+    def run(self):
+        self.counter += 1
+
+
+def _deepdiff_apply_changes(app: LightningApp) -> None:
+    """The ``DeepDiff`` based diffing used by ``LightningApp.maybe_apply_changes`` before the delta engine."""
+    last_state = apply_to_collection(app.last_state, (Path, Drive), lambda x: x.to_dict())
+    state = apply_to_collection(app.state, (Path, Drive), lambda x: x.to_dict())
+    if DeepDiff(last_state, state, verbose_level=2):
+        app.set_last_state(app.state)
+
+
+def measure_loop(num_works: int, num_iterations: int, apply_changes_fn) -> float:
+    """Returns the average duration of a loop iteration without incoming deltas."""
+    app = LightningApp(CounterFlow(num_works))
+    app.delta_queue = SingleProcessQueue("delta_queue", 0)
+    app.state_accumulate_wait = 0
+    timer = Timer()
+    for _ in range(num_iterations):
+        app.root.run()
+        with timer:
+            apply_changes_fn(app)
+        assert app.last_state["vars"]["counter"] == app.root.counter
+    return timer.mean
+
+
+@pytest.mark.parametrize("num_works", [10, 100])
+def test_app_loop_state_diffing_compares_assigned_vars(num_works):
+    """The delta engine finds the same state as ``DeepDiff`` without comparing the unassigned scalars of the works."""
+    app = LightningApp(CounterFlow(num_works))
+    app.delta_queue = SingleProcessQueue("delta_queue", 0)
+    app.state_accumulate_wait = 0
+    for _ in range(3):
+        app.root.run()
+        with mock.patch.object(delta_engine, "_changed_vars", wraps=delta_engine._changed_vars) as changed_vars:
+            app.maybe_apply_changes()
+        # the counters of the works are never assigned, so only their variables holding mutable values are compared
+        work_compared_vars = [args[2] for args, _ in changed_vars.call_args_list if args[0].name != "root"]
+        assert len(work_compared_vars) == num_works
+        assert all("history" in names and "counter" not in names for names in work_compared_vars)
+        assert app.last_state["vars"]["counter"] == app.root.counter
+        assert not DeepDiff(app.last_state, app.state)
+
+
+@pytest.mark.parametrize(
+    "num_works",
+    [
+        pytest.param(10, marks=_MARK_SHORT_BM),
+        pytest.param(100, marks=_MARK_SHORT_BM),
+        pytest.param(1_000, marks=_MARK_SHORT_BM),
+        pytest.param(10_000, marks=_MARK_SHORT_BM),
+    ],
+)
+def test_app_loop_state_diffing(num_works):
+    """Compare the loop iteration time of the delta engine against a full ``DeepDiff`` of the app state."""
+    num_iterations = 5
+    engine = measure_loop(num_works, num_iterations, LightningApp.maybe_apply_changes)
+    deepdiff = measure_loop(num_works, num_iterations, _deepdiff_apply_changes)
+    print_results(f"{num_works} works", delta_engine=engine, DeepDiff=deepdiff)
+    assert engine < deepdiff
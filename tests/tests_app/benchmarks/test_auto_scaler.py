@@ -0,0 +1,86 @@
+import asyncio
+import gc
+from typing import List, Tuple
+
+import pytest
+from aiohttp import web
+from tests_app.benchmarks import _MARK_SHORT_BM, measure, print_results, Timer
+
+from lightning_app.components.auto_scaler import _LoadBalancer
+
+
+async def start_stub_server(inference_time: float):
+    """A model server answering the batches after ``inference_time`` seconds."""
+
+    async def predict(request):
+        inputs = (await request.json())["inputs"]
+        await asyncio.sleep(inference_time)
+        return web.json_response({"outputs": inputs})
+
+    app = web.Application()
+    app.router.add_post("/predict", predict)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+async def measure_latencies(
+    num_clients: int, num_requests: int, inference_times: List[float], routing: str = "round_robin"
+) -> Tuple[Timer, List[int]]:
+    """Returns the latencies of the requests sent one after another by each of the clients, to a server per
+    inference time, and the number of batches each server received."""
+    # the objects of the test session are moved out of the collected generations, so the full collections don't
+    # pause the event loop longer than they would in the process of the load balancer
+    gc.collect()
+    gc.freeze()
+    servers = [await start_stub_server(inference_time) for inference_time in inference_times]
+    load_balancer = _LoadBalancer(
+        input_type=dict, output_type=dict, endpoint="predict", max_batch_size=8, timeout_batching=0.02, routing=routing
+    )
+    load_balancer.servers = [url for _, url in servers]
+    consumer = asyncio.create_task(load_balancer.consumer())
+    timer = Timer()
+
+    async def client(i: int):
+        # a timer per client, as the clients await their requests concurrently
+        client_timer = Timer()
+        for j in range(num_requests):
+            with client_timer:
+                assert await load_balancer.process_request({"x": [i, j]}) == {"x": [i, j]}
+        timer.durations.extend(client_timer.durations)
+
+    try:
+        await asyncio.gather(*(client(i) for i in range(num_clients)))
+    finally:
+        consumer.cancel()
+        await load_balancer.close_sessions()
+        for runner, _ in servers:
+            await runner.cleanup()
+        gc.unfreeze()
+    return timer, [load_balancer._servers_stats[url].num_batches for _, url in servers]
+
+
+@pytest.mark.parametrize("num_clients, num_requests", [(1, 100), (32, 30), pytest.param(256, 50, marks=_MARK_SHORT_BM)])
+def test_load_balancer_latency(num_clients, num_requests):
+    """Measure the p50 and p99 latencies of the requests going through the load balancer to a server with an
+    inference time of 5ms."""
+    timer, _ = asyncio.run(measure_latencies(num_clients, num_requests, inference_times=[0.005]))
+    print_results(f"{num_clients} clients", p50=timer.quantile(0.5), p99=timer.quantile(0.99))
+
+
+@pytest.mark.parametrize("routing", ["round_robin", "least_outstanding", "ewma_latency", "power_of_two"])
+def test_load_balancer_routing_latency(routing):
+    """Measure the p50 and p99 latencies of the requests balanced across two fast servers and a slow one."""
+    duration, (timer, num_batches) = measure(
+        asyncio.run, measure_latencies(64, 100, inference_times=[0.005, 0.005, 0.1], routing=routing)
+    )
+    print_results(
+        routing,
+        throughput=f"{len(timer.durations) / duration:.0f} requests/s",
+        batches_per_server=num_batches,
+        p50=timer.quantile(0.5),
+        p99=timer.quantile(0.99),
+    )
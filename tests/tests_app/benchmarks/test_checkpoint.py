@@ -0,0 +1,47 @@
+import os
+import pickle
+import time
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.utilities.checkpoint import _CheckpointLog
+
+
+def make_state(num_works: int, step: int) -> dict:
+    """The state of an app with ``num_works`` works, where a single work reports its progress at each step."""
+    works = {
+        f"work_{i}": {"vars": {"progress": step if i == 0 else 0, "logs": [f"line {j}" for j in range(100)]}}
+        for i in range(num_works)
+    }
+    return {"vars": {"step": step}, "flows": {}, "works": works}
+
+
+@pytest.mark.parametrize("num_works", [10, 100, pytest.param(1000, marks=_MARK_SHORT_BM)])
+def test_checkpoint_write(tmpdir, num_works):
+    """Compare the duration and the size of the checkpoints written as a single pickle of the state and with the
+    snapshots and the log of the changes."""
+    num_checkpoints = 100
+    legacy_dir, log_dir = os.path.join(tmpdir, "legacy"), os.path.join(tmpdir, "log")
+    os.makedirs(legacy_dir)
+    legacy_timer, log_timer = Timer(), Timer()
+    log = _CheckpointLog(log_dir)
+    for step in range(num_checkpoints):
+        state = make_state(num_works, step)
+        with legacy_timer:
+            with open(os.path.join(legacy_dir, f"v_{step}_{time.time()}.json"), "wb") as f:
+                pickle.dump(state, f)
+        with log_timer:
+            log.write(state)
+
+    def size(path):
+        return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+    print_results(
+        f"{num_works} works",
+        pickle=legacy_timer.mean,
+        pickle_on_disk=f"{size(legacy_dir)}B",
+        log=log_timer.mean,
+        log_on_disk=f"{size(log_dir)}B",
+    )
+    assert size(log_dir) < size(legacy_dir)
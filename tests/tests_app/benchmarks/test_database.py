@@ -0,0 +1,65 @@
+import os
+import threading
+import time
+from typing import Optional
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, measure, print_results, Timer
+
+from lightning_app.components.database import DatabaseClient
+from lightning_app.utilities.imports import _is_sqlmodel_available
+
+if _is_sqlmodel_available():
+    from sqlmodel import Field, SQLModel
+
+    class BenchmarkRow(SQLModel, table=True):
+        __table_args__ = {"extend_existing": True}
+
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        value: float
+
+
+@pytest.fixture
+def db_url(tmpdir):
+    import uvicorn
+
+    from lightning_app.components.database.server import _create_app
+    from lightning_app.components.database.utilities import _create_database
+    from lightning_app.utilities.network import find_free_network_port
+
+    _create_database(os.path.join(tmpdir, "database.db"), [BenchmarkRow])
+    app = _create_app([BenchmarkRow], None)
+
+    port = find_free_network_port()
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+@pytest.mark.parametrize("num_rows", [100, pytest.param(10000, marks=_MARK_SHORT_BM)])
+def test_database_throughput(db_url, num_rows):
+    """Compare the rows written per second with a request per row and with the bulk requests."""
+    client = DatabaseClient(db_url, model=BenchmarkRow)
+    rows = [BenchmarkRow(name=f"row_{i}", value=i) for i in range(num_rows)]
+
+    insert_timer = Timer()
+    for row in rows[: num_rows // 10]:
+        with insert_timer:
+            client.insert(row)
+    insert_many_duration, _ = measure(client.insert_many, rows)
+    with Timer() as select_timer:
+        pages = [client.select(limit=1000, offset=offset) for offset in range(0, num_rows, 1000)]
+    print_results(
+        f"{num_rows} rows",
+        insert=f"{len(insert_timer.durations) / insert_timer.total:.0f} rows/s",
+        insert_many=f"{num_rows / insert_many_duration:.0f} rows/s",
+        select_by_pages_of_1000=f"{num_rows / select_timer.total:.0f} rows/s",
+    )
+    assert sum(len(page) for page in pages) >= num_rows
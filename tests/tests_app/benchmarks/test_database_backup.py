@@ -0,0 +1,63 @@
+import os
+import sqlite3
+import tempfile
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.components.database.backup import _DatabaseBackup
+from lightning_app.storage import Drive
+
+
+def store_whole_database(db_filename: str) -> int:
+    """The database stored as a single file, as by the previous versions of the ``Database``."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_db_filename = os.path.join(tmpdir, os.path.basename(db_filename))
+        source = sqlite3.connect(db_filename)
+        dest = sqlite3.connect(tmp_db_filename)
+        source.backup(dest)
+        source.close()
+        dest.close()
+        drive = Drive("lit://database", component_name="root.legacy", root_folder=tmpdir)
+        drive.put(os.path.basename(tmp_db_filename))
+        return os.path.getsize(tmp_db_filename)
+
+
+@pytest.mark.parametrize("num_rows", [1000, pytest.param(100000, marks=_MARK_SHORT_BM)])
+def test_database_backup(tmpdir, monkeypatch, num_rows):
+    """Compare the duration of the backups and the bytes uploaded to an object store, where a file can't be partially
+    updated, after a few rows are written."""
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", os.path.join(tmpdir, "storage"))
+    db_filename = os.path.join(tmpdir, "database.db")
+    connection = sqlite3.connect(db_filename)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE rows (id INTEGER PRIMARY KEY, data BLOB)")
+    connection.executemany("INSERT INTO rows VALUES (?, ?)", [(i, os.urandom(500)) for i in range(num_rows)])
+    connection.commit()
+
+    backup = _DatabaseBackup(db_filename, "root.db")
+    backup.store()
+    num_backups = 10
+    legacy_timer = Timer()
+    duration = 0.0
+    legacy_bytes = num_bytes = 0
+    for step in range(num_backups):
+        connection.executemany(
+            "INSERT INTO rows VALUES (?, ?)", [(num_rows + step * 10 + i, os.urandom(500)) for i in range(10)]
+        )
+        connection.commit()
+        with legacy_timer:
+            legacy_bytes += store_whole_database(db_filename)
+        backup.store()
+        duration += backup.stats.duration
+        num_bytes += backup.stats.bytes_uploaded
+    connection.close()
+
+    print_results(
+        f"{num_rows} rows",
+        whole_file=legacy_timer.mean,
+        whole_file_uploaded=f"{legacy_bytes // num_backups}B",
+        chunks=duration / num_backups,
+        chunks_uploaded=f"{num_bytes // num_backups}B",
+    )
+    assert num_bytes <= legacy_bytes
@@ -0,0 +1,87 @@
+import os
+import time
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.storage import copier, drive
+from lightning_app.storage.drive import Drive
+
+
+class _RemoteFileSystem(LocalFileSystem):
+    """A local filesystem with the latency of the requests to an object store."""
+
+    latency = 0.002
+
+    def _request(self):
+        time.sleep(self.latency)
+
+    def exists(self, *args, **kwargs):
+        self._request()
+        return super().exists(*args, **kwargs)
+
+    def ls(self, *args, **kwargs):
+        self._request()
+        return super().ls(*args, **kwargs)
+
+    def cp_file(self, *args, **kwargs):
+        self._request()
+        return super().cp_file(*args, **kwargs)
+
+
+@pytest.mark.parametrize("num_files", [50, pytest.param(1000, marks=_MARK_SHORT_BM)])
+def test_drive_many_small_files(tmpdir, monkeypatch, num_files):
+    """Compare putting and getting small files one by one and concurrently, and listing the Drive with and without
+    the listing cache, through a filesystem with some latency."""
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", os.path.join(tmpdir, "storage"))
+    monkeypatch.setattr(drive, "_filesystem", _RemoteFileSystem)
+    monkeypatch.setattr(copier, "_filesystem", _RemoteFileSystem)
+    src, dst = os.path.join(tmpdir, "src"), os.path.join(tmpdir, "dst")
+    os.makedirs(src)
+    os.makedirs(dst)
+    paths = [f"file_{i}.bin" for i in range(num_files)]
+    for path in paths:
+        with open(os.path.join(src, path), "wb") as f:
+            f.write(os.urandom(4096))
+
+    durations = {}
+    for name, component_name in (("sequential", "root.a"), ("concurrent", "root.b")):
+        writer = Drive("lit://bm", allow_duplicates=True, component_name=component_name, root_folder=src)
+        reader = Drive("lit://bm", component_name="root.c", root_folder=dst)
+        with Timer() as put_timer:
+            if name == "sequential":
+                for path in paths:
+                    writer.put(path)
+            else:
+                writer.put_many(paths)
+        with Timer() as get_timer:
+            if name == "sequential":
+                for path in paths:
+                    reader.get(path, component_name=component_name, overwrite=True)
+            else:
+                reader.get_many(paths, component_name=component_name, overwrite=True)
+        durations[name] = (put_timer.total, get_timer.total)
+    assert reader.stats.num_gets == num_files
+    assert reader.stats.bytes_got == num_files * 4096
+
+    num_lists = 100
+    for ttl in (0.0, 1.0):
+        monkeypatch.setattr(drive, "DRIVE_LIST_CACHE_TTL", ttl)
+        list_timer = Timer()
+        for _ in range(num_lists):
+            with list_timer:
+                files = reader.list(".", component_name="root.a")
+            assert len(files) == num_files
+        durations[f"list ttl={ttl}"] = list_timer.mean
+
+    print_results(
+        f"{num_files} files",
+        put=durations["sequential"][0],
+        put_many=durations["concurrent"][0],
+        get=durations["sequential"][1],
+        get_many=durations["concurrent"][1],
+        get_throughput=f"{reader.stats.get_throughput / 1e6:.1f}MB/s",
+        list=durations["list ttl=0.0"],
+        cached_list=durations["list ttl=1.0"],
+    )
@@ -0,0 +1,73 @@
+import asyncio
+import multiprocessing as mp
+import time
+
+import aiohttp
+import pytest
+from lightning_utilities.core.imports import module_available
+from tests_app.benchmarks import _MARK_SHORT_BM, measure, print_results
+
+from lightning_app.components import PythonServer
+from lightning_app.utilities.imports import _is_torch_available
+from lightning_app.utilities.network import _configure_session, find_free_network_port
+
+
+def busy_wait(duration: float) -> None:
+    """Keeps the CPU busy and holds the GIL, as the models running Python code do."""
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+class SlowModelServer(PythonServer):
+    """Serves a model which takes 5ms per call plus 0.1ms per input."""
+
+    def __init__(self, port, max_batch_size):
+        super().__init__(port=port, max_batch_size=max_batch_size, max_wait_ms=5)
+
+    def predict(self, data):
+        return self.predict_batch([data])[0]
+
+    def predict_batch(self, requests):
+        busy_wait(0.005 + 0.0001 * len(requests))
+        return [{"prediction": request.payload} for request in requests]
+
+
+def target_fn(port, max_batch_size):
+    SlowModelServer(port=port, max_batch_size=max_batch_size).run()
+
+
+async def load_test(url: str, num_clients: int, num_requests: int) -> None:
+    """Sends the requests of the clients, each client sending its requests one after another."""
+
+    async def client(session):
+        for i in range(num_requests):
+            async with session.post(url, json={"payload": str(i)}) as response:
+                assert (await response.json())["prediction"] == str(i)
+
+    connector = aiohttp.TCPConnector(limit=num_clients)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(client(session) for _ in range(num_clients)))
+
+
+@pytest.mark.skipif(not _is_torch_available(), reason="torch isn't installed.")
+@pytest.mark.skipif(not module_available("lightning_api_access"), reason="lightning_api_access isn't installed.")
+@pytest.mark.parametrize("max_batch_size", [1, 16])
+@pytest.mark.parametrize("num_clients", [16, pytest.param(128, marks=_MARK_SHORT_BM)])
+def test_python_server_throughput(max_batch_size, num_clients):
+    """Measure the throughput of a single PythonServer replica, with and without batching the requests."""
+    port = find_free_network_port()
+    process = mp.Process(target=target_fn, args=(port, max_batch_size))
+    process.start()
+    try:
+        url = f"http://127.0.0.1:{port}/predict"
+        # waits for the server to be up
+        _configure_session().post(url, json={"payload": "0"})
+        num_requests = 50
+        duration, _ = measure(asyncio.run, load_test(url, num_clients, num_requests))
+    finally:
+        process.terminate()
+    print_results(
+        f"max_batch_size={max_batch_size}, {num_clients} clients",
+        throughput=f"{num_clients * num_requests / duration:.0f} requests/s",
+    )
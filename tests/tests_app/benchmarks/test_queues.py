@@ -0,0 +1,96 @@
+import multiprocessing
+import sys
+import threading
+
+import pytest
+from tests_app.benchmarks import _EXTEND_BENCHMARKS, _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.core import queues
+from lightning_app.core.queues import QueuingSystem
+from lightning_app.testing.http_queue_server import _HTTPQueueServer
+
+
+def _echo(request_queue, response_queue, num_items):
+    for _ in range(num_items):
+        response_queue.put(request_queue.get())
+
+
+def _produce(request_queue, payload, num_items):
+    for _ in range(num_items):
+        request_queue.put(payload)
+
+
+def measure_latency(queuing_system: QueuingSystem, payload, num_items: int) -> float:
+    """Returns the average round-trip time of a payload sent to another process and back."""
+    request_queue = queuing_system.get_queue("request")
+    response_queue = queuing_system.get_queue("response")
+    process = multiprocessing.get_context("fork").Process(target=_echo, args=(request_queue, response_queue, num_items))
+    process.start()
+    timer = Timer()
+    for _ in range(num_items):
+        with timer:
+            request_queue.put(payload)
+            response = response_queue.get()
+        assert response == payload
+    process.join()
+    return timer.mean
+
+
+def measure_throughput(queuing_system: QueuingSystem, payload, num_items: int) -> float:
+    """Returns the number of payloads received per second from another process."""
+    request_queue = queuing_system.get_queue("request")
+    process = multiprocessing.get_context("fork").Process(target=_produce, args=(request_queue, payload, num_items))
+    items = []
+    with Timer() as timer:
+        process.start()
+        while len(items) < num_items:
+            items.extend(request_queue.get_many(num_items))
+    process.join()
+    assert items == [payload] * num_items
+    return num_items / timer.total
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork isn't available on Windows")
+@pytest.mark.parametrize(
+    "payload_size",
+    [100, 10_000, pytest.param(1_000_000, marks=_MARK_SHORT_BM), pytest.param(8_000_000, marks=_MARK_SHORT_BM)],
+)
+def test_shared_memory_queue(payload_size):
+    """Compare the latency and throughput of the shared memory queue against the ``multiprocessing.Queue``."""
+    # a state-like payload made of many small values.
+    payload = {"vars": {f"key_{i}": "x" * 90 for i in range(payload_size // 100)}}
+    num_items = 100 if payload_size < 1_000_000 else 10
+    throughputs = {}
+    for queuing_system in (QueuingSystem.MULTIPROCESS, QueuingSystem.SHARED_MEMORY):
+        latency = measure_latency(queuing_system, payload, num_items)
+        # the best of a few runs, as the throughput of a single run is noisy
+        throughputs[queuing_system] = max(measure_throughput(queuing_system, payload, num_items) for _ in range(3))
+        print_results(
+            f"{queuing_system.value} with a payload of {payload_size} bytes",
+            latency=latency,
+            throughput=f"{throughputs[queuing_system]:.0f} items/s",
+        )
+    # both queues pickle the payloads, so the shared memory one should be at least on par, with some slack for noise.
+    # The timings are too noisy to be compared in the default run, which only checks the contents of the round-trips
+    if _EXTEND_BENCHMARKS:
+        assert throughputs[QueuingSystem.SHARED_MEMORY] > 0.75 * throughputs[QueuingSystem.MULTIPROCESS]
+
+
+@pytest.mark.parametrize("batching", [True, False])
+def test_http_queue(batching, monkeypatch):
+    """Compare the delivery latency and the number of requests of the HTTP queue with and without long-polling."""
+    num_items = 10
+    with _HTTPQueueServer(batching=batching) as server:
+        monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+        request_queue = QueuingSystem.HTTP.get_queue("app_request")
+
+        timer = Timer()
+        for i in range(num_items):
+            with timer:
+                threading.Timer(0.1, request_queue.put, args=({"i": i},)).start()
+                assert request_queue.get(timeout=5) == {"i": i}
+        print_results(
+            f"HTTP queue {'with' if batching else 'without'} long-polling",
+            latency=timer.mean - 0.1,
+            requests=server.num_requests,
+        )
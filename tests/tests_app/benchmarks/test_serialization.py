@@ -0,0 +1,48 @@
+import pytest
+from deepdiff import DeepDiff, Delta
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.utilities.imports import _is_msgpack_available
+from lightning_app.utilities.proxies import ComponentDelta
+from lightning_app.utilities.serialization import MsgpackSerializer, PickleSerializer
+
+
+def make_delta(num_values: int) -> ComponentDelta:
+    """A delta of a work updating ``num_values`` of its state variables."""
+    before = {"vars": {f"var_{i}": {"counter": 0, "logs": ["a"]} for i in range(num_values)}}
+    after = {"vars": {f"var_{i}": {"counter": i, "logs": ["a", "b"]} for i in range(num_values)}}
+    return ComponentDelta(id="root.work", delta=Delta(DeepDiff(before, after, verbose_level=2)))
+
+
+def measure_serializer(serializer, obj, num_iterations: int):
+    """Returns the encoded size and the average encode and decode durations."""
+    dumps, loads = Timer(), Timer()
+    for _ in range(num_iterations):
+        with dumps:
+            data = serializer.dumps(obj)
+    for _ in range(num_iterations):
+        with loads:
+            serializer.loads(data)
+    return len(data), dumps.mean, loads.mean
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+@pytest.mark.parametrize("num_values", [1, 10, 100, pytest.param(10_000, marks=_MARK_SHORT_BM)])
+def test_delta_serialization(num_values):
+    """Compare the payload size and the encoding speed of the msgpack serializer against pickle."""
+    delta = make_delta(num_values)
+    num_iterations = 1000 if num_values < 10_000 else 10
+    pickle_size, pickle_dumps, pickle_loads = measure_serializer(PickleSerializer(), delta, num_iterations)
+    msgpack_size, msgpack_dumps, msgpack_loads = measure_serializer(MsgpackSerializer(), delta, num_iterations)
+    print_results(
+        f"{num_values} values",
+        pickle=f"{pickle_size}B",
+        pickle_dumps=pickle_dumps,
+        pickle_loads=pickle_loads,
+        msgpack=f"{msgpack_size}B",
+        msgpack_dumps=msgpack_dumps,
+        msgpack_loads=msgpack_loads,
+    )
+    if num_values <= 10:
+        # pickle memoizes the repeated keys, so the gain is on the small deltas sent for every attribute update.
+        assert msgpack_size < pickle_size
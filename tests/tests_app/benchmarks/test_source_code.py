@@ -0,0 +1,47 @@
+import hashlib
+import os
+
+import pytest
+from tests_app.benchmarks import _EXTEND_BENCHMARKS, _MARK_SHORT_BM, measure, print_results
+
+from lightning_app.source_code import hashing, LocalSourceCodeDir
+
+
+def _hash_contents(files) -> str:
+    """The hash of the contents of the files, as computed before the digests were indexed."""
+    h = hashlib.blake2b(digest_size=20)
+    for file in files:
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(128 * h.block_size), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+@pytest.mark.parametrize("num_files", [2_000, pytest.param(50_000, marks=_MARK_SHORT_BM)])
+def test_source_code_version(num_files, tmp_path, monkeypatch):
+    """Measure the time to hash the source code of an app, the first time and once indexed."""
+    monkeypatch.setattr(LocalSourceCodeDir, "cache_location", tmp_path / "cache")
+    monkeypatch.setattr(hashing, "RACY_MTIME_SECONDS", 0)
+    source_path = tmp_path / "source"
+    for i in range(num_files):
+        directory = source_path / f"package_{i // 100}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"module_{i}.py").write_bytes(os.urandom(4_000))
+    files = LocalSourceCodeDir(path=source_path).files
+
+    # the best of a few runs, as the first ones warm up the page cache
+    baseline = min(measure(_hash_contents, files)[0] for _ in range(3))
+    cold = []
+    for i in range(3):
+        index_file = tmp_path / f"index_{i}.json"
+        elapsed, cold_hash = measure(hashing._get_hash, files, index_file=index_file)
+        hashing._wait_for_index(index_file)
+        cold.append(elapsed)
+    warm, warm_hash = measure(hashing._get_hash, files, index_file=index_file)
+    print_results(f"{num_files} files", baseline=baseline, cold=min(cold), warm=warm)
+
+    assert warm_hash == cold_hash
+    if _EXTEND_BENCHMARKS:
+        # with some slack for the timing noise
+        assert min(cold) < 1.25 * baseline
+        assert warm < min(cold)
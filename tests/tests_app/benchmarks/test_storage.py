@@ -0,0 +1,59 @@
+import os
+import pathlib
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, measure, print_results
+
+from lightning_app.storage import Path
+from lightning_app.storage.requests import _GetRequest
+from lightning_app.testing.helpers import _MockQueue
+from lightning_app.utilities.component import _context
+
+
+class _OriginQueue(_MockQueue):
+    """Serves the requests of a Path synchronously, as the Copier of the origin Work running on another machine
+    would do from its ``origin_dir``."""
+
+    def __init__(self, origin_dir: pathlib.Path, response_queue: _MockQueue):
+        super().__init__()
+        self.origin_dir = origin_dir
+        self.response_queue = response_queue
+
+    def put(self, request: _GetRequest):
+        request.path = str(self.origin_dir / pathlib.Path(request.path).name)
+        self.response_queue.put(Path._handle_get_request(None, request))
+
+
+@pytest.mark.parametrize(
+    "num_files, file_size",
+    [(10, 1_000_000), pytest.param(20, 50_000_000, marks=_MARK_SHORT_BM)],
+)
+def test_repeated_path_get(num_files, file_size, tmpdir, monkeypatch):
+    """Measure repeated ``Path.get`` calls of a checkpoint directory, when only one of its files changes."""
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    origin_dir = pathlib.Path(tmpdir, "origin")
+    checkpoints = origin_dir / "checkpoints"
+    checkpoints.mkdir(parents=True)
+    for i in range(num_files):
+        (checkpoints / f"shard_{i}.bin").write_bytes(os.urandom(file_size))
+
+    path = Path(tmpdir, "consumer", "checkpoints")
+    path._origin = "root.origin"
+    path._consumer = "root.consumer"
+    response_queue = _MockQueue()
+    path._attach_queues(_OriginQueue(origin_dir, response_queue), response_queue)
+
+    with _context("work"):
+        first, _ = measure(path.get, overwrite=True)
+        repeated, _ = measure(path.get, overwrite=True)
+        with open(checkpoints / "shard_0.bin", "r+b") as f:
+            f.write(os.urandom(1000))
+        modified, _ = measure(path.get, overwrite=True)
+
+    assert (path / "shard_0.bin").read_bytes() == (checkpoints / "shard_0.bin").read_bytes()
+    print_results(
+        f"{num_files} files of {file_size} bytes",
+        first_get=first,
+        repeated_get=repeated,
+        get_after_modifying_a_file=modified,
+    )
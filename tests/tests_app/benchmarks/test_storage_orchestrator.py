@@ -0,0 +1,69 @@
+import threading
+import time
+from queue import Empty
+from unittest.mock import MagicMock
+
+import pytest
+from tests_app.benchmarks import _MARK_SHORT_BM, print_results, Timer
+
+from lightning_app.core.queues import SingleProcessQueue
+from lightning_app.storage.orchestrator import StorageOrchestrator
+from lightning_app.storage.requests import _GetRequest, _GetResponse
+from lightning_app.utilities.enum import WorkStageStatus
+
+
+def _echo_copier(copy_request_queue, copy_response_queue, exit_event):
+    """Confirms the copy requests right away, as the Copier of a Work would do for a small file."""
+    while not exit_event.is_set():
+        try:
+            request = copy_request_queue.get_many(1, timeout=0.1)[0]
+        except Empty:
+            continue
+        copy_response_queue.put(
+            _GetResponse(
+                source=request.source,
+                name=request.name,
+                path=request.path,
+                hash=request.hash,
+                destination=request.destination,
+                timedelta=0.0,
+            )
+        )
+
+
+@pytest.mark.parametrize("num_works", [2, 100, pytest.param(1000, marks=_MARK_SHORT_BM)])
+def test_orchestrator_latency(num_works):
+    """Measure the round-trip of the file transfer requests through the StorageOrchestrator, with many idle
+    Works."""
+    work_names = [f"work_{i}" for i in range(num_works)]
+
+    def queues():
+        return {name: SingleProcessQueue(name, default_timeout=5) for name in work_names}
+
+    app = MagicMock()
+    app.get_component_by_name.return_value.status.stage = WorkStageStatus.RUNNING
+    orchestrator = StorageOrchestrator(app, queues(), queues(), queues(), queues())
+    orchestrator.fs = MagicMock()
+    orchestrator.fs.exists.return_value = False
+    orchestrator.start()
+    exit_event = threading.Event()
+    copier = threading.Thread(
+        target=_echo_copier,
+        args=(orchestrator.copy_request_queues["work_0"], orchestrator.copy_response_queues["work_0"], exit_event),
+    )
+    copier.start()
+    # let the orchestrator settle
+    time.sleep(1)
+
+    timer = Timer()
+    for i in range(20):
+        with timer:
+            request = _GetRequest(source="work_0", path="/a.txt", hash=str(i), name="a")
+            orchestrator.request_queues["work_1"].put(request)
+            response = orchestrator.response_queues["work_1"].get_many(1, timeout=5)[0]
+        assert response.hash == str(i)
+
+    exit_event.set()
+    copier.join()
+    orchestrator.join()
+    print_results(f"{num_works} works", p50=timer.quantile(0.5), p90=timer.quantile(0.9))
@@ -0,0 +1,75 @@
+import os
+import sqlite3
+
+import pytest
+
+from lightning_app.components.database.backup import _DatabaseBackup
+
+
+def _write_rows(db_filename, start, stop):
+    connection = sqlite3.connect(db_filename)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS rows (id INTEGER PRIMARY KEY, data BLOB)")
+    connection.executemany("INSERT INTO rows VALUES (?, ?)", [(i, os.urandom(1000)) for i in range(start, stop)])
+    connection.commit()
+    return connection
+
+
+def _read_rows(db_filename):
+    connection = sqlite3.connect(db_filename)
+    rows = connection.execute("SELECT * FROM rows ORDER BY id").fetchall()
+    connection.close()
+    return rows
+
+
+@pytest.fixture
+def storage_path(tmpdir, monkeypatch):
+    storage_path = os.path.join(tmpdir, "storage")
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", storage_path)
+    return storage_path
+
+
+def test_database_backup(tmpdir, storage_path):
+    db_filename = os.path.join(tmpdir, "database.db")
+    # the connection stays open, so the latest rows are only in the write-ahead log
+    connection = _write_rows(db_filename, 0, 2000)
+    rows = _read_rows(db_filename)
+
+    backup = _DatabaseBackup(db_filename, "root.db", chunk_size=64 * 1024)
+    backup.store()
+    assert backup.stats.num_chunks > 10
+    assert backup.stats.num_chunks_uploaded == backup.stats.num_chunks
+
+    # the rows appended only change the last pages of the database
+    connection.executemany("INSERT INTO rows VALUES (?, ?)", [(i, os.urandom(1000)) for i in range(2000, 2010)])
+    connection.commit()
+    rows = _read_rows(db_filename)
+    backup.store()
+    assert 0 < backup.stats.num_chunks_uploaded <= 2
+
+    # a new backup reuses the chunks found in the Drive
+    backup = _DatabaseBackup(db_filename, "root.db", chunk_size=64 * 1024)
+    backup.store()
+    assert backup.stats.num_chunks_uploaded == 0
+
+    # the chunks which aren't part of the latest backup are deleted
+    connection.execute("DELETE FROM rows WHERE id >= 1000")
+    connection.commit()
+    connection.execute("VACUUM")
+    connection.close()
+    backup.store()
+    chunks_dir = os.path.join(storage_path, "artifacts", "drive", "database", "root.db", "database.db.chunks")
+    assert len(os.listdir(chunks_dir)) == len(set(backup._chunks))
+
+    restored_filename = os.path.join(tmpdir, "restored", "database.db")
+    os.makedirs(os.path.dirname(restored_filename))
+    restored = _DatabaseBackup(restored_filename, "root.db")
+    assert restored.restore()
+    assert restored.chunk_size == 64 * 1024
+    assert _read_rows(restored_filename) == rows[:1000]
+
+
+def test_database_backup_restore_without_backup(tmpdir, storage_path):
+    backup = _DatabaseBackup(os.path.join(tmpdir, "database.db"), "root.db")
+    assert not backup.restore()
+    assert not os.path.exists(os.path.join(tmpdir, "database.db"))
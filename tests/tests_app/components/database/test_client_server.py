@@ -1,6 +1,7 @@
 import os
 import sys
 import tempfile
+import threading
 import time
 import traceback
 from pathlib import Path
@@ -204,3 +205,58 @@ def test_work_database_periodic_store():
             MultiProcessRuntime(app).dispatch()
     except Exception:
         print(traceback.print_exc())
+
+
+@pytest.fixture
+def db_url(tmpdir):
+    import uvicorn
+
+    from lightning_app.components.database.server import _create_app
+    from lightning_app.components.database.utilities import _create_database
+    from lightning_app.utilities.network import find_free_network_port
+
+    _create_database(os.path.join(tmpdir, "database.db"), [TestConfig])
+    port = find_free_network_port()
+    server = uvicorn.Server(uvicorn.Config(_create_app([TestConfig], "a"), port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_client_bulk_and_select(db_url):
+    from lightning_app.components.database import utilities
+
+    client = DatabaseClient(db_url, token="a", model=TestConfig)
+    secrets = [Secret(name="example", value="secret")]
+    client.insert_many([TestConfig(name=f"name_{i % 3}", secrets=secrets) for i in range(25)], batch_size=10)
+    rows = client.select_all()
+    assert [row.id for row in rows] == list(range(1, 26))
+    assert isinstance(rows[0].secrets[0], Secret)
+    assert rows[0].secrets[0].value == "secret"
+
+    assert [row.id for row in client.select(limit=10, offset=20)] == list(range(21, 26))
+    assert [row.id for row in client.select(where={"name": "name_1"}, limit=3)] == [2, 5, 8]
+    assert len(client.select(where={"name": ["name_0", "name_1"]})) == 17
+    with pytest.raises(AssertionError, match="doesn't have a column"):
+        client.select(where={"missing": 1})
+
+    for row in rows[:12]:
+        row.name = "updated"
+    client.update_many(rows[:12], batch_size=5)
+    assert [row.id for row in client.select(where={"name": "updated"})] == list(range(1, 13))
+
+    client.delete_many(rows[::2])
+    assert [row.id for row in client.select_all()] == list(range(2, 26, 2))
+
+    with pytest.raises(AssertionError, match="weren't found"):
+        client.update_many(rows[:2])
+    with pytest.raises(AssertionError, match="Unauthorized"):
+        DatabaseClient(db_url, token="b", model=TestConfig).select()
+
+    with utilities.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
@@ -1,12 +1,17 @@
+import asyncio
 import multiprocessing as mp
+import time
+
+import pytest
 
 from lightning_app.components import Image, Number, PythonServer
+from lightning_app.components.serve.python_server import _DynamicBatcher
 from lightning_app.utilities.network import _configure_session, find_free_network_port
 
 
 class SimpleServer(PythonServer):
-    def __init__(self, port):
-        super().__init__(port=port)
+    def __init__(self, port, max_batch_size=1):
+        super().__init__(port=port, max_batch_size=max_batch_size)
         self._model = None
 
     def setup(self):
@@ -16,14 +21,15 @@ class SimpleServer(PythonServer):
         return {"prediction": self._model(data.payload)}
 
 
-def target_fn(port):
-    image_server = SimpleServer(port=port)
+def target_fn(port, max_batch_size):
+    image_server = SimpleServer(port=port, max_batch_size=max_batch_size)
     image_server.run()
 
 
-def test_python_server_component():
+@pytest.mark.parametrize("max_batch_size", [1, 4])
+def test_python_server_component(max_batch_size):
     port = find_free_network_port()
-    process = mp.Process(target=target_fn, args=(port,))
+    process = mp.Process(target=target_fn, args=(port, max_batch_size))
     process.start()
     session = _configure_session()
     res = session.post(f"http://127.0.0.1:{port}/predict", json={"payload": "test"})
@@ -31,6 +37,54 @@ def test_python_server_component():
     assert res.json()["prediction"] == "test"
 
 
+def test_dynamic_batcher():
+    batches = []
+
+    def predict_batch(requests):
+        batches.append(len(requests))
+        time.sleep(0.01)
+        return [request * 2 for request in requests]
+
+    async def run():
+        batcher = _DynamicBatcher(predict_batch, max_batch_size=4, max_wait_ms=50)
+        await batcher.start()
+        try:
+            outputs = await asyncio.gather(*(batcher.predict(i) for i in range(10)))
+            assert outputs == [2 * i for i in range(10)]
+            assert batches == [4, 4, 2]
+
+            # a partial batch is processed once `max_wait_ms` passed
+            t0 = time.monotonic()
+            assert await batcher.predict(1) == 2
+            assert 0.05 <= time.monotonic() - t0 < 0.5
+            assert batches[-1] == 1
+        finally:
+            await batcher.stop()
+
+    asyncio.run(run())
+
+
+def test_dynamic_batcher_errors():
+    def predict_batch(requests):
+        if len(requests) == 2:
+            return requests[:1]
+        raise ValueError("failed")
+
+    async def run():
+        batcher = _DynamicBatcher(predict_batch, max_batch_size=2, max_wait_ms=10)
+        await batcher.start()
+        try:
+            with pytest.raises(ValueError, match="failed"):
+                await batcher.predict(0)
+            results = await asyncio.gather(batcher.predict(0), batcher.predict(1), return_exceptions=True)
+            assert all(isinstance(result, RuntimeError) for result in results)
+            assert "returned 1 outputs for 2 requests" in str(results[0])
+        finally:
+            await batcher.stop()
+
+    asyncio.run(run())
+
+
 def test_image_sample_data():
     data = Image()._get_sample_data()
     assert isinstance(data, dict)
@@ -1,10 +1,14 @@
+import asyncio
 import time
 from unittest.mock import patch
 
 import pytest
+from aiohttp import web
+from fastapi import HTTPException
 
 from lightning_app import LightningWork
 from lightning_app.components import AutoScaler
+from lightning_app.components.auto_scaler import _LoadBalancer, _ROUTERS, _ServerStats
 
 
 class EmptyWork(LightningWork):
@@ -31,9 +35,31 @@ def test_num_replicas_after_init():
     assert auto_scaler.num_replicas == min_replicas
 
 
+class WorkWithArgs(LightningWork):
+    def __init__(self, value, name="work", **kwargs):
+        super().__init__(**kwargs)
+        self.value = value
+        self.work_name = name
+
+    def run(self):
+        pass
+
+
+def test_work_args_forwarded():
+    """Test the positional and keyword arguments given after the AutoScaler arguments are forwarded to the works."""
+    auto_scaler = AutoScaler(
+        WorkWithArgs, 1, 4, 10, 8, 1, "api/predict", dict, dict, "value", routing="least_outstanding", name="server"
+    )
+    work = auto_scaler.workers[0]
+    assert work.value == "value"
+    assert work.work_name == "server"
+    assert auto_scaler.load_balancer.routing == "least_outstanding"
+
+
 @patch("uvicorn.run")
 @patch("lightning_app.components.auto_scaler._LoadBalancer.url")
 @patch("lightning_app.components.auto_scaler.AutoScaler.num_pending_requests")
+@patch("lightning_app.components.auto_scaler.AutoScaler.servers_stats")
 def test_num_replicas_not_above_max_replicas(*_):
     """Test self.num_replicas doesn't exceed max_replicas."""
     max_replicas = 6
@@ -54,6 +80,7 @@ def test_num_replicas_not_above_max_replicas(*_):
 @patch("uvicorn.run")
 @patch("lightning_app.components.auto_scaler._LoadBalancer.url")
 @patch("lightning_app.components.auto_scaler.AutoScaler.num_pending_requests")
+@patch("lightning_app.components.auto_scaler.AutoScaler.servers_stats")
 def test_num_replicas_not_belo_min_replicas(*_):
     """Test self.num_replicas doesn't exceed max_replicas."""
     min_replicas = 1
@@ -90,3 +117,202 @@ def test_scale(replicas, metrics, expected_replicas):
     )
 
     assert auto_scaler.scale(replicas, metrics) == expected_replicas
+
+
+async def _start_server(handler):
+    """Starts an HTTP server on a free port, within the running event loop."""
+    app = web.Application()
+    app.router.add_post("/predict", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+def test_load_balancer_process_request():
+    """Test the requests are batched and their responses are dispatched back to them."""
+
+    async def run():
+        batches = []
+
+        async def predict(request):
+            inputs = (await request.json())["inputs"]
+            batches.append(len(inputs))
+            return web.json_response({"outputs": [{"y": 2 * x["x"]} for x in inputs]})
+
+        runner, url = await _start_server(predict)
+        load_balancer = _LoadBalancer(
+            input_type=dict, output_type=dict, endpoint="predict", max_batch_size=4, timeout_batching=0.1
+        )
+        load_balancer.servers = [url]
+        consumer = asyncio.create_task(load_balancer.consumer())
+        try:
+            outputs = await asyncio.gather(*(load_balancer.process_request({"x": i}) for i in range(10)))
+            assert outputs == [{"y": 2 * i} for i in range(10)]
+            assert batches == [4, 4, 2]
+            assert not load_balancer._futures
+
+            # an idle load balancer sends a request right away
+            await asyncio.sleep(load_balancer.timeout_batching)
+            t0 = time.monotonic()
+            await load_balancer.process_request({"x": 0})
+            assert time.monotonic() - t0 < load_balancer.timeout_batching
+            assert batches[-1] == 1
+
+            # the connections to the server are kept alive across the batches
+            assert list(load_balancer._sessions) == [url]
+            stats = load_balancer._servers_stats[url]
+            assert stats.num_batches == 4
+            assert stats.num_in_flight == 0
+            assert stats.latency > 0
+        finally:
+            consumer.cancel()
+            await load_balancer.close_sessions()
+            await runner.cleanup()
+        assert not load_balancer._sessions
+
+    asyncio.run(run())
+
+
+def test_load_balancer_process_request_error():
+    async def run():
+        async def predict(request):
+            return web.Response(status=500)
+
+        runner, url = await _start_server(predict)
+        load_balancer = _LoadBalancer(input_type=dict, output_type=dict, endpoint="predict", timeout_batching=0)
+        load_balancer.servers = [url]
+        consumer = asyncio.create_task(load_balancer.consumer())
+        try:
+            with pytest.raises(HTTPException, match="500"):
+                await load_balancer.process_request({"x": 0})
+        finally:
+            consumer.cancel()
+            await load_balancer.close_sessions()
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_load_balancer_drains_removed_servers():
+    """Test a removed server isn't sent new batches, but its batches in flight are answered before its session is
+    closed."""
+
+    async def run():
+        def make_predict(inference_time):
+            async def predict(request):
+                inputs = (await request.json())["inputs"]
+                await asyncio.sleep(inference_time)
+                return web.json_response({"outputs": inputs})
+
+            return predict
+
+        removed_runner, removed_url = await _start_server(make_predict(0.2))
+        runner, url = await _start_server(make_predict(0))
+        load_balancer = _LoadBalancer(input_type=dict, output_type=dict, endpoint="predict", timeout_batching=0)
+        load_balancer.servers = [removed_url]
+        consumer = asyncio.create_task(load_balancer.consumer())
+        try:
+            in_flight = asyncio.create_task(load_balancer.process_request({"x": 0}))
+            await asyncio.sleep(0.1)
+            assert load_balancer._servers_stats[removed_url].num_in_flight == 1
+
+            await load_balancer._set_servers([url])
+            assert removed_url in load_balancer._sessions
+            assert await load_balancer.process_request({"x": 1}) == {"x": 1}
+            assert load_balancer._servers_stats[url].num_batches == 1
+
+            assert await in_flight == {"x": 0}
+            assert removed_url not in load_balancer._sessions
+            assert list(load_balancer._servers_stats) == [url]
+        finally:
+            consumer.cancel()
+            await load_balancer.close_sessions()
+            await removed_runner.cleanup()
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+@patch("uvicorn.run")
+@patch("lightning_app.components.auto_scaler._LoadBalancer.url")
+@patch("lightning_app.components.auto_scaler.AutoScaler.num_pending_requests", 0)
+@patch("lightning_app.components.auto_scaler.AutoScaler.num_pending_works", 0)
+def test_scale_receives_servers_stats(*_):
+    """Test the stats of the servers from the load balancer are passed to `scale()`."""
+    servers_stats = {"http://server": {"num_in_flight": 1, "num_batches": 2, "num_errors": 0, "latency": 0.1}}
+    received_metrics = []
+
+    class StatsAutoScaler(AutoScaler):
+        def scale(self, replicas: int, metrics) -> int:
+            received_metrics.append(metrics)
+            return replicas
+
+    auto_scaler = StatsAutoScaler(EmptyWork, autoscale_interval=0)
+    with patch.object(_LoadBalancer, "get_servers_stats", return_value=servers_stats):
+        auto_scaler.autoscale()
+    assert received_metrics == [{"pending_requests": 0, "pending_works": 0, "servers_stats": servers_stats}]
+
+
+def test_routers():
+    servers = ["a", "b", "c"]
+    stats = {
+        "a": _ServerStats(num_in_flight=2, latency=0.01),
+        "b": _ServerStats(num_in_flight=1, latency=0.1),
+        "c": _ServerStats(num_in_flight=3, latency=0.001),
+    }
+    round_robin = _ROUTERS["round_robin"]()
+    assert [round_robin.select(servers, stats) for _ in range(4)] == ["a", "b", "c", "a"]
+    assert _ROUTERS["least_outstanding"]().select(servers, stats) == "b"
+    assert _ROUTERS["ewma_latency"]().select(servers, stats) == "c"
+    # the servers without latency yet are tried first
+    assert _ROUTERS["ewma_latency"]().select([*servers, "d"], {**stats, "d": _ServerStats()}) == "d"
+    # the least busy of the two servers drawn is picked, so the busiest server is never picked
+    power_of_two = _ROUTERS["power_of_two"]()
+    assert {power_of_two.select(servers, stats) for _ in range(100)} == {"a", "b"}
+    assert power_of_two.select(["a"], stats) == "a"
+
+    with pytest.raises(ValueError, match="The routing should be one of"):
+        _LoadBalancer(input_type=dict, output_type=dict, endpoint="predict", routing="random")
+
+
+@pytest.mark.parametrize("routing", ["least_outstanding", "ewma_latency", "power_of_two"])
+def test_load_balancer_routing(routing):
+    """Test the load-aware routings send more batches to the fastest server."""
+
+    async def run():
+        def make_predict(inference_time):
+            async def predict(request):
+                inputs = (await request.json())["inputs"]
+                await asyncio.sleep(inference_time)
+                return web.json_response({"outputs": inputs})
+
+            return predict
+
+        fast_runner, fast_url = await _start_server(make_predict(0.005))
+        slow_runner, slow_url = await _start_server(make_predict(0.1))
+        load_balancer = _LoadBalancer(
+            input_type=dict, output_type=dict, endpoint="predict", max_batch_size=1, timeout_batching=0, routing=routing
+        )
+        load_balancer.servers = [fast_url, slow_url]
+        consumer = asyncio.create_task(load_balancer.consumer())
+
+        async def client():
+            for i in range(10):
+                await load_balancer.process_request({"x": i})
+
+        try:
+            await asyncio.gather(*(client() for _ in range(4)))
+        finally:
+            consumer.cancel()
+            await load_balancer.close_sessions()
+            await fast_runner.cleanup()
+            await slow_runner.cleanup()
+
+        stats = load_balancer._servers_stats
+        assert stats[fast_url].num_batches + stats[slow_url].num_batches == 40
+        assert stats[fast_url].num_batches > 2 * stats[slow_url].num_batches
+
+    asyncio.run(run())
@@ -1,10 +1,12 @@
 import asyncio
+import json
 import logging
 import multiprocessing as mp
 import os
 import sys
 from copy import deepcopy
 from multiprocessing import Process
+from threading import Thread
 from time import sleep, time
 from unittest import mock
 
@@ -211,6 +213,157 @@ def test_update_publish_state_and_maybe_refresh_ui():
     global_app_state_store.add("1234")
 
 
+def test_websocket_state_patches(monkeypatch):
+    """This test checks that the websocket streams the app state as JSON patches in the ``json-patch`` mode, and
+    only sends a full snapshot to the clients without the previous version of the state."""
+    import uvicorn
+    import websockets
+
+    from lightning_app.utilities.json_patch import _apply_json_patch
+    from lightning_app.utilities.network import find_free_network_port
+
+    monkeypatch.setattr(api, "ENABLE_STATE_WEBSOCKET", True)
+    publish_state_queue = _MockQueue("publish_state_queue")
+    refresher = UIRefresher(publish_state_queue, _MockQueue("api_response_queue"))
+
+    def publish(state):
+        publish_state_queue.put(state)
+        refresher.run_once()
+
+    port = find_free_network_port()
+    server = uvicorn.Server(uvicorn.Config(fastapi_service, host="127.0.0.1", port=port, log_level="error"))
+    thread = Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        sleep(0.01)
+
+    states = [{"vars": {"counter": i, "text": "a" * 1000}, "works": {}} for i in range(3)]
+
+    async def receive(websocket):
+        return json.loads(await asyncio.wait_for(websocket.recv(), timeout=5))
+
+    async def main():
+        publish(states[0])
+        url = f"ws://127.0.0.1:{port}/api/v1/ws?mode=json-patch"
+        async with websockets.connect(url) as websocket:
+            message = await receive(websocket)
+            assert message["type"] == "snapshot"
+            assert message["state"] == states[0]
+            state, version = message["state"], message["version"]
+
+            publish(states[1])
+            message = await receive(websocket)
+            assert message == {
+                "type": "patch",
+                "version": version + 1,
+                "patch": [{"op": "replace", "path": "/vars/counter", "value": 1}],
+            }
+            state, version = _apply_json_patch(state, message["patch"]), message["version"]
+            assert state == states[1]
+
+        # the client reconnects after missing an update
+        publish(states[2])
+        async with websockets.connect(f"{url}&version={version}") as websocket:
+            message = await receive(websocket)
+            assert message["type"] == "patch"
+            assert _apply_json_patch(state, message["patch"]) == states[2]
+
+        # the default mode only notifies about the updates
+        async with websockets.connect(f"ws://127.0.0.1:{port}/api/v1/ws") as websocket:
+            publish(states[0])
+            assert int(await asyncio.wait_for(websocket.recv(), timeout=5)) == global_app_state_store.counter
+
+    try:
+        asyncio.run(main())
+    finally:
+        server.should_exit = True
+        thread.join()
+        global_app_state_store.remove("1234")
+        global_app_state_store.add("1234")
+
+
+def test_component_state_etag(monkeypatch):
+    """This test checks that the state of a component is served on its own along with an ETag, isn't sent again
+    while it doesn't change, and that the deltas of the state of a component are applied under it."""
+    import queue
+
+    import uvicorn
+
+    from lightning_app.utilities import state as state_module
+    from lightning_app.utilities.network import find_free_network_port
+
+    publish_state_queue = _MockQueue("publish_state_queue")
+    refresher = UIRefresher(publish_state_queue, _MockQueue("api_response_queue"))
+    delta_queue = queue.Queue()
+    monkeypatch.setattr(api, "api_app_delta_queue", delta_queue)
+
+    def publish(state):
+        publish_state_queue.put(state)
+        refresher.run_once()
+
+    port = find_free_network_port()
+    server = uvicorn.Server(uvicorn.Config(fastapi_service, host="127.0.0.1", port=port, log_level="error"))
+    thread = Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        sleep(0.01)
+
+    def app_state(counter_a, counter_b):
+        work_a = {"vars": {"counter": counter_a}, "flows": {}, "works": {}}
+        flow = {"vars": {"value": 1}, "flows": {}, "works": {"work_a": work_a}}
+        return {
+            "vars": {},
+            "flows": {"flow": flow},
+            "works": {"work_b": {"vars": {"counter": counter_b}, "flows": {}, "works": {}}},
+        }
+
+    url = f"http://127.0.0.1:{port}/api/v1/state"
+    headers = headers_for({"token": "1234", "session_id": "1234"})
+    try:
+        publish(app_state(0, 0))
+        response = requests.get(url, params={"component": "root.flow.work_a"}, headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"vars": {"counter": 0}, "flows": {}, "works": {}}
+        etag = response.headers["ETag"]
+        assert etag == f'"{global_app_state_store.get_version("1234")}"'
+        response = requests.get(url, params={"component": "root.missing"}, headers=headers)
+        assert response.status_code == 404
+
+        # the changes outside of the component don't modify its state
+        publish(app_state(0, 1))
+        response = requests.get(url, params={"component": "root.flow"}, headers={"If-None-Match": etag, **headers})
+        assert response.status_code == 304
+        response = requests.get(url, headers={"If-None-Match": etag, **headers})
+        assert response.status_code == 200
+        assert response.json() == app_state(0, 1)
+
+        publish(app_state(1, 1))
+        response = requests.get(url, params={"component": "root.flow"}, headers={"If-None-Match": etag, **headers})
+        assert response.status_code == 200
+        assert response.json()["works"]["work_a"]["vars"]["counter"] == 1
+
+        # the AppState reuses the state it holds while it doesn't change
+        state = AppState("http://127.0.0.1", port, my_affiliation=("flow",))
+        assert state.work_a.counter == 1
+        assert state_module._STATE_COMPONENT_NAME == "root.flow"
+        held_state = state_module._STATE
+        publish(app_state(1, 2))
+        state = AppState("http://127.0.0.1", port, my_affiliation=("flow",))
+        assert state.value == 1
+        assert state._state is held_state
+
+        state.value = 2
+        assert state_module._STATE_ETAG is None
+        expected = app_state(1, 2)
+        expected["flows"]["flow"]["vars"]["value"] = 2
+        assert app_state(1, 2) + delta_queue.get(timeout=5).delta == expected
+    finally:
+        server.should_exit = True
+        thread.join()
+        global_app_state_store.remove("1234")
+        global_app_state_store.add("1234")
+
+
 @pytest.mark.parametrize("x_lightning_type", ["DEFAULT", "STREAMLIT"])
 @pytest.mark.anyio
 async def test_start_server(x_lightning_type, monkeypatch):
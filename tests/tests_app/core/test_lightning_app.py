@@ -1,6 +1,8 @@
 import logging
 import os
 import pickle
+import threading
+import time
 from re import escape
 from time import sleep
 from unittest import mock
@@ -27,6 +29,7 @@ from lightning_app.storage.path import _storage_root_dir
 from lightning_app.testing.helpers import _RunIf
 from lightning_app.testing.testing import LightningTestApp
 from lightning_app.utilities.app_helpers import affiliation
+from lightning_app.utilities.checkpoint import _load_checkpoint
 from lightning_app.utilities.enum import AppStage, WorkStageStatus, WorkStopReasons
 from lightning_app.utilities.packaging import cloud_compute
 from lightning_app.utilities.redis import check_if_redis_running
@@ -89,6 +92,119 @@ class Work(LightningWork):
             self.has_finished = True
 
 
+@pytest.mark.parametrize("queue_type_cls", [SingleProcessQueue, MultiProcessQueue])
+def test_lightning_app_waits_for_deltas_when_idle(queue_type_cls):
+    """This test validates the app blocks on the delta queue when nothing changed and wakes up as soon as a delta
+    is received."""
+
+    app = LightningApp(EmptyFlow())
+    app.delta_queue = queue_type_cls("delta_queue", STATE_UPDATE_TIMEOUT)
+    app.error_queue = queue_type_cls("error_queue", STATE_UPDATE_TIMEOUT)
+    app.idle_wait = 5
+
+    # the first iteration runs the flow, so the app isn't idle yet.
+    app.run_once()
+    assert not app._is_idle
+    app._has_updated = False
+    app.run_once()
+    assert app._is_idle
+
+    def put_delta():
+        sleep(0.5)
+        app.delta_queue.put(_DeltaRequest(Delta({"values_changed": {"root['vars']['counter']": {"new_value": 1}}})))
+
+    thread = threading.Thread(target=put_delta)
+    thread.start()
+    t0 = time.time()
+    app._has_updated = False
+    app.run_once()
+    thread.join()
+    assert 0.5 <= time.time() - t0 < app.idle_wait
+    assert app.root.counter == 1
+    assert not app._is_idle
+
+    # without any delta, the app waits for at most `idle_wait` seconds.
+    app.idle_wait = 0.2
+    app._has_updated = False
+    app.run_once()
+    t0 = time.time()
+    app._has_updated = False
+    app.run_once()
+    assert 0.2 <= time.time() - t0 < 1
+
+
+def test_lightning_app_notices_errors_when_idle():
+    """This test validates an idle app wakes up as soon as a work reports an error."""
+
+    app = LightningApp(EmptyFlow())
+    app.delta_queue = SingleProcessQueue("delta_queue", STATE_UPDATE_TIMEOUT)
+    app.error_queue = SingleProcessQueue("error_queue", STATE_UPDATE_TIMEOUT)
+    app.idle_wait = 5
+    app.run_once()
+    app._has_updated = False
+    app.run_once()
+    assert app._is_idle
+
+    def put_error():
+        sleep(0.2)
+        # the works wake the app loop up along with their exceptions
+        app.error_queue.put(Exception("Custom Exception"))
+        app.delta_queue.put(None)
+
+    thread = threading.Thread(target=put_error)
+    thread.start()
+    t0 = time.time()
+    app._has_updated = False
+    app.run_once()
+    thread.join()
+    assert time.time() - t0 < app.idle_wait
+    assert app.stage == AppStage.FAILED
+    assert str(app.exception) == "Custom Exception"
+
+
+@mock.patch("lightning_app.core.app.LOOP_WAKEUPS_MONITOR_INTERVAL", 0.1)
+def test_lightning_app_wakeups_monitor():
+    app = LightningApp(EmptyFlow())
+    for _ in range(4):
+        app._update_wakeups_monitor()
+    assert app.wakeups_per_second == 0
+    sleep(0.1)
+    app._update_wakeups_monitor()
+    assert 0 < app.wakeups_per_second <= 50
+    assert app._num_wakeups == 0
+
+
+class CounterFlow(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+
+    def run(self):
+        self.counter += 1
+
+
+def test_lightning_app_accumulates_deltas_when_not_idle():
+    """This test validates a flow changing its state on every run doesn't run more often than every
+    `state_accumulate_wait`."""
+
+    app = LightningApp(CounterFlow())
+    app.delta_queue = SingleProcessQueue("delta_queue", STATE_UPDATE_TIMEOUT)
+    app.error_queue = SingleProcessQueue("error_queue", STATE_UPDATE_TIMEOUT)
+    app.state_accumulate_wait = 0.05
+
+    num_iterations = 0
+    t0 = time.time()
+    while time.time() - t0 < 0.5:
+        app.run_once()
+        assert not app._is_idle
+        app._has_updated = False
+        num_iterations += 1
+    iterations_per_second = num_iterations / (time.time() - t0)
+
+    assert app.root.counter == num_iterations
+    assert iterations_per_second <= 1 / app.state_accumulate_wait + 2
+
+
 class SimpleFlow(LightningFlow):
     def __init__(self):
         super().__init__()
@@ -438,6 +554,10 @@ def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQu
             sleep(sleep_time)
             return out
 
+        def get_many(self, max_items, timeout=None):
+            # simulate a slow fetch of every single element.
+            return [self.get(timeout)]
+
     app = LightningApp(EmptyFlow())
 
     app.delta_queue = SlowQueue("api_delta_queue", default_timeout)
@@ -533,11 +653,10 @@ def test_snap_shotting():
         pass
     checkpoint_dir = os.path.join(_storage_root_dir(), "checkpoints")
     checkpoints = os.listdir(checkpoint_dir)
-    assert len(checkpoints) == 1
-    with open(os.path.join(checkpoint_dir, checkpoints[0]), "rb") as f:
-        state = pickle.load(f)
-        assert state["works"]["work_a"]["vars"]["counter"] == 1
-        assert state["works"]["work_b"]["vars"]["counter"] == 1
+    assert checkpoints == ["v_0.snapshot"]
+    state = _load_checkpoint(checkpoint_dir)
+    assert state["works"]["work_a"]["vars"]["counter"] == 1
+    assert state["works"]["work_b"]["vars"]["counter"] == 1
 
 
 class CounterWork(LightningWork):
@@ -650,6 +769,9 @@ def test_load_state_dict_from_checkpoint_dir(tmpdir):
         checkpoints.append(app._dump_checkpoint())
         app.root.counter += 1
 
+    # a snapshot followed by the log of the changes
+    assert [os.path.basename(c) for c in checkpoints] == ["v_0.snapshot"] + ["v_0.log"] * (num_checkpoints - 1)
+
     app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir)
     assert app.root.counter == (num_checkpoints - 1)
 
@@ -663,17 +785,64 @@ def test_load_state_dict_from_checkpoint_dir(tmpdir):
     with pytest.raises(Exception, match="No checkpoints where found"):
         app.load_state_dict_from_checkpoint_dir(str(os.path.join(_PROJECT_ROOT, "tests/tests_app/")))
 
-    # delete 2 checkpoints
-    os.remove(os.path.join(checkpoints[4]))
-    os.remove(os.path.join(checkpoints[7]))
+    with pytest.raises(FileNotFoundError, match="The version `11` wasn't found"):
+        app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=11)
+
+    # the app stopped while writing the last record
+    with open(checkpoints[-1], "rb+") as f:
+        f.truncate(os.path.getsize(checkpoints[-1]) - 1)
 
     app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir)
-    assert app.root.counter == (num_checkpoints - 1)
+    assert app.root.counter == (num_checkpoints - 2)
 
     app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=5)
     checkpoint_path = app._dump_checkpoint()
 
-    assert os.path.basename(checkpoint_path).startswith("v_11")
+    # the version of the incomplete record is reused
+    assert os.path.basename(checkpoint_path) == "v_10.snapshot"
+    app.root.counter = -1
+    app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir)
+    assert app.root.counter == 5
+
+
+@mock.patch("lightning_app.core.app.CHECKPOINT_MAX_SNAPSHOTS", 2)
+@mock.patch("lightning_app.core.app.CHECKPOINT_SNAPSHOT_INTERVAL", 3)
+def test_checkpoint_compaction_and_retention(tmpdir):
+    work = CheckpointCounter()
+    app = LightningApp(CheckpointFlow(work))
+
+    for _ in range(10):
+        app._dump_checkpoint()
+        app.root.counter += 1
+
+    # a snapshot is written every 4 checkpoints, and only the latest 2 snapshots are kept with their logs
+    assert sorted(os.listdir(app.checkpoint_dir)) == ["v_4.log", "v_4.snapshot", "v_8.log", "v_8.snapshot"]
+    for version in range(4, 10):
+        app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=version)
+        assert app.root.counter == version
+    with pytest.raises(FileNotFoundError, match="The version `3` wasn't found"):
+        app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=3)
+
+    # a new app continues the versions with a new snapshot
+    app = LightningApp(CheckpointFlow(CheckpointCounter()))
+    assert os.path.basename(app._dump_checkpoint()) == "v_10.snapshot"
+
+
+def test_load_legacy_checkpoint(tmpdir):
+    work = CheckpointCounter()
+    app = LightningApp(CheckpointFlow(work))
+    os.makedirs(app.checkpoint_dir)
+    for version in range(3):
+        app.root.counter = version
+        with open(os.path.join(app.checkpoint_dir, f"v_{version}_{time.time()}.json"), "wb") as f:
+            pickle.dump(app.state_dict(), f)
+
+    app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=1)
+    assert app.root.counter == 1
+    app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir)
+    assert app.root.counter == 2
+
+    assert os.path.basename(app._dump_checkpoint()) == "v_3.snapshot"
 
 
 class PicklableObject:
@@ -1,5 +1,4 @@
 import os
-import pickle
 from collections import Counter
 from copy import deepcopy
 from dataclasses import dataclass
@@ -565,14 +564,12 @@ def test_lightning_flow_counter(runtime_cls, tmpdir):
 
     checkpoint_dir = os.path.join(_storage_root_dir(), "checkpoints")
     checkpoints = os.listdir(checkpoint_dir)
-    assert len(checkpoints) == 4
-    for checkpoint in checkpoints:
-        checkpoint_path = os.path.join(checkpoint_dir, checkpoint)
-        with open(checkpoint_path, "rb") as f:
-            app = LightningApp(FlowCounter())
-            app.set_state(pickle.load(f))
-            runtime_cls(app, start_server=False).dispatch()
-            assert app.root.counter == 3
+    assert sorted(checkpoints) == ["v_0.log", "v_0.snapshot"]
+    for version in range(4):
+        app = LightningApp(FlowCounter())
+        app.load_state_dict_from_checkpoint_dir(checkpoint_dir, version=version)
+        runtime_cls(app, start_server=False).dispatch()
+        assert app.root.counter == 3
 
 
 def test_flow_iterate_method():
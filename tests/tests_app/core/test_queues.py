@@ -1,6 +1,8 @@
 import multiprocessing
 import pickle
 import queue
+import sys
+import threading
 import time
 from unittest import mock
 
@@ -10,9 +12,17 @@ import requests_mock
 from lightning_app import LightningFlow
 from lightning_app.core import queues
 from lightning_app.core.constants import HTTP_QUEUE_URL
-from lightning_app.core.queues import BaseQueue, QueuingSystem, READINESS_QUEUE_CONSTANT, RedisQueue
-from lightning_app.utilities.imports import _is_redis_available
+from lightning_app.core.queues import (
+    BaseQueue,
+    QueuingSystem,
+    READINESS_QUEUE_CONSTANT,
+    RedisQueue,
+    SharedMemoryQueue,
+)
+from lightning_app.testing.http_queue_server import _HTTPQueueServer
+from lightning_app.utilities.imports import _is_msgpack_available, _is_redis_available
 from lightning_app.utilities.redis import check_if_redis_running
+from lightning_app.utilities.serialization import MsgpackSerializer, PickleSerializer
 
 
 @pytest.mark.skipif(not check_if_redis_running(), reason="Redis is not running")
@@ -127,6 +137,108 @@ def test_process_queue_read_timeout(queue_type, queue_process_mock, monkeypatch)
     assert queue_mocked.return_value.get.call_args_list[2] == mock.call(timeout=None, block=True)
 
 
+@pytest.mark.parametrize(
+    "queue_type", [QueuingSystem.MULTIPROCESS, QueuingSystem.SINGLEPROCESS, QueuingSystem.SHARED_MEMORY]
+)
+def test_process_queue_put_many_get_many(queue_type):
+    my_queue = queue_type.get_readiness_queue()
+    my_queue.put_many([1, 2, 3])
+    # Wait for a bit because multiprocessing.Queue doesn't run in the same thread and takes some time for writes
+    time.sleep(0.1)
+    assert my_queue.get_many(2, timeout=1) == [1, 2]
+    assert my_queue.get_many(2, timeout=1) == [3]
+    with pytest.raises(queue.Empty):
+        my_queue.get_many(2, timeout=1)
+
+
+def _shared_memory_queue_producer(my_queue, num_items):
+    for i in range(num_items):
+        my_queue.put({"index": i, "data": "x" * (i % 100)})
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork isn't available on Windows")
+def test_shared_memory_queue():
+    # a small buffer so the elements wrap around its end and the producers wait for the consumer.
+    my_queue = SharedMemoryQueue("test_shared_memory_queue", default_timeout=0.001, size_bytes=1024)
+    assert my_queue.length() == 0
+    with pytest.raises(queue.Empty):
+        my_queue.get(timeout=0)
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_shared_memory_queue_producer, args=(my_queue, 200)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    items = []
+    while len(items) < 400:
+        items += my_queue.get_many(10, timeout=10)
+    for process in processes:
+        process.join()
+
+    assert sorted(item["index"] for item in items) == sorted(list(range(200)) * 2)
+    assert my_queue.length() == 0
+
+    with pytest.raises(ValueError, match="HINT: Increase `LIGHTNING_SHARED_MEMORY_QUEUE_SIZE_BYTES`"):
+        my_queue.put("x" * 1024)
+
+
+def test_shared_memory_queue_put_timeout():
+    my_queue = SharedMemoryQueue("test_shared_memory_queue", default_timeout=0.001, size_bytes=1024, put_timeout=0.1)
+    my_queue.put("x" * 500)
+    # without any reader, the writer doesn't wait forever for the ring buffer to be freed.
+    t0 = time.time()
+    with pytest.raises(queue.Full):
+        my_queue.put("x" * 500)
+    assert time.time() - t0 >= 0.1
+    assert my_queue.length() == 1
+    assert my_queue.get() == "x" * 500
+
+
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+@mock.patch("lightning_app.core.queues.redis.Redis")
+def test_redis_queue_put_many_get_many(redis_mock):
+    redis_queue = QueuingSystem.REDIS.get_readiness_queue()
+
+    redis_mock.return_value.rpush.return_value = 2
+    redis_queue.put_many(["a", "b"])
+    redis_mock.return_value.rpush.assert_called_once_with("READINESS_QUEUE", pickle.dumps("a"), pickle.dumps("b"))
+    # the length returned by RPUSH is used, so the length isn't requested.
+    redis_mock.return_value.llen.assert_not_called()
+
+    pipeline = redis_mock.return_value.pipeline.return_value
+    pipeline.execute.return_value = ([pickle.dumps("a"), pickle.dumps("b")], True)
+    assert redis_queue.get_many(10) == ["a", "b"]
+    pipeline.lrange.assert_called_once_with("READINESS_QUEUE", 0, 9)
+    pipeline.ltrim.assert_called_once_with("READINESS_QUEUE", 10, -1)
+    redis_mock.return_value.blpop.assert_not_called()
+
+    # when the queue is empty, wait for the first element.
+    pipeline.execute.return_value = ([], True)
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", pickle.dumps("c"))
+    assert redis_queue.get_many(10, timeout=2) == ["c"]
+    redis_mock.return_value.blpop.assert_called_once_with(["READINESS_QUEUE"], timeout=2)
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+@mock.patch("lightning_app.core.queues.redis.Redis")
+def test_queue_serializer(redis_mock, monkeypatch):
+    monkeypatch.setattr(queues, "QUEUE_SERIALIZER", "msgpack")
+    redis_queue = QueuingSystem.REDIS.get_readiness_queue()
+    assert isinstance(redis_queue.serializer, MsgpackSerializer)
+
+    redis_mock.return_value.rpush.return_value = 1
+    redis_queue.put({"a": (1, 2)})
+    value = redis_mock.return_value.rpush.call_args[0][1]
+    assert value == MsgpackSerializer().dumps({"a": (1, 2)})
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", value)
+    assert redis_queue.get() == {"a": (1, 2)}
+
+    shm_queue = QueuingSystem.SHARED_MEMORY.get_readiness_queue()
+    shm_queue.serializer = PickleSerializer()
+    shm_queue.put_many([{"a": (1, 2)}, LightningFlow])
+    assert shm_queue.get_many(2) == [{"a": (1, 2)}, LightningFlow]
+
+
 @pytest.mark.skipif(not check_if_redis_running(), reason="Redis is not running")
 @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE", 2)
 def test_redis_queue_warning():
@@ -199,6 +311,42 @@ class TestHTTPQueue:
 
         test_queue.put(test_obj)
 
+    @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE_CHECK_INTERVAL", 2)
+    def test_http_queue_put_samples_length(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        length = adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"1")
+        push = adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+
+        for i in range(5):
+            test_queue.put(i)
+        assert push.call_count == 5
+        assert length.call_count == 3
+
+    @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE", 10)
+    @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE_CHECK_INTERVAL", 5)
+    def test_http_queue_put_checks_length_near_limit(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        length = adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"6")
+        adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+
+        # the next puts could reach the limit before the next sample, so the length is checked on every put.
+        for i in range(4):
+            test_queue.put(i)
+        assert length.call_count == 4
+
+        length = adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"10")
+        with pytest.warns(UserWarning, match="Found 10"):
+            test_queue.put(4)
+        assert length.call_count == 1
+
     def test_http_queue_get(self, monkeypatch):
         monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
         test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
@@ -214,3 +362,62 @@ class TestHTTPQueue:
             content=pickle.dumps("test"),
         )
         assert test_queue.get() == "test"
+
+    @pytest.fixture
+    def http_queue_server(self, monkeypatch):
+        with _HTTPQueueServer() as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            yield server
+
+    @mock.patch("lightning_app.core.queues.HTTP_QUEUE_REFRESH_INTERVAL", 5)
+    def test_http_queue_long_poll(self, http_queue_server):
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        # the server holds the request until the timeout is reached, without polling.
+        t0 = time.time()
+        assert test_queue.get(timeout=0.2) is None
+        assert 0.2 <= time.time() - t0 < 1
+        assert http_queue_server.num_requests == 1
+        with pytest.raises(queue.Empty):
+            test_queue.get(timeout=0)
+
+        # the item is delivered as soon as it is pushed.
+        http_queue_server.num_requests = 0
+        threading.Timer(0.2, test_queue.put, args=("test",)).start()
+        t0 = time.time()
+        assert test_queue.get(timeout=5) == "test"
+        assert time.time() - t0 < 1
+        assert http_queue_server.num_requests <= 3  # pop, length and push
+
+    @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE_CHECK_INTERVAL", 100)
+    def test_http_queue_put_many_get_many(self, http_queue_server):
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        test_queue.put_many([1, 2, 3, 4, 5])
+        test_queue.put("test")
+        assert http_queue_server.num_requests == 3  # length, push_many and push
+        assert test_queue.length() == 6
+
+        http_queue_server.num_requests = 0
+        assert test_queue.get_many(4, timeout=1) == [1, 2, 3, 4]
+        assert test_queue.get_many(4, timeout=1) == [5, "test"]
+        assert http_queue_server.num_requests == 2
+        with pytest.raises(queue.Empty):
+            test_queue.get_many(4, timeout=0.1)
+
+    @mock.patch("lightning_app.core.queues.HTTP_QUEUE_REFRESH_INTERVAL", 0.05)
+    def test_http_queue_falls_back_to_single_requests(self, monkeypatch):
+        with _HTTPQueueServer(batching=False) as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+            test_queue.put_many([1, 2, 3])
+            assert test_queue.length() == 3
+            assert test_queue.get_many(2, timeout=1) == [1]
+            assert test_queue.get_many(2, timeout=1) == [2]
+            assert test_queue.get(timeout=1) == 3
+
+            # the server doesn't hold the requests, so the client sleeps between them.
+            server.num_requests = 0
+            assert test_queue.get(timeout=0.3) is None
+            assert 2 <= server.num_requests <= 8
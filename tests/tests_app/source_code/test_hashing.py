@@ -0,0 +1,77 @@
+import os
+from unittest import mock
+
+import pytest
+
+from lightning_app.source_code import hashing
+from lightning_app.source_code.hashing import _get_hash
+
+
+def _create_files(tmpdir, num_files: int):
+    files = []
+    for i in range(num_files):
+        file = tmpdir / f"file_{i}.txt"
+        file.write_text(f"content {i}", "utf-8")
+        files.append(str(file))
+    return files
+
+
+@pytest.mark.parametrize("algorithm", ["blake2", "md5"])
+def test_get_hash(tmpdir, algorithm):
+    files = _create_files(tmpdir, 5)
+    checksum = _get_hash(files, algorithm=algorithm)
+    assert checksum == _get_hash(files, algorithm=algorithm, num_workers=1)
+    assert checksum != _get_hash(files[::-1], algorithm=algorithm)
+
+    with open(files[0], "a") as f:
+        f.write("modified")
+    assert checksum != _get_hash(files, algorithm=algorithm)
+
+    with pytest.raises(ValueError, match="Algorithm sha1 not supported"):
+        _get_hash(files, algorithm="sha1")
+
+
+def test_get_hash_index(tmpdir, monkeypatch):
+    # index the files as soon as they are written
+    monkeypatch.setattr(hashing, "RACY_MTIME_SECONDS", 0)
+    files = _create_files(tmpdir, 5)
+    index_file = tmpdir / "index" / "index.json"
+    checksum = _get_hash(files)
+
+    with mock.patch.object(hashing, "_hash_file", wraps=hashing._hash_file) as hash_file:
+        assert _get_hash(files, index_file=index_file) == checksum
+        assert hash_file.call_count == 5
+        hashing._wait_for_index(index_file)
+        assert os.path.exists(index_file)
+
+        # the digests are read from the index
+        hash_file.reset_mock()
+        assert _get_hash(files, index_file=index_file) == checksum
+        hash_file.assert_not_called()
+
+        # only the modified file is hashed again
+        with open(files[2], "a") as f:
+            f.write("modified")
+        checksum = _get_hash(files, index_file=index_file)
+        hash_file.assert_called_once_with(files[2], "blake2", 128)
+        assert checksum == _get_hash(files)
+
+        # the index is rebuilt when corrupted, or when it was built with another algorithm
+        hash_file.reset_mock()
+        _get_hash(files, algorithm="md5", index_file=index_file)
+        assert hash_file.call_count == 5
+        index_file.write_text("{", "utf-8")
+        hash_file.reset_mock()
+        assert _get_hash(files, index_file=index_file) == checksum
+        assert hash_file.call_count == 5
+
+
+def test_get_hash_index_racy_files(tmpdir):
+    files = _create_files(tmpdir, 2)
+    index_file = tmpdir / "index.json"
+    _get_hash(files, index_file=index_file)
+
+    # the files modified right before being indexed could be modified again without changing their modification time
+    with mock.patch.object(hashing, "_hash_file", wraps=hashing._hash_file) as hash_file:
+        _get_hash(files, index_file=index_file)
+        assert hash_file.call_count == 2
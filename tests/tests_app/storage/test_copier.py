@@ -1,12 +1,21 @@
 import os
 import pathlib
+from collections import OrderedDict
 from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+from fsspec.implementations.local import LocalFileSystem
 
 import lightning_app
-from lightning_app.storage.copier import _Copier, _copy_files
+from lightning_app.storage.copier import (
+    _Copier,
+    _copy_files,
+    _digest,
+    _get_files,
+    _read_manifest,
+    _TransferStats,
+)
 from lightning_app.storage.path import Path
 from lightning_app.storage.requests import _ExistsRequest, _GetRequest
 from lightning_app.testing.helpers import _MockQueue
@@ -132,3 +141,116 @@ def test_copy_files_with_exception(tmpdir):
     with mock.patch("lightning_app.storage.copier._filesystem", fs_mock):
         with pytest.raises(ValueError, match="error from thread"):
             _copy_files(src, dst)
+
+
+def test_copy_files_incremental(tmpdir, monkeypatch):
+    """Test that the `_copy_files` utility only copies the files whose content changed since the last copy."""
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    src = pathlib.Path(tmpdir, "src")
+    dst = pathlib.Path(tmpdir, "dst")
+    (src / "folder").mkdir(parents=True)
+    for name in ("a.txt", "b.txt", "folder/c.txt"):
+        (src / name).write_text(name)
+
+    stats = _copy_files(src, dst)
+    assert stats == _TransferStats(files_transferred=3, files_skipped=0, bytes_transferred=22, bytes_skipped=0)
+    assert (dst / "folder" / "c.txt").read_text() == "folder/c.txt"
+
+    stats = _copy_files(src, dst)
+    assert stats == _TransferStats(files_transferred=0, files_skipped=3, bytes_transferred=0, bytes_skipped=22)
+
+    # only the modified file is copied, a new modification time alone doesn't trigger a copy
+    (src / "a.txt").write_text("new")
+    os.utime(src / "b.txt", (0, 0))
+    stats = _copy_files(src, dst)
+    assert stats == _TransferStats(files_transferred=1, files_skipped=2, bytes_transferred=3, bytes_skipped=17)
+    assert (dst / "a.txt").read_text() == "new"
+
+    # the files modified at the destination are copied again
+    (dst / "b.txt").write_text("modified")
+    stats = _copy_files(src, dst)
+    assert stats.files_transferred == 1
+    assert (dst / "b.txt").read_text() == "b.txt"
+
+
+def test_copy_files_chunks(tmpdir, monkeypatch):
+    """Test that only the modified chunks of the large files are rewritten."""
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    monkeypatch.setattr(lightning_app.storage.copier, "STORAGE_TRANSFER_CHUNK_SIZE", 4)
+    src = pathlib.Path(tmpdir, "src.bin")
+    dst = pathlib.Path(tmpdir, "dst.bin")
+    src.write_bytes(b"aaaabbbbccccdddd")
+    assert _copy_files(src, dst).bytes_transferred == 16
+
+    src.write_bytes(b"aaaaBBBBccccdddd")
+    stats = _copy_files(src, dst)
+    assert stats == _TransferStats(files_transferred=1, files_skipped=0, bytes_transferred=4, bytes_skipped=12)
+    assert dst.read_bytes() == b"aaaaBBBBccccdddd"
+
+    src.write_bytes(b"aaaaBBBBcc")
+    assert _copy_files(src, dst).bytes_transferred == 2
+    assert dst.read_bytes() == b"aaaaBBBBcc"
+
+    # the files hashed by chunks of another size are copied entirely
+    monkeypatch.setattr(lightning_app.storage.copier, "STORAGE_TRANSFER_CHUNK_SIZE", 8)
+    src.write_bytes(b"aaaaBBBBCCcc")
+    assert _copy_files(src, dst).bytes_transferred == 12
+    assert dst.read_bytes() == b"aaaaBBBBCCcc"
+
+    # the single files don't get a manifest
+    assert _read_manifest(LocalFileSystem(), dst) is None
+
+
+def test_get_files(tmpdir, monkeypatch):
+    """Test that the `_get_files` utility only copies the files which differ locally and removes the others."""
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    src = pathlib.Path(tmpdir, "src")
+    shared = pathlib.Path(tmpdir, ".shared", "123")
+    dst = pathlib.Path(tmpdir, "dst")
+    src.mkdir()
+    (src / "a.txt").write_text("a")
+    (src / "b.txt").write_text("b")
+    _copy_files(src, shared)
+
+    fs = LocalFileSystem()
+    files = _read_manifest(fs, shared)
+    assert set(files) == {"a.txt", "b.txt"}
+    assert files["a.txt"]["size"] == 1
+    assert _read_manifest(fs, dst) is None
+
+    assert _get_files(fs, shared, dst, files).files_transferred == 2
+    assert _get_files(fs, shared, dst, files).files_skipped == 2
+
+    (dst / "a.txt").write_text("modified")
+    (dst / "extra.txt").write_text("extra")
+    stats = _get_files(fs, shared, dst, files)
+    assert stats.files_transferred == 1
+    assert sorted(p.name for p in dst.iterdir()) == ["a.txt", "b.txt"]
+    assert (dst / "a.txt").read_text() == "a"
+
+
+def test_digest_cache(tmpdir, monkeypatch):
+    """Test that the digests of the recently modified files are only cached if this process wrote them, and that the
+    least recently used ones are evicted."""
+    monkeypatch.setattr(lightning_app.storage.copier, "_digests", OrderedDict())
+    monkeypatch.setattr(lightning_app.storage.copier, "_MAX_DIGESTS", 2)
+    path = pathlib.Path(tmpdir, "a.txt")
+    path.write_text("aaa")
+    digest = _digest(path)
+    assert not lightning_app.storage.copier._digests
+
+    # a rewrite with the same size and modification time is still detected
+    stat = path.stat()
+    path.write_text("bbb")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _digest(path)["hash"] != digest["hash"]
+
+    _copy_files(path, pathlib.Path(tmpdir, "copy.txt"))
+    assert list(lightning_app.storage.copier._digests) == [str(tmpdir / "copy.txt")]
+
+    for name in ("a.txt", "b.txt", "c.txt"):
+        path = pathlib.Path(tmpdir, name)
+        path.write_text(name)
+        os.utime(path, (0, 0))
+        assert _digest(path) is _digest(path)
+    assert list(lightning_app.storage.copier._digests) == [str(tmpdir / "b.txt"), str(tmpdir / "c.txt")]
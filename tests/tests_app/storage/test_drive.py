@@ -8,7 +8,7 @@ from lightning_app import LightningFlow, LightningWork
 from lightning_app.core.app import LightningApp
 from lightning_app.runners import MultiProcessRuntime
 from lightning_app.storage.drive import _maybe_create_drive, Drive
-from lightning_app.utilities.component import _set_flow_context
+from lightning_app.utilities.component import _set_flow_context, _set_work_context
 
 
 class SyncWorkLITDriveA(LightningWork):
@@ -241,3 +241,85 @@ def test_s3_drive_raises_error_telling_users_to_use_mounts():
 def test_drive_root_folder_breaks():
     with pytest.raises(Exception, match="The provided root_folder isn't a directory: a"):
         Drive("lit://drive", root_folder="a")
+
+
+def test_drive_put_many_get_many(tmpdir, monkeypatch):
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", os.path.join(tmpdir, "storage"))
+    src, dst = os.path.join(tmpdir, "src"), os.path.join(tmpdir, "dst")
+    os.makedirs(os.path.join(src, "folder"))
+    os.makedirs(dst)
+    paths = [f"file_{i}.txt" for i in range(10)] + ["folder"]
+    for path in paths[:-1] + ["folder/a.txt"]:
+        with open(os.path.join(src, path), "w") as f:
+            f.write("example")
+
+    drive = Drive("lit://drive", component_name="root.work1", root_folder=src)
+    drive.put_many(paths, max_workers=4)
+    assert sorted(drive.list(component_name="root.work1")) == sorted(paths)
+    assert drive.stats.num_puts == 11
+    assert drive.stats.bytes_put == 11 * len("example")
+    assert drive.stats.put_throughput > 0
+
+    with pytest.raises(Exception, match="The file file_0.txt can't be added"):
+        Drive("lit://drive", component_name="root.work3", root_folder=src).put_many(["file_0.txt"])
+
+    drive = Drive("lit://drive", component_name="root.work2", root_folder=dst)
+    drive.get_many(paths, component_name="root.work1")
+    assert sorted(os.listdir(dst)) == sorted(paths)
+    with open(os.path.join(dst, "folder", "a.txt")) as f:
+        assert f.read() == "example"
+    assert drive.stats.num_gets == 11
+    assert drive.stats.bytes_got == 11 * len("example")
+
+    _set_flow_context()
+    with pytest.raises(Exception, match="The flow isn't allowed to get files from a Drive."):
+        drive.get_many(paths)
+    _set_work_context()
+
+
+def test_drive_list_cache(tmpdir, monkeypatch):
+    from lightning_app.storage import drive as drive_module
+
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", os.path.join(tmpdir, "storage"))
+    with open(os.path.join(tmpdir, "a.txt"), "w") as f:
+        f.write("example")
+    drive = Drive("lit://drive", component_name="root.work1", root_folder=str(tmpdir))
+    other = Drive("lit://drive", allow_duplicates=True, component_name="root.work2", root_folder=str(tmpdir))
+
+    assert drive.list() == []
+    drive.put("a.txt")
+    # the listings are invalidated by the puts of the Drive
+    assert drive.list() == ["a.txt"]
+    num_lists = drive.stats.num_lists
+    assert drive.list() == ["a.txt"]
+    assert drive.stats.num_lists == num_lists
+    assert drive.stats.num_list_cache_hits > 0
+
+    # the puts of another Drive are listed once the listings expire
+    other.put("a.txt")
+    assert drive.list() == ["a.txt"]
+    monkeypatch.setattr(drive_module, "DRIVE_LIST_CACHE_TTL", 0)
+    assert drive.list() == ["a.txt", "a.txt"]
+
+    monkeypatch.setattr(drive_module, "DRIVE_LIST_CACHE_TTL", 100)
+    drive.delete("a.txt")
+    assert drive.list() == ["a.txt"]
+    assert drive.list(component_name="root.work1") == []
+
+
+def test_drive_delete_folder_manifest(tmpdir, monkeypatch):
+    from lightning_app.storage.copier import _read_manifest
+
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", os.path.join(tmpdir, "storage"))
+    os.makedirs(os.path.join(tmpdir, "folder"))
+    with open(os.path.join(tmpdir, "folder", "a.txt"), "w") as f:
+        f.write("example")
+    drive = Drive("lit://drive", component_name="root.work1", root_folder=str(tmpdir))
+    shared_path = drive._to_shared_path("folder", component_name="root.work1")
+
+    drive.put("folder")
+    assert set(_read_manifest(drive.fs, shared_path)) == {"a.txt"}
+
+    drive.delete("folder")
+    assert not drive.fs.exists(str(shared_path))
+    assert _read_manifest(drive.fs, shared_path) is None
@@ -1,17 +1,20 @@
 from unittest.mock import MagicMock
 
+import pytest
+
+from lightning_app.core.queues import SingleProcessQueue
 from lightning_app.storage.orchestrator import StorageOrchestrator
 from lightning_app.storage.requests import _GetRequest, _GetResponse
-from lightning_app.testing.helpers import _MockQueue
 from lightning_app.utilities.enum import WorkStageStatus
 
 
-def test_orchestrator():
-    """Simulate orchestration when Work B requests a file from Work A."""
-    request_queues = {"work_a": _MockQueue(), "work_b": _MockQueue()}
-    response_queues = {"work_a": _MockQueue(), "work_b": _MockQueue()}
-    copy_request_queues = {"work_a": _MockQueue(), "work_b": _MockQueue()}
-    copy_response_queues = {"work_a": _MockQueue(), "work_b": _MockQueue()}
+def _queues(*work_names):
+    return {name: SingleProcessQueue(name, default_timeout=5) for name in work_names}
+
+
+@pytest.fixture
+def orchestrator():
+    work_names = ("work_a", "work_b", "work_c")
     app = MagicMock()
     work = MagicMock()
     work.status.stage = WorkStageStatus.RUNNING
@@ -19,59 +22,108 @@ def test_orchestrator():
 
     orchestrator = StorageOrchestrator(
         app,
-        request_queues=request_queues,
-        response_queues=response_queues,
-        copy_request_queues=copy_request_queues,
-        copy_response_queues=copy_response_queues,
+        request_queues=_queues(*work_names),
+        response_queues=_queues(*work_names),
+        copy_request_queues=_queues(*work_names),
+        copy_response_queues=_queues(*work_names),
     )
+    orchestrator.fs = MagicMock()
+    orchestrator.fs.exists.return_value = False
+    orchestrator._listen_timeout = 0.1
+    orchestrator.start()
+    yield orchestrator
+    orchestrator.join()
 
-    # test idle behavior when queues are empty
-    orchestrator.run_once("work_a")
-    orchestrator.run_once("work_b")
-    assert not orchestrator.waiting_for_response
 
+def test_orchestrator(orchestrator):
+    """Simulate orchestration when Work B requests a file from Work A."""
     # simulate Work B sending a request for a file in Work A
     request = _GetRequest(source="work_a", path="/a/b/c.txt", hash="", destination="", name="")
-    request_queues["work_b"].put(request)
-    orchestrator.run_once("work_a")
-    assert not orchestrator.waiting_for_response
-    orchestrator.run_once("work_b")
+    orchestrator.request_queues["work_b"].put(request)
 
     # orchestrator is now waiting for a response for copier in Work A
-    assert "work_b" in orchestrator.waiting_for_response
-    assert not request_queues["work_a"]
-    assert request in copy_request_queues["work_a"]
-    assert request.destination == "work_b"
-
-    # simulate loop while waiting for new elements in the queues
-    orchestrator.run_once("work_a")
-    orchestrator.run_once("work_b")
+    copy_request = orchestrator.copy_request_queues["work_a"].get_many(1, timeout=5)[0]
+    assert copy_request.destination == "work_b"
+    assert ("work_b", "work_a", "", "") in orchestrator.waiting_for_response
 
     # simulate copier A confirms that the file is available on the shared volume
-    response = _GetResponse(source="work_a", path="/a/b/c.txt", hash="", destination="work_b", name="")
-    copy_request_queues["work_a"].get()
-    copy_response_queues["work_a"].put(response)
+    response = _GetResponse(source="work_a", path="/a/b/c.txt", hash="", destination="work_b", name="", timedelta=0.5)
+    orchestrator.copy_response_queues["work_a"].put(response)
 
     # orchestrator processes confirmation and confirms to the pending request from Work B
-    orchestrator.run_once("work_a")
-    assert not copy_response_queues["work_a"]
-    assert response in response_queues["work_b"]
-    assert not orchestrator.waiting_for_response
-    orchestrator.run_once("work_b")
-
-    # simulate loop while waiting for new elements in the queues
-    orchestrator.run_once("work_a")
-    orchestrator.run_once("work_b")
-    assert not orchestrator.waiting_for_response
-
-    # simulate Work B receiving the confirmation that the file was copied
-    response = response_queues["work_b"].get()
+    response = orchestrator.response_queues["work_b"].get_many(1, timeout=5)[0]
     assert response.source == "work_a"
     assert response.destination == "work_b"
     assert response.exception is None
+    assert not orchestrator.waiting_for_response
+    assert orchestrator.metrics.num_transfers == 1
+    assert orchestrator.metrics.transfer_time == 0.5
 
     # all queues should be empty
-    assert all(not queue for queue in request_queues.values())
-    assert all(not queue for queue in response_queues.values())
-    assert all(not queue for queue in copy_request_queues.values())
-    assert all(not queue for queue in copy_response_queues.values())
+    for queues in (
+        orchestrator.request_queues,
+        orchestrator.response_queues,
+        orchestrator.copy_request_queues,
+        orchestrator.copy_response_queues,
+    ):
+        assert all(queue.queue.empty() for queue in queues.values())
+
+
+def test_orchestrator_concurrent_requests(orchestrator):
+    """Test that the requests of a Work don't wait for its pending requests and that the orchestrator starts
+    listening to the queues of the Works added while it runs."""
+    for queues in (
+        orchestrator.request_queues,
+        orchestrator.response_queues,
+        orchestrator.copy_request_queues,
+        orchestrator.copy_response_queues,
+    ):
+        queues.update(_queues("work_d"))
+
+    requests = [
+        _GetRequest(source="work_a", path="/a.txt", hash="a", name="a"),
+        _GetRequest(source="work_c", path="/c.txt", hash="c", name="c"),
+        _GetRequest(source="work_a", path="/a.txt", hash="a", name="a"),
+    ]
+    orchestrator.request_queues["work_b"].put(requests[0])
+    orchestrator.request_queues["work_b"].put(requests[1])
+    orchestrator.request_queues["work_d"].put(requests[2])
+
+    copy_requests_a = orchestrator.copy_request_queues["work_a"].get_many(1, timeout=5)
+    copy_requests_a += orchestrator.copy_request_queues["work_a"].get_many(1, timeout=5)
+    copy_requests_c = orchestrator.copy_request_queues["work_c"].get_many(1, timeout=5)
+    assert sorted(request.destination for request in copy_requests_a) == ["work_b", "work_d"]
+    assert copy_requests_c[0].destination == "work_b"
+    assert len(orchestrator.waiting_for_response) == 3
+
+    for request in copy_requests_a + copy_requests_c:
+        response = _GetResponse(
+            source=request.source,
+            path=request.path,
+            hash=request.hash,
+            destination=request.destination,
+            name=request.name,
+        )
+        orchestrator.copy_response_queues[request.source].put(response)
+    responses = orchestrator.response_queues["work_b"].get_many(1, timeout=5)
+    responses += orchestrator.response_queues["work_b"].get_many(1, timeout=5)
+    assert sorted(response.source for response in responses) == ["work_a", "work_c"]
+    assert orchestrator.response_queues["work_d"].get_many(1, timeout=5)[0].source == "work_a"
+    assert not orchestrator.waiting_for_response
+    assert orchestrator.metrics.num_transfers == 3
+
+
+def test_orchestrator_listens_to_copy_responses_on_demand(orchestrator):
+    """Test that the copy responses of a Work are only listened to once a file was requested from it."""
+    orchestrator._start_listeners()
+    assert set(orchestrator._listeners) == {
+        ("work_a", "_on_request"),
+        ("work_b", "_on_request"),
+        ("work_c", "_on_request"),
+    }
+
+    request = _GetRequest(source="work_a", path="/a.txt", hash="a", name="a")
+    orchestrator.request_queues["work_b"].put(request)
+    orchestrator.copy_request_queues["work_a"].get_many(1, timeout=5)
+    assert ("work_a", "_on_copy_response") in orchestrator._listeners
+    assert ("work_c", "_on_copy_response") not in orchestrator._listeners
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 
+import lightning_app
 from lightning_app import LightningApp, LightningFlow, LightningWork
 from lightning_app.runners import MultiProcessRuntime
 from lightning_app.storage.path import (
@@ -19,7 +20,8 @@ from lightning_app.storage.path import (
     _storage_root_dir,
     Path,
 )
-from lightning_app.storage.requests import _ExistsResponse, _GetResponse
+from lightning_app.storage.copier import _TransferStats
+from lightning_app.storage.requests import _ExistsResponse, _GetRequest, _GetResponse
 from lightning_app.testing.helpers import _MockQueue, _RunIf, EmptyWork
 from lightning_app.utilities.app_helpers import LightningJSONEncoder
 from lightning_app.utilities.component import _context
@@ -527,11 +529,12 @@ class DestinationOverwriteWork(LightningWork):
 
     def run(self):
         assert self.path.exists()
-        with mock.patch("lightning_app.storage.path.shutil") as shutil_mock:
-            self.path.get(overwrite=True)
-        shutil_mock.rmtree.assert_called_with(self.path)
+        (self.path / "extra.txt").touch()
+        self.path.get(overwrite=True)
         assert self.path.exists()
         assert (self.path / "file.txt").exists()
+        # the files which don't exist in the source are removed
+        assert not os.path.exists(self.path / "extra.txt")
 
 
 class OverwriteFolderFlow(LightningFlow):
@@ -616,6 +619,39 @@ def test_path_response_not_matching_reqeuest(tmpdir):
         path.get()
 
 
+def test_path_get_transfer_stats(tmpdir, monkeypatch):
+    """Test that `Path.get()` records the bytes copied and skipped when getting a partly modified file again."""
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    monkeypatch.setattr(lightning_app.storage.copier, "STORAGE_TRANSFER_CHUNK_SIZE", 4)
+    origin_dir, consumer_dir = tmpdir.mkdir("origin"), tmpdir.mkdir("consumer")
+    response_queue = _MockQueue()
+    path = Path("data")
+    path._attach_queues(_MockQueue(), response_queue)
+    path._origin = "origin"
+    path._consumer = "consumer"
+
+    def get(content):
+        # the origin Work copies the folder to the shared storage, then the consumer gets it into its own filesystem
+        monkeypatch.chdir(origin_dir)
+        os.makedirs("data", exist_ok=True)
+        pathlib.Path("data", "file.bin").write_bytes(content)
+        request = _GetRequest(source="origin", path=str(path), hash=path.hash, name="")
+        response_queue.put(Path._handle_get_request(Mock(), request))
+        monkeypatch.chdir(consumer_dir)
+        with _context("work"):
+            path.get(overwrite=True)
+        assert pathlib.Path("data", "file.bin").read_bytes() == content
+
+    assert path.upload_stats is path.download_stats is None
+    get(b"aaaabbbbccccdddd")
+    assert path.upload_stats == _TransferStats(files_transferred=1, bytes_transferred=16)
+    assert path.download_stats == _TransferStats(files_transferred=1, bytes_transferred=16)
+
+    get(b"aaaaBBBBccccdddd")
+    assert path.upload_stats == _TransferStats(files_transferred=1, bytes_transferred=4, bytes_skipped=12)
+    assert path.download_stats == _TransferStats(files_transferred=1, bytes_transferred=4, bytes_skipped=12)
+
+
 def test_path_exists(tmpdir):
     """Test that the Path.exists() behaves as expected: First it should check if the file exists locally, and if
     not, send a message to the orchestrator to eventually check the existenc on the origin Work."""
@@ -22,6 +22,7 @@ from lightning_app.utilities.app_helpers import (
     StateStore,
 )
 from lightning_app.utilities.exceptions import LightningAppStateException
+from lightning_app.utilities.json_patch import _apply_json_patch
 
 
 class Work(LightningWork):
@@ -64,6 +65,41 @@ def test_simple_app_store():
     assert isinstance(store, StateStore)
 
 
+@mock.patch("lightning_app.utilities.app_helpers._MAX_STATE_PATCHES", 3)
+def test_app_store_versions():
+    store = InMemoryStateStore()
+    user_id = "1234"
+    store.add(user_id)
+    assert store.get_version(user_id) == 0
+    assert store.get_patches(user_id, 0) == []
+
+    states = [{"vars": {"counter": i}, "works": {}} for i in range(5)]
+    for state in states:
+        store.set_app_state(user_id, state)
+    assert store.get_version(user_id) == 5
+    assert store.counter == 5
+
+    # the same state doesn't create a new version
+    store.set_app_state(user_id, dict(states[-1]))
+    assert store.get_version(user_id) == 5
+    assert store.counter == 5
+
+    assert store.get_patches(user_id, 5) == []
+    assert _apply_json_patch(states[3], store.get_patches(user_id, 4)) == states[4]
+    assert _apply_json_patch(states[1], store.get_patches(user_id, 2)) == states[4]
+    # only the patches of the latest 3 versions are kept
+    assert store.get_patches(user_id, 1) is None
+    assert store.get_patches(user_id, 0) is None
+    # a version newer than the store, e.g. kept by a client while the server restarted
+    assert store.get_patches(user_id, 6) is None
+
+    # the values comparing equal but of different types are stored as a new version
+    store.set_app_state(user_id, {"vars": {"counter": 4.0}, "works": {}})
+    assert store.get_version(user_id) == 6
+    assert store.get_app_state(user_id)["vars"]["counter"] == 4.0
+    assert isinstance(store.get_app_state(user_id)["vars"]["counter"], float)
+
+
 @mock.patch("lightning_app.core.constants.APP_STATE_MAX_SIZE_BYTES", 120)
 def test_simple_app_store_warning():
     store = InMemoryStateStore()
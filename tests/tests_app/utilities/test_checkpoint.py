@@ -0,0 +1,89 @@
+import os
+import pickle
+import random
+
+import pytest
+
+from lightning_app.utilities.checkpoint import _apply_changes, _CheckpointLog, _load_checkpoint, _state_changes
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": 2}),
+        ({"a": 1, "b": 2}, {"b": 2}),
+        ({"a": {"b": {"c": [1, 2]}}}, {"a": {"b": {"c": [1, 2, 3]}, "d": None}}),
+        ({"a": {"b": 1}}, {"a": [1]}),
+        ({"a": 1, "b": 0}, {"a": True, "b": 0.0}),
+        ({"a": [1, {"b": 1}]}, {"a": [1, {"b": 1.0}]}),
+    ],
+)
+def test_state_changes(old, new):
+    changes = _state_changes(old, new)
+    state = pickle.loads(pickle.dumps(old))
+    _apply_changes(state, changes)
+    assert state == new
+    # the values changing type only are restored with their new type
+    assert repr(state) == repr(new)
+
+
+def make_state(step):
+    return {
+        "vars": {"step": step},
+        "works": {f"work_{i}": {"vars": {"data": random.Random(i).randbytes(100)}} for i in range(10)},
+    }
+
+
+def test_checkpoint_log(tmpdir):
+    log = _CheckpointLog(str(tmpdir), snapshot_interval=2, max_snapshots=2)
+    paths = [os.path.basename(log.write(make_state(step))) for step in range(7)]
+    assert paths == ["v_0.snapshot", "v_0.log", "v_0.log", "v_3.snapshot", "v_3.log", "v_3.log", "v_6.snapshot"]
+    assert log.stats.is_snapshot
+    assert sorted(os.listdir(tmpdir)) == ["v_3.log", "v_3.snapshot", "v_6.snapshot"]
+
+    for step in range(3, 7):
+        assert _load_checkpoint(str(tmpdir), step) == make_state(step)
+    assert _load_checkpoint(str(tmpdir)) == make_state(6)
+    with pytest.raises(FileNotFoundError, match="The version `2` wasn't found"):
+        _load_checkpoint(str(tmpdir), 2)
+
+    # the records of the log are much smaller than the snapshots
+    log.write(make_state(7))
+    assert not log.stats.is_snapshot
+    assert log.stats.num_bytes < os.path.getsize(os.path.join(tmpdir, "v_6.snapshot")) / 10
+
+
+def test_checkpoint_log_compacts_large_logs(tmpdir):
+    log = _CheckpointLog(str(tmpdir), snapshot_interval=100)
+    state = make_state(0)
+    log.write(state)
+    for i in range(10):
+        # every record replaces most of the state
+        state = {"vars": {"data": os.urandom(1000)}}
+        log.write(state)
+        if log.stats.is_snapshot:
+            break
+    assert log.stats.is_snapshot
+    assert _load_checkpoint(str(tmpdir)) == state
+
+
+def test_checkpoint_log_torn_record(tmpdir):
+    log = _CheckpointLog(str(tmpdir))
+    for step in range(3):
+        path = log.write(make_state(step))
+    with open(path, "rb+") as f:
+        f.truncate(os.path.getsize(path) - 3)
+    assert _load_checkpoint(str(tmpdir)) == make_state(1)
+
+    # a new log continues after the complete records
+    log = _CheckpointLog(str(tmpdir))
+    assert os.path.basename(log.write(make_state(2))) == "v_2.snapshot"
+    assert _load_checkpoint(str(tmpdir)) == make_state(2)
+
+
+def test_checkpoint_log_arguments(tmpdir):
+    with pytest.raises(ValueError, match="snapshot interval should be positive"):
+        _CheckpointLog(str(tmpdir), snapshot_interval=-1)
+    with pytest.raises(ValueError, match="At least one snapshot"):
+        _CheckpointLog(str(tmpdir), max_snapshots=0)
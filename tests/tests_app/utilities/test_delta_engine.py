@@ -0,0 +1,188 @@
+from unittest import mock
+
+from deepdiff import DeepDiff
+
+from lightning_app import LightningApp, LightningFlow, LightningWork
+from lightning_app.core.queues import SingleProcessQueue
+from lightning_app.structures import List
+from lightning_app.utilities.app_helpers import _set_child_name
+from lightning_app.utilities import delta_engine
+from lightning_app.utilities.delta_engine import _DeltaEngine, _get_dirty
+
+
+class Work(LightningWork):
+    def __init__(self):
+        super().__init__(parallel=True)
+        self.counter = 0
+        self.names = []
+
+    def run(self):
+        pass
+
+
+class Flow(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.values = []
+        self.w = Work()
+        self.list = List(Work(), Work())
+
+    def run(self):
+        pass
+
+
+def test_delta_engine_tracks_setattr():
+    app = LightningApp(Flow())
+    engine: _DeltaEngine = app._delta_engine
+    assert engine.collect() == {}
+    assert not _get_dirty(app.root)
+
+    app.root.counter = 1
+    assert _get_dirty(app.root) == {"counter"}
+    app.root.list[1].counter = 2
+    diff = engine.collect()
+    assert diff == {
+        "values_changed": {
+            "root['vars']['counter']": {"new_value": 1, "old_value": 0},
+            "root['structures']['list']['works']['1']['vars']['counter']": {"new_value": 2, "old_value": 0},
+        }
+    }
+
+    # the output is compatible with the `DeepDiff` based diffing.
+    assert diff == DeepDiff(app.last_state, app.state, verbose_level=2).to_dict()
+    assert app.last_state + engine.to_delta() == app.state
+
+    engine.commit()
+    assert app.last_state == app.state
+    assert not _get_dirty(app.root)
+    assert engine.collect() == {}
+
+
+def test_delta_engine_in_place_mutations():
+    app = LightningApp(Flow())
+    engine: _DeltaEngine = app._delta_engine
+
+    app.root.values.append(1)
+    app.root.w.names.append("a")
+    diff = engine.collect()
+    assert set(diff["values_changed"]) == {"root['vars']['values']", "root['works']['w']['vars']['names']"}
+    engine.commit()
+    assert app.last_state == app.state
+
+    # setting the same value doesn't generate any change and the variable isn't compared again
+    app.root.counter = 0
+    assert engine.collect() == {}
+    assert not _get_dirty(app.root)
+
+    app.root.counter = "0"
+    assert engine.collect()["type_changes"]["root['vars']['counter']"]["new_value"] == "0"
+
+
+class ScalarWork(LightningWork):
+    def __init__(self):
+        super().__init__(parallel=True)
+        self.counter = 0
+
+    def run(self):
+        pass
+
+
+class ScalarFlow(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.values = []
+        self.w = ScalarWork()
+
+    def run(self):
+        pass
+
+
+def test_delta_engine_only_compares_assigned_and_mutable_vars():
+    app = LightningApp(ScalarFlow())
+    engine: _DeltaEngine = app._delta_engine
+
+    def compared_vars():
+        with mock.patch.object(delta_engine, "_changed_vars", wraps=delta_engine._changed_vars) as changed_vars:
+            engine.collect()
+            engine.commit()
+        return {args[0].name: args[2] for args, _ in changed_vars.call_args_list}
+
+    # the scalar values of the work are only compared once assigned, unlike its cloud compute
+    assert compared_vars() == {"root": {"_layout", "values"}, "root.w": {"_cloud_compute"}}
+    app.root.w.counter = 1
+    assert compared_vars() == {"root": {"_layout", "values"}, "root.w": {"_cloud_compute"}}
+
+    # the variables holding mutable values are tracked as they are assigned
+    app.root.values = 1
+    assert compared_vars() == {"root": {"_layout"}, "root.w": {"_cloud_compute"}}
+    app.root.w.counter = [1]
+    assert compared_vars() == {"root": {"_layout"}, "root.w": {"_cloud_compute", "counter"}}
+    app.root.w.counter.append(2)
+    assert compared_vars() == {"root": {"_layout"}, "root.w": {"_cloud_compute", "counter"}}
+    assert app.last_state["works"]["w"]["vars"]["counter"] == [1, 2]
+
+
+def test_delta_engine_non_primitive_values_mutated_in_place():
+    app = LightningApp(ScalarFlow())
+    engine: _DeltaEngine = app._delta_engine
+
+    app.root.w.cloud_compute.disk_size = 100
+    diff = engine.collect()
+    assert set(diff["values_changed"]) == {"root['works']['w']['vars']['_cloud_compute']"}
+    engine.commit()
+    assert app.last_state["works"]["w"]["vars"]["_cloud_compute"]["disk_size"] == 100
+    assert engine.collect() == {}
+
+
+def test_delta_engine_keeps_the_changed_vars_dirty_until_committed():
+    app = LightningApp(Flow())
+    engine: _DeltaEngine = app._delta_engine
+
+    app.root.counter = 1
+    app.root.w.counter = 0
+    assert set(engine.collect()["values_changed"]) == {"root['vars']['counter']"}
+    assert _get_dirty(app.root) == {"counter"}
+    assert not _get_dirty(app.root.w)
+    # the uncommitted changes are found again
+    assert set(engine.collect()["values_changed"]) == {"root['vars']['counter']"}
+    engine.commit()
+    assert not _get_dirty(app.root)
+
+    # setting the app state doesn't mark all the variables as assigned
+    app.set_state(app.state)
+    assert not _get_dirty(app.root)
+    assert not _get_dirty(app.root.w)
+
+
+def test_delta_engine_tree_changed():
+    app = LightningApp(Flow())
+    engine: _DeltaEngine = app._delta_engine
+    work = Work()
+    app.root.list.append(work)
+    _set_child_name(app.root.list, work, "2")
+    assert engine.has_tree_changed()
+    assert engine.collect() is None
+
+    app.delta_queue = SingleProcessQueue("delta_queue", 0)
+    app._has_updated = False
+    app.maybe_apply_changes()
+    assert app._has_updated
+    assert "2" in app.last_state["structures"]["list"]["works"]
+    assert not engine.has_tree_changed()
+
+
+def test_delta_engine_work_vars_diff():
+    app = LightningApp(Flow())
+    engine: _DeltaEngine = app._delta_engine
+    assert engine.work_vars_diff(app.root.w) == {}
+
+    app.root.w.counter = 3
+    app.root.w.names.append("a")
+    # private variables aren't sent to the work.
+    app.root.w._url = "http://localhost"
+    # the changes are as fine-grained as the ``DeepDiff`` of the work variables.
+    assert engine.work_vars_diff(app.root.w) == {
+        "values_changed": {"root['counter']": {"new_value": 3, "old_value": 0}},
+        "iterable_item_added": {"root['names'][0]": "a"},
+    }
@@ -0,0 +1,44 @@
+import pytest
+
+from lightning_app.utilities.json_patch import _apply_json_patch, _json_patch
+
+
+@pytest.mark.parametrize(
+    "old, new, expected",
+    [
+        ({"a": 1}, {"a": 1}, []),
+        ({"a": 1}, {"a": 2}, [{"op": "replace", "path": "/a", "value": 2}]),
+        ({"a": 1}, {"a": 1, "b": [1]}, [{"op": "add", "path": "/b", "value": [1]}]),
+        ({"a": 1, "b": 2}, {"b": 2}, [{"op": "remove", "path": "/a"}]),
+        ({"a": [1, 2]}, {"a": [1, 3]}, [{"op": "replace", "path": "/a/1", "value": 3}]),
+        ({"a": [1, 2]}, {"a": [1]}, [{"op": "replace", "path": "/a", "value": [1]}]),
+        ({"a/b": {"~c": 0}}, {"a/b": {"~c": 1}}, [{"op": "replace", "path": "/a~1b/~0c", "value": 1}]),
+        ({"a": 1}, [1], [{"op": "replace", "path": "", "value": [1]}]),
+        ({"a": 0}, {"a": False}, [{"op": "replace", "path": "/a", "value": False}]),
+        ({"a": [1]}, {"a": [1.0]}, [{"op": "replace", "path": "/a/0", "value": 1.0}]),
+    ],
+)
+def test_json_patch(old, new, expected):
+    assert _json_patch(old, new) == expected
+    patched = _apply_json_patch(old, expected)
+    assert patched == new
+    assert repr(patched) == repr(new)
+
+
+def test_apply_json_patch():
+    document = {"vars": {"a": 1}, "works": {"w": {"vars": {"b": [1, 2]}}}}
+    new = _apply_json_patch(
+        document,
+        [
+            {"op": "add", "path": "/works/w/vars/b/-", "value": 3},
+            {"op": "add", "path": "/works/w/vars/b/0", "value": 0},
+            {"op": "remove", "path": "/vars/a"},
+            {"op": "add", "path": "/vars/c", "value": {"d": None}},
+        ],
+    )
+    assert new == {"vars": {"c": {"d": None}}, "works": {"w": {"vars": {"b": [0, 1, 2, 3]}}}}
+    # the document isn't modified
+    assert document == {"vars": {"a": 1}, "works": {"w": {"vars": {"b": [1, 2]}}}}
+
+    with pytest.raises(ValueError, match="operation move isn't supported"):
+        _apply_json_patch(document, [{"op": "move", "from": "/vars/a", "path": "/vars/b"}])
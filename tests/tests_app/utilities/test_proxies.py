@@ -65,12 +65,79 @@ def test_lightning_work_setattr():
     assert work_proxy_output.delta.to_dict() == {"values_changed": {"root['vars']['counter']": {"new_value": 1}}}
 
 
+def test_lightning_work_setattr_coalescing():
+    """This test validates that the `LightningWorkSetAttrProxy` merges the updates made within the coalescing window
+    into a single delta."""
+
+    class Work(LightningWork):
+        def __init__(self):
+            super().__init__()
+            self.counter = 0
+            self.message = ""
+
+        def run(self):
+            for i in range(100):
+                self.counter = i + 1
+            self.message = "done"
+
+    work = Work()
+    work._name = "root.w"
+    delta_queue = _MockQueue("delta_queue")
+    observer = WorkStateObserver(work, delta_queue)
+    setattr_proxy = LightningWorkSetAttrProxy(work.name, work, delta_queue, observer, coalescing_window=10)
+    work._setattr_replacement = setattr_proxy
+
+    work.run()
+
+    # this is necessary only in this test where we simulate the calls
+    work._calls.clear()
+    work._calls.update({CacheCallsKeys.LATEST_CALL_HASH: None})
+
+    assert not delta_queue
+    assert setattr_proxy.num_deltas_produced == 101
+    assert setattr_proxy.num_deltas_sent == 0
+
+    setattr_proxy.flush()
+    assert len(delta_queue) == 1
+    assert delta_queue._queue[0].delta.to_dict() == {
+        "values_changed": {
+            "root['vars']['counter']": {"new_value": 100},
+            "root['vars']['message']": {"new_value": "done"},
+        }
+    }
+    assert setattr_proxy.num_deltas_sent == 1
+
+    # the observer doesn't send the updates again.
+    observer.run_once()
+    assert len(delta_queue) == 1
+
+    # setting the same value doesn't send any delta.
+    work.counter = 100
+    setattr_proxy.flush()
+    assert len(delta_queue) == 1
+
+    # the pending updates are sent once the window elapsed.
+    setattr_proxy.coalescing_window = 0.01
+    work.counter = 0
+    work.counter = 1
+    time.sleep(0.2)
+    assert len(delta_queue) == 2
+    assert delta_queue._queue[1].delta.to_dict() == {"values_changed": {"root['vars']['counter']": {"new_value": 1}}}
+    assert setattr_proxy.num_deltas_produced == 104
+    assert setattr_proxy.num_deltas_sent == 2
+
+
 @pytest.mark.parametrize("parallel", [True, False])
 @pytest.mark.parametrize("cache_calls", [False, True])
+@pytest.mark.parametrize("coalescing_window", [0, 10])
 @pytest.mark.skipif(sys.platform == "win32", reason="TODO (@ethanwharris): Fix this on Windows")
-def test_work_runner(parallel, cache_calls):
+def test_work_runner(parallel, cache_calls, coalescing_window, monkeypatch):
     """This test validates the `WorkRunner` runs the work.run method and properly populates the `delta_queue`,
-    `error_queue` and `readiness_queue`."""
+    `error_queue` and `readiness_queue`.
+
+    The pending state updates are sent before the status of the work changes.
+    """
+    monkeypatch.setattr("lightning_app.utilities.proxies.WORK_DELTA_COALESCING_WINDOW", coalescing_window)
 
     class Work(LightningWork):
         def __init__(self, cache_calls=True, parallel=True):
@@ -149,7 +216,7 @@ def test_work_runner(parallel, cache_calls):
         assert isinstance(error_queue._queue[0], Exception)
     else:
         assert isinstance(error_queue._queue[0], Empty)
-        assert len(delta_queue._queue) == 3
+        assert len(delta_queue._queue) == 4
         res = delta_queue._queue[0].delta.to_dict()["iterable_item_added"]
         assert res[f"root['calls']['{call_hash}']['statuses'][0]"]["stage"] == "running"
         assert delta_queue._queue[1].delta.to_dict() == {
@@ -157,6 +224,8 @@ def test_work_runner(parallel, cache_calls):
         }
         res = delta_queue._queue[2].delta.to_dict()["dictionary_item_added"]
         assert res[f"root['calls']['{call_hash}']['ret']"] is None
+        # the app loop is woken up to notice the error
+        assert delta_queue._queue[3] is None
 
     # Stop blocking and let the thread join
     BlockingQueue.keep_blocking = False
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+from deepdiff import DeepDiff, Delta
+
+from lightning_app.api.request_types import _APIRequest, _DeltaRequest
+from lightning_app.storage import Path
+from lightning_app.utilities.imports import _is_msgpack_available, _is_numpy_available
+from lightning_app.utilities.proxies import ComponentDelta
+from lightning_app.utilities.serialization import _get_serializer, MsgpackSerializer, PickleSerializer
+
+if _is_numpy_available():
+    import numpy as np
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        1,
+        1.5,
+        "a",
+        b"a",
+        [True, (1, 2)],
+        {1: (2, 3), "a": {"b": [None]}},
+        _APIRequest(id="1", name="root", method_name="handler", args=(1,), kwargs={"a": b"b"}),
+    ],
+)
+def test_msgpack_serializer(obj):
+    serializer = MsgpackSerializer()
+    data = serializer.dumps(obj)
+    assert data[:1] == b"\x01"
+    assert serializer.loads(data) == obj
+    assert len(data) < len(pickle.dumps(obj))
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+def test_msgpack_serializer_deltas():
+    serializer = MsgpackSerializer()
+
+    delta = Delta(DeepDiff({"a": 1, "b": [1]}, {"a": 2, "b": [1, 2], "c": (1,)}, verbose_level=2))
+    out = serializer.loads(serializer.dumps(ComponentDelta(id="root.w", delta=delta)))
+    assert isinstance(out, ComponentDelta)
+    assert out.id == "root.w"
+    assert isinstance(out.delta, Delta)
+    assert out.delta.diff == delta.diff
+    assert {"a": 1, "b": [1]} + out.delta == {"a": 2, "b": [1, 2], "c": (1,)}
+
+    out = serializer.loads(serializer.dumps(_DeltaRequest(delta=delta)))
+    assert out.delta.diff == delta.diff
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+@pytest.mark.skipif(not _is_numpy_available(), reason="numpy isn't installed.")
+def test_msgpack_serializer_arrays():
+    serializer = MsgpackSerializer()
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2]
+    out = serializer.loads(serializer.dumps({"array": array}))["array"]
+    assert out.dtype == array.dtype
+    np.testing.assert_array_equal(out, array)
+    # the decoded arrays are writable, as the unpickled ones.
+    out[0, 0] = 1
+
+
+@pytest.mark.skipif(not _is_msgpack_available(), reason="msgpack isn't installed.")
+def test_msgpack_serializer_falls_back_to_pickle():
+    serializer = MsgpackSerializer()
+    for obj in [{"type": int}, {"path": Path("a")}, Delta({}, raise_errors=True)]:
+        data = serializer.dumps(obj)
+        assert data == pickle.dumps(obj)
+    assert serializer.loads(pickle.dumps({"type": int})) == {"type": int}
+
+    # the payloads of the pickle serializer can be decoded.
+    assert serializer.loads(PickleSerializer().dumps((1, 2))) == (1, 2)
+
+
+def test_get_serializer():
+    assert isinstance(_get_serializer("pickle"), PickleSerializer)
+    with pytest.raises(ValueError, match="The serializer should be one of"):
+        _get_serializer("json")
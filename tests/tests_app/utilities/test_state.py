@@ -243,6 +243,7 @@ class MockResponse:
     def __init__(self, state, status_code):
         self._state = state
         self.status_code = status_code
+        self.headers = {}
 
     def json(self):
         return self._state
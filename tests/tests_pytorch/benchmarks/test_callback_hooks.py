@@ -0,0 +1,78 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from functools import partial
+
+import pytest
+
+from pytorch_lightning import Callback, Trainer
+from tests_pytorch.benchmarks import _MARK_SHORT_BM
+
+_BATCH_HOOKS = (
+    ("on_train_batch_start", (None, 0)),
+    ("on_before_backward", (None,)),
+    ("on_after_backward", ()),
+    ("on_before_optimizer_step", (None, 0)),
+    ("on_before_zero_grad", (None,)),
+    ("on_train_batch_end", (None, None, 0)),
+)
+
+
+class _BatchEndCallback(Callback):
+    def __init__(self):
+        self.num_calls = 0
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        self.num_calls += 1
+
+
+def _call_callback_hooks_loop(trainer, hook_name, *args):
+    # the dispatch without the table: every callback is looked up and profiled on every call
+    for callback in trainer.callbacks:
+        fn = getattr(callback, hook_name)
+        if callable(fn):
+            with trainer.profiler.profile(f"[Callback]{callback.state_key}.{hook_name}"):
+                fn(trainer, trainer.lightning_module, *args)
+
+
+@pytest.mark.parametrize("num_callbacks", [1, 10, pytest.param(50, marks=_MARK_SHORT_BM)])
+def test_empty_step_throughput(num_callbacks):
+    """Compare the number of empty steps per second running the callback hooks of a training step, with and
+    without the dispatch table, where one callback out of two only overrides ``on_train_batch_end``."""
+    trainer = Trainer(logger=False, enable_checkpointing=False, enable_progress_bar=False, enable_model_summary=False)
+    trainer.callbacks = [_BatchEndCallback() if i % 2 else Callback() for i in range(num_callbacks)]
+    num_steps, num_runs = 2000, 3
+    throughputs = {}
+    for use_table in (False, True):
+        call_hook = trainer._call_callback_hooks if use_table else partial(_call_callback_hooks_loop, trainer)
+        durations = []
+        for _ in range(num_runs):
+            t0 = time.perf_counter()
+            for _ in range(num_steps):
+                for hook_name, args in _BATCH_HOOKS:
+                    call_hook(hook_name, *args)
+            durations.append(time.perf_counter() - t0)
+        # the best of a few runs, as a single run is noisy
+        throughputs[use_table] = num_steps / min(durations)
+
+    print(
+        f"{num_callbacks} callbacks: {throughputs[False]:.0f} -> {throughputs[True]:.0f} empty steps/s"
+        f" ({throughputs[True] / throughputs[False]:.1f}x)"
+    )
+    # only the callbacks overriding a hook are in its table, and they are called on every step by both paths
+    batch_end_callbacks = [c for c in trainer.callbacks if isinstance(c, _BatchEndCallback)]
+    for hook_name, _ in _BATCH_HOOKS:
+        overriding_callbacks, _ = trainer._get_callback_hooks(hook_name)
+        assert overriding_callbacks == (batch_end_callbacks if hook_name == "on_train_batch_end" else [])
+    assert all(c.num_calls == 2 * num_runs * num_steps for c in batch_end_callbacks)
@@ -0,0 +1,170 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from contextlib import nullcontext
+from functools import partial
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.loggers import Logger
+from pytorch_lightning.trainer.connectors.logger_connector import result as result_module
+from pytorch_lightning.trainer.connectors.logger_connector.result import _Metadata, _ResultCollection
+from tests_pytorch.benchmarks import _MARK_SHORT_BM
+from tests_pytorch.core.test_results import spawn_launch
+from tests_pytorch.helpers.runif import RunIf
+
+
+@pytest.mark.parametrize("num_keys", [1, 10, pytest.param(100, marks=_MARK_SHORT_BM)])
+def test_log_overhead(num_keys):
+    """Compare the duration of logging ``num_keys`` scalars per step, creating and checking the metadata of each
+    key at every call and reusing it from the previous steps."""
+    values = [torch.tensor(float(i)) for i in range(num_keys)]
+    num_steps = 200
+    durations = {}
+    num_metadata_created = {}
+    for reuse_metadata in (False, True):
+        result = _ResultCollection(True, torch.device("cpu"))
+        duration = 0.0
+        with mock.patch.object(result_module, "_Metadata", wraps=_Metadata) as metadata_cls:
+            for _ in range(num_steps):
+                if not reuse_metadata:
+                    result._logged_metadata.clear()
+                t0 = time.perf_counter()
+                for i, value in enumerate(values):
+                    result.log("training_step", f"key_{i}", value, on_step=True, on_epoch=True, batch_size=32)
+                duration += time.perf_counter() - t0
+        durations[reuse_metadata] = duration / num_steps
+        num_metadata_created[reuse_metadata] = metadata_cls.call_count
+        assert result["training_step.key_0"].cumulated_batch_size == 32 * num_steps
+
+    # the metadata of each key is only created by its first call when it is reused
+    assert num_metadata_created == {False: num_keys * num_steps, True: num_keys}
+
+    print(
+        f"{num_keys} logged keys: {durations[False] * 1e3:.3f}ms -> {durations[True] * 1e3:.3f}ms per step"
+        f" ({durations[True] / num_keys * 1e6:.1f}us per call)"
+    )
+
+
+def epoch_end_sync_fn(strategy, num_keys):
+    num_collectives = 0
+
+    def reduce(tensor, *args, **kwargs):
+        nonlocal num_collectives
+        num_collectives += 1
+        return strategy.reduce(tensor, *args, **kwargs)
+
+    num_epochs = 5
+    durations = {}
+    collectives = {}
+    for bucketed in (False, True):
+        result = _ResultCollection(True, torch.device("cpu"))
+        num_collectives = 0
+        duration = 0.0
+        # without the buckets, every metric is synced on its own when its value is computed
+        with nullcontext() if bucketed else mock.patch.object(result, "_sync_epoch_values"):
+            for _ in range(num_epochs):
+                for i in range(num_keys):
+                    result.log(
+                        "training_step",
+                        f"key_{i}",
+                        torch.tensor(float(i)),
+                        batch_size=32,
+                        sync_dist=True,
+                        sync_dist_fn=reduce,
+                    )
+                t0 = time.perf_counter()
+                result.metrics(False)
+                duration += time.perf_counter() - t0
+                result.reset()
+        durations[bucketed] = duration / num_epochs
+        collectives[bucketed] = num_collectives // num_epochs
+
+    assert collectives == {False: 2 * num_keys, True: 2}
+    if strategy.global_rank == 0:
+        print(
+            f"{num_keys} synced keys: {collectives[False]} -> {collectives[True]} collectives,"
+            f" {durations[False] * 1e3:.3f}ms -> {durations[True] * 1e3:.3f}ms per epoch end"
+        )
+
+
+@RunIf(skip_windows=True)
+@pytest.mark.parametrize("num_keys", [10, pytest.param(100, marks=_MARK_SHORT_BM)])
+def test_epoch_end_sync(num_keys):
+    """Compare the duration of the epoch end with ``num_keys`` metrics logged with ``sync_dist=True`` over two
+    processes, syncing each metric on its own and all of them with one collective per bucket."""
+    spawn_launch(partial(epoch_end_sync_fn, num_keys=num_keys), [torch.device("cpu")] * 2)
+
+
+class _NoOpLogger(Logger):
+    def __init__(self):
+        super().__init__()
+        self.logged_metrics = []
+
+    @property
+    def name(self):
+        return "no_op"
+
+    @property
+    def version(self):
+        return 0
+
+    def log_metrics(self, metrics, step=None):
+        self.logged_metrics.append(metrics)
+
+    def log_hyperparams(self, *args, **kwargs):
+        pass
+
+
+@pytest.mark.parametrize("accelerator", ["cpu", pytest.param("cuda", marks=RunIf(min_cuda_gpus=1))])
+@pytest.mark.parametrize("num_keys", [1, 10, pytest.param(100, marks=_MARK_SHORT_BM)])
+def test_step_hooks_overhead(accelerator, num_keys):
+    """Measure the host time spent per step by the logger connector to log ``num_keys`` metrics shown in the progress
+    bar, with the device busy on CUDA."""
+    logger = _NoOpLogger()
+    trainer = Trainer(accelerator=accelerator, devices=1, logger=logger, log_every_n_steps=1)
+    connector = trainer._logger_connector
+    device = trainer.strategy.root_device
+    results = _ResultCollection(True, device)
+    values = [torch.tensor(float(i), device=device) for i in range(num_keys)]
+    x = torch.rand(1024, 1024, device=device)
+    num_steps = 100
+    duration = 0.0
+    with mock.patch.object(
+        Trainer, "_results", new_callable=mock.PropertyMock, return_value=results
+    ), mock.patch.object(trainer.fit_loop, "_should_accumulate", return_value=False):
+        for batch_idx in range(num_steps):
+            connector.on_batch_start(None, batch_idx)
+            # keep the device busy, as in a training step
+            y = x @ x
+            for i, value in enumerate(values):
+                results.log(
+                    "training_step", f"key_{i}", value + y[0, 0] * 0, on_step=True, on_epoch=False, prog_bar=True
+                )
+            t0 = time.perf_counter()
+            connector.update_train_step_metrics()
+            connector.on_batch_end()
+            _ = trainer.progress_bar_metrics
+            duration += time.perf_counter() - t0
+        connector.flush_metrics()
+
+    print(f"{num_keys} keys on {accelerator}: {duration / num_steps * 1e6:.1f}us per step in the logging hooks")
+    # the metrics of every step reach the loggers, and the ones of the final step the progress bar
+    expected = {f"key_{i}": float(i) for i in range(num_keys)}
+    assert len(logger.logged_metrics) == num_steps
+    assert all({k: v for k, v in metrics.items() if k != "epoch"} == expected for metrics in logger.logged_metrics)
+    assert connector._progress_bar_metrics == expected
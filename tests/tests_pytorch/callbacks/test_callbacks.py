@@ -13,6 +13,7 @@
 # limitations under the License.
 from pathlib import Path
 from re import escape
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
@@ -160,3 +161,39 @@ def test_resume_incomplete_callbacks_list_warning(tmpdir):
     )
     with no_warning_call(UserWarning, match="Please add the following callbacks:"):
         trainer.fit(model, ckpt_path=ckpt_path)
+
+
+def test_callback_hooks_dispatch_table():
+    """Test that the callbacks not overriding a hook are only called when profiling, and that the dispatch table
+    follows the changes of the callbacks."""
+
+    class OverridingCallback(Callback):
+        def on_train_batch_start(self, trainer, pl_module, batch, batch_idx):
+            self.batch_idx = batch_idx
+
+    overriding_callback = OverridingCallback()
+    no_op_callback = Callback()
+    trainer = Trainer(logger=False, enable_checkpointing=False, enable_progress_bar=False, enable_model_summary=False)
+    trainer.callbacks = [overriding_callback, no_op_callback]
+
+    overriding_callbacks, profiled_callbacks = trainer._get_callback_hooks("on_train_batch_start")
+    assert overriding_callbacks == [overriding_callback]
+    assert profiled_callbacks == [
+        (overriding_callback, f"[Callback]{overriding_callback.state_key}.on_train_batch_start"),
+        (no_op_callback, f"[Callback]{no_op_callback.state_key}.on_train_batch_start"),
+    ]
+
+    mock_callback = Mock(spec=Callback)
+    trainer.callbacks.append(mock_callback)
+    trainer._call_callback_hooks("on_train_batch_start", None, 1)
+    assert overriding_callback.batch_idx == 1
+    mock_callback.on_train_batch_start.assert_called_once_with(trainer, None, None, 1)
+
+    with mock.patch.object(trainer, "profiler") as profiler_mock:
+        trainer._call_callback_hooks("on_train_batch_start", None, 2)
+    assert [c.args[0] for c in profiler_mock.profile.call_args_list] == [
+        f"[Callback]{overriding_callback.state_key}.on_train_batch_start",
+        f"[Callback]{no_op_callback.state_key}.on_train_batch_start",
+        f"[Callback]{mock_callback.state_key}.on_train_batch_start",
+    ]
+    assert overriding_callback.batch_idx == 2
@@ -34,6 +34,7 @@ from pytorch_lightning.trainer.connectors.logger_connector.result import (
     _ResultMetric,
     _Sync,
 )
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.core.test_results import spawn_launch
 from tests_pytorch.helpers.runif import RunIf
 from tests_pytorch.helpers.utils import no_warning_call
@@ -99,6 +100,50 @@ def test_result_reduce_ddp():
     spawn_launch(result_reduce_ddp_fn, [torch.device("cuda:0"), torch.device("cuda:1")])
 
 
+def result_collection_bucketed_sync_fn(strategy):
+    rank = strategy.global_rank
+    world_size = strategy.world_size
+    reduce_calls = []
+
+    def reduce(tensor, *args, **kwargs):
+        reduce_calls.append(tensor.numel())
+        return strategy.reduce(tensor, *args, **kwargs)
+
+    result = _ResultCollection(True, torch.device("cpu"))
+    for i in range(10):
+        kwargs = dict(on_step=False, on_epoch=True, sync_dist=True, sync_dist_fn=reduce)
+        result.log("training_step", f"mean_{i}", torch.tensor(float(rank + i)), batch_size=rank + 1, **kwargs)
+        result.log("training_step", f"sum_{i}", torch.tensor(float(rank + i)), reduce_fx="sum", **kwargs)
+        result.log("training_step", f"max_{i}", torch.tensor(float(rank + i)), reduce_fx="max", **kwargs)
+        result.log("training_step", f"dict_{i}", {"a": torch.tensor(float(rank + i))}, reduce_fx="sum", **kwargs)
+
+    epoch_log = result.metrics(False)["log"]
+
+    # one collective per bucket: the values and the batch sizes of the means, the sums and the maxima
+    assert reduce_calls == [10, 10, 20, 10]
+    ranks = range(world_size)
+    for i in range(10):
+        expected_mean = sum((r + i) * (r + 1) for r in ranks) / sum(r + 1 for r in ranks)
+        assert torch.allclose(epoch_log[f"mean_{i}"], torch.tensor(expected_mean))
+        assert epoch_log[f"sum_{i}"] == sum(r + i for r in ranks)
+        assert epoch_log[f"max_{i}"] == world_size - 1 + i
+        assert epoch_log[f"dict_{i}"] == {"a": sum(r + i for r in ranks)}
+
+    # the computed values are cached until the next reset
+    result.metrics(False)
+    assert len(reduce_calls) == 4
+    result.reset()
+    result.log("training_step", "mean_0", torch.tensor(1.0), batch_size=1, **kwargs)
+    result.metrics(False)
+    # `valid_items` skips the reset metrics, but not the collections of metrics: the dictionaries are still synced
+    assert reduce_calls[4:] == [1, 1, 10]
+
+
+@RunIf(skip_windows=True)
+def test_result_collection_bucketed_sync():
+    spawn_launch(result_collection_bucketed_sync_fn, [torch.device("cpu")] * 2)
+
+
 def test_result_metric_integration():
     metric_a = DummyMetric()
     metric_b = DummyMetric()
@@ -679,3 +724,49 @@ def test_logger_sync_dist(distributed_env, log_val):
         with warning_ctx(PossibleUserWarning, match=r"recommended to use `self.log\('bar', ..., sync_dist=True\)`"):
             value = _ResultCollection._get_cache(result_metric, on_step=False)
         assert value == 0.5
+
+
+def test_result_collection_log_reuses_metadata():
+    result = _ResultCollection(True, torch.device("cpu"))
+    result.log("training_step", "a", torch.tensor(1.0), on_step=True, on_epoch=True)
+    result.log("training_step", "b", {"c": torch.tensor(1.0)}, on_step=True, on_epoch=True)
+
+    with mock.patch(
+        "pytorch_lightning.trainer.connectors.logger_connector.result._Metadata", wraps=_Metadata
+    ) as metadata_mock:
+        # the calls with the same arguments don't create a new metadata
+        result.log("training_step", "a", torch.tensor(3.0), on_step=True, on_epoch=True)
+        result.log("training_step", "b", {"c": torch.tensor(3.0)}, on_step=True, on_epoch=True)
+        metadata_mock.assert_not_called()
+
+        # the calls with different arguments are still checked
+        with pytest.raises(MisconfigurationException, match="twice in `training_step` with different arguments"):
+            result.log("training_step", "a", torch.tensor(1.0), on_step=True, on_epoch=True, prog_bar=True)
+        # the same metadata from different arguments is accepted
+        result.log("training_step", "a", torch.tensor(2.0), on_step=True, on_epoch=True, reduce_fx="mean")
+        assert metadata_mock.call_count == 2
+
+    assert result["training_step.a"].value == 6
+    assert result["training_step.a"].cumulated_batch_size == 3
+    assert result["training_step.b"]["c"].value == 4
+
+    # the arguments of the calls aren't saved along with the collection
+    state_dict = result.state_dict()
+    assert "_logged_metadata" not in state_dict
+    result.load_state_dict(state_dict)
+    result.log("training_step", "a", torch.tensor(2.0), on_step=True, on_epoch=True)
+    assert result["training_step.a"].value == 8
+
+
+def test_result_collection_log_dataloader_idx():
+    """The metadata of a key logged from another dataloader with ``add_dataloader_idx=False`` is still checked."""
+    result = _ResultCollection(False, torch.device("cpu"))
+    result.dataloader_idx = 0
+    result.log("validation_step", "a", torch.tensor(1.0), on_epoch=True, add_dataloader_idx=False)
+    result.log("validation_step", "a", torch.tensor(2.0), on_epoch=True, add_dataloader_idx=False)
+    assert result["validation_step.a"].value == 3
+
+    result.dataloader_idx = 1
+    with pytest.raises(MisconfigurationException, match="twice in `validation_step` with different arguments"):
+        result.log("validation_step", "a", torch.tensor(4.0), on_epoch=True, add_dataloader_idx=False)
+    assert result["validation_step.a"].value == 3
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
@@ -128,3 +129,28 @@ def test_flush_n_steps(tmpdir):
     logger.save.assert_not_called()
     logger.log_metrics(metrics, step=1)
     logger.save.assert_called_once()
+
+
+def test_metrics_file_appended(tmpdir):
+    """Verify that the rows are appended to the metrics file and that new keys add columns to the rows saved
+    before."""
+    logger = CSVLogger(tmpdir)
+    logger.log_metrics({"a": 1}, step=0)
+    logger.log_metrics({"a": 2, "b": 3}, step=1)
+    logger.save()
+    # the saved rows aren't kept in memory
+    assert logger.experiment.metrics == []
+
+    logger.log_metrics({"a": 4}, step=2)
+    with mock.patch.object(logger.experiment, "_rewrite_with_new_keys", wraps=logger.experiment._rewrite_with_new_keys):
+        logger.save()
+        logger.experiment._rewrite_with_new_keys.assert_not_called()
+
+        logger.log_metrics({"c": 5}, step=3)
+        logger.save()
+        logger.experiment._rewrite_with_new_keys.assert_called_once()
+
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    with open(path_csv) as fp:
+        lines = fp.read().splitlines()
+    assert lines == ["a,step,b,c", "1,0,,", "2,1,3,", "4,2,,", ",3,,5"]
@@ -25,6 +25,7 @@ from pytorch_lightning.demos.boring_classes import BoringModel, RandomDataset
 from pytorch_lightning.loggers import CSVLogger
 from pytorch_lightning.trainer import Trainer
 from pytorch_lightning.trainer.connectors.logger_connector.fx_validator import _FxValidator
+from pytorch_lightning.trainer.connectors.logger_connector.logger_connector import _HostMetrics
 from pytorch_lightning.trainer.connectors.logger_connector.result import _ResultCollection
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.helpers.runif import RunIf
@@ -676,3 +677,64 @@ def test_result_collection_no_batch_size_extraction():
     assert results["training_step.epoch_log_val"].value == log_val * batch_size
     assert results["training_step.epoch_log_val"].cumulated_batch_size == batch_size
     assert results["training_step.epoch_sum_log_val"].value == log_val
+
+
+@pytest.mark.parametrize("accelerator", ["cpu", pytest.param("cuda", marks=RunIf(min_cuda_gpus=1))])
+def test_step_metrics_logged_without_blocking(accelerator):
+    trainer = Trainer(accelerator=accelerator, devices=1, logger=False)
+    logger = mock.Mock()
+    trainer.loggers = [logger]
+    connector = trainer._logger_connector
+    device = trainer.strategy.root_device
+
+    connector._log_step_metrics({"a": torch.tensor(1.0, device=device)}, step=0)
+    connector._log_step_metrics({"a": torch.tensor(2.0, device=device)}, step=1)
+    expected = [mock.call(metrics={"a": 1.0}, step=0)]
+    if accelerator == "cpu":
+        # the values are already on the host
+        expected.append(mock.call(metrics={"a": 2.0}, step=1))
+    assert logger.log_metrics.call_args_list == expected
+
+    # the values still being copied are passed on flush
+    connector.flush_metrics()
+    assert logger.log_metrics.call_args_list == [
+        mock.call(metrics={"a": 1.0}, step=0),
+        mock.call(metrics={"a": 2.0}, step=1),
+    ]
+
+    connector._update_progress_bar_metrics({"b": torch.tensor(3.0, device=device)})
+    connector._flush_progress_bar_metrics()
+    assert connector._progress_bar_metrics == {"b": 3.0}
+
+
+def test_final_step_metrics_flushed():
+    """Test the progress bar shows the last copied values while a copy is pending, and the metrics of the final step
+    reach the loggers and the progress bar after ``flush_metrics``."""
+    trainer = Trainer(logger=False)
+    logger = mock.Mock()
+    trainer.loggers = [logger]
+    connector = trainer._logger_connector
+
+    # pretend the copies to the host aren't done
+    with mock.patch.object(
+        _HostMetrics, "is_async", new_callable=mock.PropertyMock, return_value=True
+    ), mock.patch.object(_HostMetrics, "ready", return_value=False) as ready:
+        connector._update_progress_bar_metrics({"a": torch.tensor(1.0)})
+        connector._update_progress_bar_metrics({"a": torch.tensor(2.0)})
+        assert connector._progress_bar_metrics == {}
+
+        # once the first copy is done, its values are shown and the newer ones are copied in turn
+        ready.return_value = True
+        connector._update_progress_bar_metrics({"a": torch.tensor(3.0)})
+        assert connector._progress_bar_metrics == {"a": 1.0}
+        ready.return_value = False
+
+        # the final step logs a new key
+        connector._update_progress_bar_metrics({"b": torch.tensor(4.0)})
+        connector._log_step_metrics({"b": torch.tensor(4.0)}, step=3)
+        assert connector._progress_bar_metrics == {"a": 1.0}
+        logger.log_metrics.assert_not_called()
+
+    connector.flush_metrics()
+    logger.log_metrics.assert_called_once_with(metrics={"b": 4.0}, step=3)
+    assert connector._progress_bar_metrics == {"a": 3.0, "b": 4.0}